@@ -0,0 +1,5 @@
+"""
+benchmarks package
+
+
+"""
@@ -0,0 +1,40 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_basing module
+
+Baser KEL cloning used for replay, export and clean
+"""
+from keri.kering import Vrsn_1_0
+from keri.core import Kevery, Parser
+
+from benchmarks import generating
+
+
+def bench_clone_pre_iter(bench, baser, scale):
+    """Baser.clonePreIter of whole KEL with attachments"""
+    events = generating.kelEvents(scale(256))
+    db = baser()
+    Parser(kvy=Kevery(db=db, lax=False, local=False), version=Vrsn_1_0).parse(
+        ims=generating.stream(events))
+    pre = events[0][0].pre
+
+    def run():
+        assert sum(1 for _ in db.clonePreIter(pre=pre)) == len(events)
+
+    bench(run, ops=len(events))
+
+
+def bench_clone_evt_msg(bench, baser, scale):
+    """Baser.cloneEvtMsg of each KEL event by first seen ordinal"""
+    events = generating.kelEvents(scale(256))
+    db = baser()
+    Parser(kvy=Kevery(db=db, lax=False, local=False), version=Vrsn_1_0).parse(
+        ims=generating.stream(events))
+    pre = events[0][0].pre
+    fels = [(fn, dig) for _, fn, dig in db.fels.getAllItemIter(keys=pre, on=0)]
+
+    def run():
+        for fn, dig in fels:
+            db.cloneEvtMsg(pre=pre, fn=fn, dig=dig)
+
+    bench(run, ops=len(fels))
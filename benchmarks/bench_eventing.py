@@ -0,0 +1,65 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_eventing module
+
+Kevery event processing, threshold satisfaction and escrow sweeps
+"""
+from keri.core import Kevery, Tholder
+
+from benchmarks import generating
+
+
+def bench_process_event(bench, baser, scale):
+    """Kevery.processEvent of parsed events without parsing overhead"""
+    events = generating.kelEvents(scale(256))
+
+    def setup():
+        return (Kevery(db=baser(), lax=False, local=False), )
+
+    def run(kvy):
+        for serder, sigers in events:
+            kvy.processEvent(serder=serder, sigers=sigers)
+        assert kvy.kevers[events[0][0].pre].sn == len(events) - 1
+
+    bench(run, ops=len(events), setup=setup)
+
+
+def bench_tholder_satisfy(bench, scale):
+    """Tholder.satisfy of numeric and fractionally weighted thresholds"""
+    count = scale(10000)
+    numeric = Tholder(sith="5")
+    weighted = Tholder(sith=[["1/2", "1/2", "1/4", "1/4", "1/4"],
+                             ["1/3", "1/3", "1/3"]])
+    indices = list(range(8))
+
+    def run():
+        for _ in range(count):
+            assert numeric.satisfy(indices)
+            assert weighted.satisfy(indices)
+
+    bench(run, ops=count * 2)
+
+
+def bench_escrow_sweep(bench, baser, scale):
+    """Kevery.processEscrows of out of order escrow of a KEL missing inception"""
+    events = generating.kelEvents(scale(128))
+
+    def setup():
+        kvy = Kevery(db=baser(), lax=False, local=False)
+        for serder, sigers in events[1:]:
+            try:
+                kvy.processEvent(serder=serder, sigers=sigers)
+            except Exception:  # out of order so escrowed
+                pass
+        serder, sigers = events[0]
+        kvy.processEvent(serder=serder, sigers=sigers)
+        return (kvy, )
+
+    def run(kvy):
+        for _ in range(len(events)):  # bounded repeated sweeps
+            if kvy.kevers[events[0][0].pre].sn == len(events) - 1:
+                break
+            kvy.processEscrows()
+        assert kvy.kevers[events[0][0].pre].sn == len(events) - 1
+
+    bench(run, ops=len(events) - 1, setup=setup)
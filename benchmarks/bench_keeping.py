@@ -0,0 +1,40 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_keeping module
+
+Manager.sign with encrypted keystore with and without signer cache
+"""
+from keri.app import Manager, SignerCache, openKS
+from keri.core import Salter, Signer, MtrDex
+
+from benchmarks import generating
+
+# fixed keystore encryption key pair
+CryptSigner = Signer(raw=b'h,#|\x8ap"\x12\xc43t2\xa6\xe1\x18\x19\xf0f2,y\xc4\xc21@\xf5@\x15.\xa2\x1a\xcf',
+                     code=MtrDex.Ed25519_Seed, transferable=False)
+
+
+def signs(bench, scale, cache):
+    count = scale(256)
+    salt = Salter(raw=generating.Salt).qb64
+    ser = bytes(generating.kelEvents(1)[0][0].raw)
+    with openKS(name="bench") as keeper:
+        manager = Manager(ks=keeper, seed=CryptSigner.qb64, salt=salt,
+                          aeid=CryptSigner.verfer.qb64, cache=cache)
+        verfers, _ = manager.incept(icount=3, salt=salt, temp=True)
+
+        def run():
+            for _ in range(count):
+                manager.sign(ser=ser, verfers=verfers)
+
+        bench(run, ops=count * len(verfers))
+
+
+def bench_manager_sign(bench, scale):
+    """Manager.sign decrypting private keys on every signing"""
+    signs(bench, scale, cache=None)
+
+
+def bench_manager_sign_cached(bench, scale):
+    """Manager.sign with decrypted signers cached"""
+    signs(bench, scale, cache=SignerCache())
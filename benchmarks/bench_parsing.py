@@ -0,0 +1,88 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_parsing module
+
+Parser throughput of KEL, receipt and out of order streams into Kevery
+"""
+from keri.kering import Vrsn_1_0
+from keri.core import Kevery, Parser
+
+from benchmarks import generating
+
+
+def bench_parse_kel(bench, baser, scale):
+    """Parse a KEL stream of single key events into a fresh Kevery"""
+    events = generating.kelEvents(scale(256))
+    msgs = generating.stream(events)
+
+    def setup():
+        return (bytearray(msgs), Kevery(db=baser(), lax=False, local=False))
+
+    def run(ims, kvy):
+        Parser(kvy=kvy, version=Vrsn_1_0).parse(ims=ims)
+        assert kvy.kevers[events[0][0].pre].sn == len(events) - 1
+
+    bench(run, ops=len(events), setup=setup)
+
+
+def bench_parse_kel_batch(bench, baser, scale):
+    """Parse a KEL stream with signatures verified in batches"""
+    events = generating.kelEvents(scale(256))
+    msgs = generating.stream(events)
+
+    def setup():
+        return (bytearray(msgs), Kevery(db=baser(), lax=False, local=False))
+
+    def run(ims, kvy):
+        Parser(kvy=kvy, version=Vrsn_1_0, batch=64).parse(ims=ims)
+        assert kvy.kevers[events[0][0].pre].sn == len(events) - 1
+
+    bench(run, ops=len(events), setup=setup)
+
+
+def bench_parse_multisig(bench, baser, scale):
+    """Parse a KEL stream of weighted 5 key multisig events"""
+    events = generating.kelEvents(scale(128), size=5, weighted=True)
+    msgs = generating.stream(events)
+
+    def setup():
+        return (bytearray(msgs), Kevery(db=baser(), lax=False, local=False))
+
+    def run(ims, kvy):
+        Parser(kvy=kvy, version=Vrsn_1_0).parse(ims=ims)
+        assert kvy.kevers[events[0][0].pre].sn == len(events) - 1
+
+    bench(run, ops=len(events), setup=setup)
+
+
+def bench_parse_receipt_flood(bench, baser, scale):
+    """Parse nontransferable receipts from 7 receiptors of every KEL event"""
+    events = generating.kelEvents(scale(64))
+    msgs = generating.stream(events)
+    rcts = generating.receiptFlood(events, count=7)
+
+    def setup():
+        kvy = Kevery(db=baser(), lax=False, local=False)
+        Parser(kvy=kvy, version=Vrsn_1_0).parse(ims=bytearray(msgs))
+        return (bytearray(rcts), kvy)
+
+    def run(ims, kvy):
+        Parser(kvy=kvy, version=Vrsn_1_0).parse(ims=ims)
+
+    bench(run, ops=len(events) * 7, setup=setup)
+
+
+def bench_parse_out_of_order(bench, baser, scale):
+    """Parse a shuffled KEL stream then sweep escrows until all are accepted"""
+    events = generating.kelEvents(scale(128))
+    msgs = generating.stream(generating.shuffled(events))
+
+    def setup():
+        return (bytearray(msgs), Kevery(db=baser(), lax=False, local=False))
+
+    def run(ims, kvy):
+        Parser(kvy=kvy, version=Vrsn_1_0).parse(ims=ims)
+        kvy.processEscrows()
+        assert kvy.kevers[events[0][0].pre].sn == len(events) - 1
+
+    bench(run, ops=len(events), setup=setup)
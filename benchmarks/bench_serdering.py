@@ -0,0 +1,33 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_serdering module
+
+SerderKERI make (sad) and inhale (raw)
+"""
+from keri.core import SerderKERI
+
+from benchmarks import generating
+
+
+def bench_serder_make(bench, scale):
+    """SerderKERI makify from sad of KEL events"""
+    events = generating.kelEvents(scale(512))
+    sads = [dict(serder.sad) for serder, _ in events]
+
+    def run():
+        for sad in sads:
+            SerderKERI(sad=sad, makify=True)
+
+    bench(run, ops=len(sads))
+
+
+def bench_serder_inhale(bench, scale):
+    """SerderKERI inhale from raw of KEL events"""
+    events = generating.kelEvents(scale(512))
+    raws = [bytes(serder.raw) for serder, _ in events]
+
+    def run():
+        for raw in raws:
+            SerderKERI(raw=raw)
+
+    bench(run, ops=len(raws))
@@ -0,0 +1,29 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.bench_verifying module
+
+Reger.cloneCreds of chained ACDCs
+"""
+from keri.app import openHab
+from keri.core import Diger
+from keri.vdr import Regery, Verifier
+
+from benchmarks import generating
+
+
+def bench_clone_creds(bench, scale):
+    """Reger.cloneCreds of the last credential of a chain which clones all"""
+    with openHab(name="bench", temp=True, salt=generating.Salt) as (hby, hab):
+        regery = Regery(hby=hby, name="bench", temp=True)
+        verifier = Verifier(hby=hby, reger=regery.reger)
+        creders = generating.acdcChain(hab, regery, verifier, count=scale(16))
+        saids = [Diger(qb64=creders[-1].said)]
+
+        def run():
+            creds = regery.reger.cloneCreds(saids=saids, db=hby.db)
+            assert len(creds) == 1
+
+        try:
+            bench(run, ops=len(creders))
+        finally:
+            regery.close()
@@ -0,0 +1,165 @@
+"""
+Configure PyTest for the benchmark suite
+
+Run with:
+    pytest benchmarks
+
+Each benchmark uses the ``bench`` fixture to time a callable over several
+rounds with ``time.perf_counter`` and to measure its peak traced memory with
+``tracemalloc``. Results are printed as a table in the terminal summary and
+optionally written as JSON with ``--bench-json PATH`` so that runs can be
+compared across commits.
+
+Environment:
+    KERI_BENCH_SCALE (float): multiplier applied to fixture sizes, default 1.0
+    KERI_BENCH_ROUNDS (int): timed rounds per benchmark, default 5
+"""
+import gc
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+
+import pytest
+
+import keri
+from keri.db import basing
+
+Scale = float(os.environ.get("KERI_BENCH_SCALE", "1.0"))
+Rounds = int(os.environ.get("KERI_BENCH_ROUNDS", "5"))
+
+Results = []  # list of BenchResult for terminal summary and json report
+
+
+@dataclass
+class BenchResult:
+    """
+    Timing and memory result of one benchmark
+    """
+    name: str  # benchmark node name
+    ops: int  # operations (events, messages, signatures) per round
+    rounds: int  # number of timed rounds
+    best: float  # fastest round seconds
+    median: float  # median round seconds
+    peak: int  # peak traced memory bytes of one extra round
+
+    @property
+    def rate(self):
+        """Operations per second of median round"""
+        return self.ops / self.median if self.median else 0.0
+
+
+class Bench:
+    """
+    Callable that times fn over rounds and records a BenchResult.
+
+    Usage:
+        result = bench(fn, ops=len(events), setup=makeArgs)
+
+    Where setup, when provided, is called before every round outside the
+    timed region and its return value (tuple) is passed as args to fn. Use
+    setup to provide fresh databases so stateful operations such as event
+    processing are measured from the same starting state each round.
+    """
+
+    def __init__(self, name, rounds=Rounds):
+        self.name = name
+        self.rounds = rounds
+        self.result = None
+
+    def __call__(self, fn, *, ops, setup=None, rounds=None):
+        rounds = rounds if rounds is not None else self.rounds
+        times = []
+        for _ in range(rounds):
+            args = setup() if setup is not None else ()
+            gc.collect()
+            start = time.perf_counter()
+            fn(*args)
+            times.append(time.perf_counter() - start)
+
+        # memory is measured on a separate round since tracing distorts timing
+        args = setup() if setup is not None else ()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.result = BenchResult(name=self.name, ops=ops, rounds=rounds,
+                                  best=min(times),
+                                  median=statistics.median(times),
+                                  peak=peak)
+        Results.append(self.result)
+        return self.result
+
+
+@pytest.fixture()
+def bench(request):
+    """
+    Returns Bench instance named after the requesting benchmark
+    """
+    return Bench(name=request.node.name)
+
+
+@pytest.fixture()
+def baser():
+    """
+    Returns callable that opens a fresh temporary Baser. All the opened
+    databases are closed and cleared when the benchmark completes.
+    """
+    dbs = []
+
+    def opener():
+        db = basing.Baser(name=f"bench{len(dbs)}", temp=True, reopen=True)
+        dbs.append(db)
+        return db
+
+    yield opener
+
+    for db in dbs:
+        db.close(clear=True)
+
+
+@pytest.fixture(scope="session")
+def scale():
+    """
+    Returns callable that scales a base fixture size by KERI_BENCH_SCALE
+    """
+    def scaled(size):
+        return max(1, int(size * Scale))
+
+    return scaled
+
+
+def pytest_addoption(parser):
+    parser.addoption("--bench-json", action="store", default=None,
+                     help="path of json file to write benchmark results")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not Results:
+        return
+
+    terminalreporter.section("keri benchmarks")
+    terminalreporter.write_line(f"{'name':<48} {'ops':>8} {'median s':>10} "
+                                f"{'best s':>10} {'ops/s':>12} {'peak KiB':>10}")
+    for result in Results:
+        terminalreporter.write_line(f"{result.name:<48} {result.ops:>8} "
+                                    f"{result.median:>10.4f} {result.best:>10.4f} "
+                                    f"{result.rate:>12.1f} {result.peak / 1024:>10.1f}")
+
+    if path := config.getoption("--bench-json"):
+        report = dict(keri=keri.__version__,
+                      python=platform.python_version(),
+                      machine=platform.machine(),
+                      scale=Scale,
+                      results=[dict(asdict(result), rate=result.rate)
+                               for result in Results])
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        terminalreporter.write_line(f"wrote {path}")
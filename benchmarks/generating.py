@@ -0,0 +1,175 @@
+# -*- encoding: utf-8 -*-
+"""
+benchmarks.generating module
+
+Deterministic generators of benchmark fixtures. All keys derive from fixed
+salts so that every run, on every machine, processes byte identical streams.
+"""
+import random
+
+from keri.core import (Salter, Diger, Saider, Seqner, MtrDex, Saids, SealEvent,
+                       Schemer, incept, rotate, interact, receipt, messagize)
+from keri.vc import credential
+
+Salt = b'0123456789abcdef'  # fixed salt of controller keys
+WitSalt = b'fedcba9876543210'  # fixed salt of nontransferable receiptor keys
+Seed = 0x6b657269  # fixed seed of shuffled streams
+Dt = "2024-01-01T00:00:00.000000+00:00"  # fixed datetime of credential subjects
+RotateEvery = 16  # sn interval of rotation events in generated KELs
+
+# Optional Issuee schema from tests.conftest.DbSeed, reproduced here so the
+# suite runs standalone
+OptionalIssueeSchema = {
+    '$id': '',
+    '$schema': 'http://json-schema.org/draft-07/schema#',
+    'title': 'Optional Issuee',
+    'description': 'A credential with an optional issuee',
+    'credentialType': 'UntargetedAttestation',
+    'properties': {'v': {'type': 'string'},
+                   'd': {'type': 'string'},
+                   'i': {'type': 'string'},
+                   'ri': {'description': 'credential status registry', 'type': 'string'},
+                   's': {'description': 'schema SAID', 'type': 'string'},
+                   'a': {'properties': {'d': {'type': 'string'},
+                                        'i': {'type': 'string'},
+                                        'dt': {'format': 'date-time', 'type': 'string'},
+                                        'claim': {'type': 'string'}},
+                         'additionalProperties': False,
+                         'required': ['dt', 'claim'],
+                         'type': 'object'},
+                   'e': {'description': 'edges block', 'type': 'object'},
+                   'r': {'type': 'object', 'description': 'rules block'}},
+    'additionalProperties': False,
+    'required': ['i', 'ri', 's', 'd', 'e', 'r'],
+    'type': 'object'}
+
+
+def kelEvents(count, *, size=1, weighted=False, salt=Salt):
+    """
+    Returns list of (serder, sigers) duples of a KEL of count events where
+    every RotateEvery sn is a rotation and all other events are interactions.
+
+    Parameters:
+        count (int): number of events including inception
+        size (int): number of signing keys per establishment event
+        weighted (bool): True means fractionally weighted threshold of "1/2"
+            per key. False means numeric majority threshold.
+        salt (bytes): raw salt of controller keys
+    """
+    ests = 1 + (count - 1) // RotateEvery
+    signers = Salter(raw=salt).signers(count=size * (ests + 1), path="kel",
+                                       temp=True)
+    groups = [signers[i * size:(i + 1) * size] for i in range(ests + 1)]
+    sith = ["1/2"] * size if weighted else f"{size // 2 + 1:x}"
+
+    def keys(group):
+        return [signer.verfer.qb64 for signer in group]
+
+    def ndigs(group):
+        return [Diger(ser=signer.verfer.qb64b).qb64 for signer in group]
+
+    def sign(serder, group):
+        return [signer.sign(serder.raw, index=i) for i, signer in enumerate(group)]
+
+    serder = incept(keys=keys(groups[0]), isith=sith, ndigs=ndigs(groups[1]),
+                    nsith=sith, code=MtrDex.Blake3_256)
+    pre = serder.pre
+    events = [(serder, sign(serder, groups[0]))]
+    est = 0
+    for sn in range(1, count):
+        if sn % RotateEvery == 0:
+            est += 1
+            serder = rotate(pre=pre, keys=keys(groups[est]), dig=serder.said,
+                            sn=sn, isith=sith, ndigs=ndigs(groups[est + 1]),
+                            nsith=sith)
+        else:
+            serder = interact(pre=pre, dig=serder.said, sn=sn)
+        events.append((serder, sign(serder, groups[est])))
+
+    return events
+
+
+def stream(events):
+    """
+    Returns bytearray message stream of (serder, sigers) events
+    """
+    msgs = bytearray()
+    for serder, sigers in events:
+        msgs.extend(messagize(serder, sigers=sigers))
+    return msgs
+
+
+def shuffled(events, seed=Seed):
+    """
+    Returns new list of events in deterministic random order so that most
+    arrive out of order and are escrowed
+    """
+    return random.Random(seed).sample(events, k=len(events))
+
+
+def receiptFlood(events, count, *, salt=WitSalt):
+    """
+    Returns bytearray stream of nontransferable receipts of every event in
+    events from each of count receiptors.
+    """
+    signers = Salter(raw=salt).signers(count=count, path="wit",
+                                       transferable=False, temp=True)
+    msgs = bytearray()
+    for serder, _ in events:
+        rct = receipt(pre=serder.pre, sn=serder.sn, said=serder.said)
+        cigars = [signer.sign(serder.raw) for signer in signers]
+        msgs.extend(messagize(rct, cigars=cigars))
+    return msgs
+
+
+def seedSchema(db):
+    """
+    Pins the Optional Issuee schema in db and returns its SAID
+    """
+    _, sad = Saider.saidify(sad=dict(OptionalIssueeSchema), label=Saids.dollar)
+    schemer = Schemer(sed=sad)
+    db.schema.pin(schemer.said, schemer)
+    return schemer.said
+
+
+def acdcChain(hab, regery, verifier, count):
+    """
+    Returns list of count creders issued by hab in a fresh registry, each one
+    chained by edge to the one before so cloning the last clones all.
+
+    Parameters:
+        hab (Hab): issuer of credentials
+        regery (Regery): credential registries of hab.db
+        verifier (Verifier): saves issued credentials to regery.reger
+        count (int): length of chain
+    """
+    schema = seedSchema(hab.db)
+
+    def anchor(regk, said):
+        hab.interact(data=[SealEvent(regk, "0", said)._asdict()])
+        seqner = Seqner(sn=hab.kever.sn)
+        diger = Diger(qb64=hab.kever.serder.said)
+        issuer.anchorMsg(pre=regk, regd=said, seqner=seqner, saider=diger)
+        regery.processEscrows()
+        return seqner, diger
+
+    issuer = regery.makeRegistry(prefix=hab.pre, name="bench")
+    anchor(issuer.regk, issuer.regd)
+
+    creders = []
+    for i in range(count):
+        _, data = Saider.saidify(sad=dict(d="", dt=Dt, claim=f"claim {i}"),
+                                 code=MtrDex.Blake3_256, label=Saids.d)
+        edges = {}
+        if creders:
+            _, edges = Saider.saidify(sad=dict(d="", prior=dict(n=creders[-1].said)),
+                                      code=MtrDex.Blake3_256, label=Saids.d)
+        creder = credential(issuer=hab.pre, schema=schema, data=data,
+                            status=issuer.regk, source=edges, rules={})
+        iss = issuer.issue(said=creder.said)
+        seqner, diger = anchor(iss.pre, iss.said)
+        verifier.processCredential(creder, prefixer=hab.kever.prefixer,
+                                   seqner=seqner, saider=diger)
+        creders.append(creder)
+
+    return creders
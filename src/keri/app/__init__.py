@@ -23,14 +23,15 @@ from .habbing import (openHby, openHab, Habery, Signator, HaberyDoer, SIGNER,
                       BaseHab, Hab, SignifyHab, SignifyGroupHab, GroupHab)
 from .httping import (SignatureValidationComponent, CesrRequest, CESR_CONTENT_TYPE,
                       parseCesrHttpRequest, createCESRRequest, streamCESRRequests,
-                      Clienter, CESR_DESTINATION_HEADER)
+                      Clienter, ClientPool, CESR_DESTINATION_HEADER)
 from .indirecting import (setupWitness, createHttpServer, WitnessStart,
                           Indirector, MailboxDirector, Poller, HttpEnd,
                           QryRpyMailboxIterable, MailboxIterable, ReceiptEnd,
                           QueryEnd)
 from .keeping import (PubLot, PreSit, PrePrm, PubSet, riKey, openKS, Keeper,
                       KeeperDoer, Creator, RandyCreator, SaltyCreator,
-                      Creatory, Initage, Manager, ManagerDoer, Algos)
+                      Creatory, Initage, SignerCache, Manager, ManagerDoer,
+                      Algos)
 from .notifying import notice, Notice, DicterSuber, Noter, Notifier
 from .oobiing import (OobiResource, OobiRequestHandler,
                       oobiRequestExn, Oobiery, Authenticator, Result)
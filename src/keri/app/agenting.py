@@ -7,14 +7,14 @@ keri.app.agenting module
 import random
 from urllib.parse import urlparse, urljoin
 
-from hio.base import doing
+from hio.base import doing, tyming
 from hio.core import http
 from hio.core.tcp import clienting
 from hio.help import decking, Hict, ogler
 
 from socket import gaierror
 
-from .httping import Clienter, streamCESRRequests, CESR_DESTINATION_HEADER
+from .httping import Clienter, ClientPool, streamCESRRequests, CESR_DESTINATION_HEADER
 
 from ..kering import (Schemes, Roles, Vrsn_1_0,
                       MissingEntryError, ConfigurationError,
@@ -31,7 +31,9 @@ class Receiptor(doing.DoDoer):
     subsequent retrieval of receipts for specific events based on queries.
     """
 
-    def __init__(self, hby, msgs=None, gets=None, cues=None):
+    Timeout = 30.0  # default seconds to wait for witness responses
+
+    def __init__(self, hby, msgs=None, gets=None, cues=None, timeout=None, quorum=True):
         """
         Initialize the Receiptor and create doers for processing and retrieving witness receipts.
 
@@ -42,13 +44,23 @@ class Receiptor(doing.DoDoer):
             gets (Deck): query messages of KEL events to retrieve receipts from witnesses for
                 Messages should have {"pre": <str>, "sn": <int>}
             cues (Deck): outgoing cues of successful messages; currently the messages placed here are not used
+            timeout (float): seconds to wait for witness responses in each of the receipt
+                gathering and propagation phases. Defaults to .Timeout
+            quorum (bool): True means return once the witness threshold toad is met
+                and gather and propagate the remaining receipts in the background
+                instead of waiting for every witness
         """
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.gets = gets if gets is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
-        self.clienter = Clienter()
-
-        doers = [self.clienter, doing.doify(self.witDo), doing.doify(self.gitDo)]
+        self.timeout = timeout if timeout is not None else self.Timeout
+        self.quorum = quorum
+        self.pool = ClientPool()
+        self.clienter = Clienter(pool=self.pool)
+        self.lates = []  # generators gathering late receipts in the background
+
+        doers = [self.pool, self.clienter, doing.doify(self.witDo), doing.doify(self.gitDo),
+                 doing.doify(self.lateDo)]
         self.hby = hby
 
         super(Receiptor, self).__init__(doers=doers)
@@ -60,6 +72,14 @@ class Receiptor(doing.DoDoer):
         the synchronous witness API, then propagate the receipts to each of the other witnesses.
         Delegates to .catchup to catch up any new witnesses to the current state of the KEL.
 
+        The event is sent to all witnesses at once and receipts are gathered as they arrive
+        so latency is that of the slowest witness rather than the sum over all witnesses.
+        Gathering stops once every witness responded, once toad receipts are in hand when
+        .quorum or when .timeout expires. Receipts are then propagated to all witnesses
+        that returned one at once, again waiting at most .timeout for their responses.
+        When stopped at quorum the receipts of the slower witnesses are still gathered
+        and propagated in the background by .late until .timeout expires.
+
         Parameters:
             pre (str): qualified base64 identifier to gather receipts for
             sn: (Optiona[int]): sequence number of event to gather receipts for, latest is used if not provided
@@ -89,28 +109,64 @@ class Receiptor(doing.DoDoer):
                 yield from self.catchup(ser.pre, wit)
 
         clients = dict()
-        doers = []
         for wit in wits:
             try:
-                client, clientDoer = httpClient(hab, wit)
+                client, _ = httpClient(hab, wit, pool=self.pool)
                 clients[wit] = client
-                doers.append(clientDoer)
-                self.extend([clientDoer])
             except (MissingEntryError, gaierror) as e:
                 logger.error(f"unable to create http client for witness {wit}: {e}")
 
-        # send to each witness and gather receipts
-        rcts = dict()
+        # send to all witnesses at once
         for wit, client in clients.items():
             headers = dict()
             if wit in auths:
                 headers["Authorization"] = auths[wit]
 
             streamCESRRequests(client=client, dest=wit, ims=bytearray(msg), path="/receipts", headers=headers)
-            while not client.responses:
-                yield self.tock
 
-            rep = client.respond()
+        # gather receipts as they arrive
+        toad = hab.kever.toader.num
+        rcts = dict()
+        pending = list(clients)
+        tymer = tyming.Tymer(tymth=self.tymth, duration=self.timeout)
+        while pending:
+            self.gather(hab, clients, pending, rcts)
+            if not pending:
+                break
+            if self.quorum and toad and len(rcts) >= toad:
+                logger.info(f"witness threshold {toad} met, gathering receipts from "
+                            f"witnesses {pending} in background")
+                break
+            if tymer.expired:
+                logger.error(f"timed out waiting for receipts from witnesses {pending}")
+                pending = []
+                break
+            yield self.tock
+
+        yield from self.propagate(hab, ser, clients, rcts, wits=list(rcts))
+
+        if pending:  # quorum met so keep gathering late receipts in background
+            self.lates.append(self.late(hab, ser, clients, rcts, pending, tymer))
+            return list(rcts)
+
+        for client in clients.values():
+            self.pool.release(client)
+
+        return rcts.keys()
+
+    @staticmethod
+    def gather(hab, clients, pending, rcts):
+        """Parses receipts from responses of pending witnesses and adds them to rcts
+
+        Parameters:
+            hab (Hab): environment of identifier being receipted
+            clients (dict): http clients keyed by witness AID
+            pending (list): witness AIDs still to respond. Responded are removed
+            rcts (dict): receipt signature attachments keyed by witness AID
+        """
+        for wit in [wit for wit in pending if clients[wit].responses]:
+            pending.remove(wit)
+            rep = clients[wit].respond()
             if rep.status == 200:
                 rct = bytearray(rep.body)
                 hab.psr.parseOne(bytearray(rct))
@@ -123,8 +179,19 @@ class Receiptor(doing.DoDoer):
             else:
                 print(f"invalid response {rep.status} from witnesses {wit}")
 
-        # send retrieved receipts to all other witnesses
-        for wit in rcts:
+    def propagate(self, hab, ser, clients, rcts, wits):
+        """Returns a generator sending to each witness in wits the receipts of all
+        other witnesses in rcts at once and waiting at most .timeout for responses
+
+        Parameters:
+            hab (Hab): environment of identifier being receipted
+            ser (SerderKERI): event being receipted
+            clients (dict): http clients keyed by witness AID
+            rcts (dict): receipt signature attachments keyed by witness AID
+            wits (list): witness AIDs to send receipts to
+        """
+        sents = dict()
+        for wit in wits:
             ewits = [w for w in rcts if w != wit] # get complement of all other witnesses
             wigers = [rcts[w] for w in ewits] # all other witness signatures
 
@@ -136,7 +203,7 @@ class Receiptor(doing.DoDoer):
                 msg.extend(schemes(self.hby.db, eids=ewits))
 
             rserder = eventing.receipt(pre=hab.pre,
-                                       sn=sn,
+                                       sn=ser.sn,
                                        said=ser.said)
             msg.extend(rserder.raw)
             msg.extend(Counter(Codens.NonTransReceiptCouples,
@@ -144,15 +211,44 @@ class Receiptor(doing.DoDoer):
             for wiger in wigers:
                 msg.extend(wiger)
 
-            client = clients[wit]
+            sents[wit] = streamCESRRequests(client=clients[wit], dest=wit, ims=bytearray(msg))
 
-            sent = streamCESRRequests(client=client, dest=wit, ims=bytearray(msg))
-            while len(client.responses) < sent:
-                yield self.tock
+        tymer = tyming.Tymer(tymth=self.tymth, duration=self.timeout)
+        while pending := [wit for wit, sent in sents.items() if len(clients[wit].responses) < sent]:
+            if tymer.expired:
+                logger.error(f"timed out propagating receipts to witnesses {pending}")
+                break
+            yield self.tock
 
-        self.remove(doers)
+        for wit in sents:  # propagation responses not used
+            clients[wit].responses.clear()
 
-        return rcts.keys()
+    def late(self, hab, ser, clients, rcts, pending, tymer):
+        """Returns a generator gathering receipts of witnesses still pending once
+        .receipt returned at quorum until they respond or tymer expires, then
+        propagating all receipts to every witness that returned one. Run by .lateDo
+
+        Parameters:
+            hab (Hab): environment of identifier being receipted
+            ser (SerderKERI): event being receipted
+            clients (dict): http clients keyed by witness AID
+            rcts (dict): receipt signature attachments keyed by witness AID
+            pending (list): witness AIDs still to respond
+            tymer (Tymer): receipt gathering timer
+        """
+        count = len(rcts)
+        while pending:
+            self.gather(hab, clients, pending, rcts)
+            if pending and tymer.expired:
+                logger.error(f"timed out waiting for late receipts from witnesses {pending}")
+                break
+            yield self.tock
+
+        if len(rcts) > count:  # late receipts so all witnesses need them
+            yield from self.propagate(hab, ser, clients, rcts, wits=list(rcts))
+
+        for client in clients.values():
+            self.pool.release(client)
 
     def get(self, pre, sn=None):
         """
@@ -212,15 +308,15 @@ class Receiptor(doing.DoDoer):
 
         hab = self.hby.habs[pre]
 
-        client, clientDoer = httpClient(hab, wit)
-        self.extend([clientDoer])
+        client, _ = httpClient(hab, wit, pool=self.pool)
 
         for fmsg in hab.db.clonePreIter(pre=pre):
             streamCESRRequests(client=client, dest=wit, ims=bytearray(fmsg))
             while not client.responses:
                 yield self.tock
+            client.respond()
 
-        self.remove([clientDoer])
+        self.pool.release(client)
 
     def witDo(self, tymth=None, tock=0.0, **kwa):
         """
@@ -282,6 +378,33 @@ class Receiptor(doing.DoDoer):
 
             yield self.tock
 
+    def lateDo(self, tymth=None, tock=0.0, **kwa):
+        """
+        A generator that advances the background generators in .lates that gather
+        and propagate late witness receipts once .receipt returned at quorum
+        Intended to be used with doify to create a generator Doer.
+
+        Returns:
+            a Hio generator function to be used as a Doer.
+        Parameters:
+            tymth (function): function returning cycle time for configuring this Doer's cycle time.
+            tock (float): cycle time for this Doer, default is 0.0 seconds.
+        Usage:
+            add result of doify on this method to doers list
+        """
+        self.wind(tymth)
+        self.tock = tock
+        _ = (yield self.tock)
+
+        while True:
+            for late in list(self.lates):
+                try:
+                    next(late)
+                except StopIteration:
+                    self.lates.remove(late)
+
+            yield self.tock
+
 
 class WitnessReceiptor(doing.DoDoer):
     """
@@ -313,8 +436,9 @@ class WitnessReceiptor(doing.DoDoer):
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
         self.auths = auths if auths is not None else dict()
+        self.pool = ClientPool()
 
-        super(WitnessReceiptor, self).__init__(doers=[doing.doify(self.receiptDo)], **kwa)
+        super(WitnessReceiptor, self).__init__(doers=[self.pool, doing.doify(self.receiptDo)], **kwa)
 
     def receiptDo(self, tymth=None, tock=0.0, **kwa):
         """
@@ -357,7 +481,7 @@ class WitnessReceiptor(doing.DoDoer):
                 witers = []
                 for wit in wits:
                     auth = self.auths[wit] if wit in self.auths else None
-                    witer = messenger(hab, wit, auth=auth)
+                    witer = messenger(hab, wit, auth=auth, pool=self.pool)
                     witers.append(witer)
                     self.extend([witer])
 
@@ -465,13 +589,17 @@ class WitnessInquisitor(doing.DoDoer):
             klas (class): Type of messenger to use to send messages; defaults to HTTPMessenger; currently unused
             msgs (decking.Deck): query message buffer to be sent to the target or a random witness
             sent (decking.Deck): buffer for sent messages to track sent queries
+            witers (list): http messengers of sent queries, removed once they are idle
+            pool (ClientPool): keep-alive HTTP clients shared by the messengers of all queries
         """
         self.hby = hby
         self.klas = klas if klas is not None else HTTPMessenger
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = decking.Deck()
+        self.witers = []
+        self.pool = ClientPool()
 
-        super(WitnessInquisitor, self).__init__(doers=[doing.doify(self.msgDo)], **kwa)
+        super(WitnessInquisitor, self).__init__(doers=[self.pool, doing.doify(self.msgDo)], **kwa)
 
     def msgDo(self, tymth=None, tock=1.0, **opts):
         """
@@ -492,6 +620,9 @@ class WitnessInquisitor(doing.DoDoer):
 
         while True:
             while not self.msgs:
+                if idles := [witer for witer in self.witers if witer.idle]:
+                    self.witers = [witer for witer in self.witers if not witer.idle]
+                    self.remove(idles)  # releases their clients back to the pool
                 yield self.tock
 
             evt = self.msgs.popleft()
@@ -532,12 +663,14 @@ class WitnessInquisitor(doing.DoDoer):
                     logger.error(f"must have location in endpoint to query for pre={pre}")
                     continue
 
-                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs)
+                witer = messengerFrom(hab=hab, pre=ctrl, urls=locs, pool=self.pool)
             else:
                 wit = random.choice(wits)
-                witer = messenger(hab, wit)
+                witer = messenger(hab, wit, pool=self.pool)
 
             self.extend([witer])
+            if isinstance(witer, HTTPMessenger):  # tcp messengers keep receiving replies
+                self.witers.append(witer)
 
             msg = hab.query(target, src=witer.wit, route=r, query=q)  # Query for remote pre Event
 
@@ -550,7 +683,7 @@ class WitnessInquisitor(doing.DoDoer):
             while not witer.sent:
                 yield self.tock
 
-            self.sent.append(witer.sent.popleft())
+            self.sent.append(witer.sent[0])
 
             yield self.tock
 
@@ -626,7 +759,8 @@ class WitnessPublisher(doing.DoDoer):
         self.posted = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
-        super(WitnessPublisher, self).__init__(doers=[doing.doify(self.sendDo)], **kwa)
+        self.pool = ClientPool()
+        super(WitnessPublisher, self).__init__(doers=[self.pool, doing.doify(self.sendDo)], **kwa)
 
     def sendDo(self, tymth=None, tock=0.0, **opts):
         """Doer loop that sends queued messages to each witness.
@@ -652,15 +786,14 @@ class WitnessPublisher(doing.DoDoer):
 
                 witers = []
                 for wit in wits:
-                    witer = messenger(hab, wit)
+                    witer = messenger(hab, wit, pool=self.pool)
                     witers.append(witer)
                     witer.msgs.append(bytearray(msg))  # make a copy so everyone munges their own
                     self.extend([witer])
 
                     _ = (yield self.tock)
 
-                while witers:
-                    witer = witers.pop()
+                for witer in witers:
                     while not witer.idle:
                         _ = (yield self.tock)
 
@@ -837,7 +970,7 @@ class TCPStreamMessenger(doing.DoDoer):
 class HTTPMessenger(doing.DoDoer):
     """Send CESR messages to a witness over HTTP and capture responses."""
 
-    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None, **kwa):
+    def __init__(self, hab, wit, url, msgs=None, sent=None, doers=None, auth=None, pool=None, **kwa):
         """Initialize HTTP messenger with queues and optional auth.
 
         Parameters:
@@ -847,9 +980,13 @@ class HTTPMessenger(doing.DoDoer):
             msgs (Deck | None): outbound message queue.
             sent (Deck | None): response queue.
             auth (str | None): optional 2FA auth codes for witnesses.
+            pool (ClientPool | None): pool to lease a keep-alive client from. The client is
+                released back to the pool when this messenger exits. When None the messenger
+                runs its own client.
         """
         self.hab = hab
         self.wit = wit
+        self.pool = pool
         self.posted = 0
         self.msgs = msgs if msgs is not None else decking.Deck()
         self.sent = sent if sent is not None else decking.Deck()
@@ -862,13 +999,21 @@ class HTTPMessenger(doing.DoDoer):
         if up.scheme != Schemes.http and up.scheme != Schemes.https:
             raise ValueError(f"invalid scheme {up.scheme} for HTTPMessenger")
 
-        self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
-        clientDoer = http.clienting.ClientDoer(client=self.client)
-
-        doers.extend([clientDoer])
+        if self.pool is not None:
+            self.client = self.pool.acquire(scheme=up.scheme, hostname=up.hostname, port=up.port, path="/")
+        else:
+            self.client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port)
+            clientDoer = http.clienting.ClientDoer(client=self.client)
+            doers.extend([clientDoer])
 
         super(HTTPMessenger, self).__init__(doers=doers, **kwa)
 
+    def exit(self, deeds=None):
+        """Exit doers and release pooled client once this messenger is done."""
+        super(HTTPMessenger, self).exit(deeds=deeds)
+        if deeds is None and self.pool is not None:
+            self.pool.release(self.client)
+
     def msgDo(self, tymth=None, tock=0.0, **kwa):
         """Doer loop that sends queued messages over HTTP."""
         self.wind(tymth)
@@ -986,22 +1131,23 @@ def mailbox(hab, cid):
     return mbx
 
 
-def messenger(hab, pre, auth=None):
+def messenger(hab, pre, auth=None, pool=None):
     """ Create a Messenger (tcp or http) based on available endpoints
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         auth (str): optional auth code to send with any request for messenger
+        pool (ClientPool): optional pool of keep-alive clients for http messengers
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     urls = hab.fetchUrls(eid=pre)
-    return messengerFrom(hab, pre, urls, auth)
+    return messengerFrom(hab, pre, urls, auth, pool=pool)
 
 
-def messengerFrom(hab, pre, urls, auth=None):
+def messengerFrom(hab, pre, urls, auth=None, pool=None):
     """ Create a Witnesser (tcp or http) based on provided endpoints
 
     Parameters:
@@ -1009,13 +1155,14 @@ def messengerFrom(hab, pre, urls, auth=None):
         pre (str): qb64 identifier prefix of recipient to create a messanger for
         urls (dict): map of schemes to urls of available endpoints
         auth (str): optional auth code to send with any request for messenger
+        pool (ClientPool): optional pool of keep-alive clients for http messengers
 
     Returns:
         Optional(TcpWitnesser, HTTPMessenger): witnesser for ensuring full reciepts
     """
     if Schemes.http in urls or Schemes.https in urls:
         url = urls[Schemes.https] if Schemes.https in urls else urls[Schemes.http]
-        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth)
+        witer = HTTPMessenger(hab=hab, wit=pre, url=url, auth=auth, pool=pool)
     elif Schemes.tcp in urls:
         url = urls[Schemes.tcp]
         witer = TCPMessenger(hab=hab, wit=pre, url=url)
@@ -1050,16 +1197,19 @@ def streamMessengerFrom(hab, pre, urls, msg, headers=None):
     return witer
 
 
-def httpClient(hab, wit):
+def httpClient(hab, wit, pool=None):
     """ Create and return a http.client and http.ClientDoer for the witness
 
     Parameters:
         hab (Habitat): Environment to use to look up witness URLs
         wit (str): qb64 identifier prefix of witness for which to create a client
+        pool (ClientPool): optional pool to lease the client from instead of creating one.
+            The pool runs the client so no ClientDoer is returned, release the client
+            back to the pool when done
 
     Returns:
         Client: Http client for connecting to remote identifier
-        ClientDoer: Doer for client
+        ClientDoer: Doer for client or None when leased from pool
 
     """
     urls = hab.fetchUrls(eid=wit, scheme=Schemes.https) or hab.fetchUrls(eid=wit, scheme=Schemes.http)
@@ -1068,6 +1218,9 @@ def httpClient(hab, wit):
 
     url = urls[Schemes.https] if Schemes.https in urls else urls[Schemes.http]
     up = urlparse(url)
+    if pool is not None:
+        return pool.acquire(scheme=up.scheme, hostname=up.hostname, port=up.port, path=up.path), None
+
     client = http.clienting.Client(scheme=up.scheme, hostname=up.hostname, port=up.port, path=up.path)
     clientDoer = http.clienting.ClientDoer(client=client)
 
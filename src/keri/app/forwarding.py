@@ -15,6 +15,7 @@ from hio.help import decking, ogler
 from ..kering import (Roles, Vrsn_1_0, Kinds,
                       ConfigurationError, ValidationError)
 from .agenting import messengerFrom, streamMessengerFrom
+from .httping import ClientPool
 from ..core import (Bexter, Prefixer, Verfer, Texter, Diger,
                     Sadder, Counter, SerderKERI,
                     MtrDex, Codens, NonTransDex)
@@ -38,8 +39,9 @@ class Poster(doing.DoDoer):
         self.mbx = mbx
         self.evts = evts if evts is not None else decking.Deck()
         self.cues = cues if cues is not None else decking.Deck()
+        self.pool = ClientPool()
 
-        doers = [doing.doify(self.deliverDo)]
+        doers = [self.pool, doing.doify(self.deliverDo)]
         super(Poster, self).__init__(doers=doers, **kwa)
 
     def deliverDo(self, tymth=None, tock=0.0, **kwa):
@@ -157,7 +159,7 @@ class Poster(doing.DoDoer):
 
     def sendDirect(self, hab, ends, serder, atc):
         for ctrl, locs in ends.items():
-            witer = messengerFrom(hab=hab, pre=ctrl, urls=locs)
+            witer = messengerFrom(hab=hab, pre=ctrl, urls=locs, pool=self.pool)
 
             msg = bytearray(serder.raw)
             if atc is not None:
@@ -194,7 +196,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, pipelined=False)
 
         # Transpose the signatures to point to the new location
-        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox, pool=self.pool)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -204,6 +206,8 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        self.remove([witer])
+
     def forwardToWitness(self, hab, ends, recp, serder, atc, topic):
         # If we are one of the mailboxes, just store locally in mailbox
         owits = oset(ends.keys())
@@ -227,7 +231,7 @@ class Poster(doing.DoDoer):
         ims = hab.endorse(serder=fwd, last=False, pipelined=False)
 
         # Transpose the signatures to point to the new location
-        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox)
+        witer = messengerFrom(hab=hab, pre=mbx, urls=mailbox, pool=self.pool)
         msg.extend(ims)
         msg.extend(atc)
 
@@ -237,6 +241,8 @@ class Poster(doing.DoDoer):
         while not witer.idle:
             _ = (yield self.tock)
 
+        self.remove([witer])
+
 
 class StreamPoster:
     """
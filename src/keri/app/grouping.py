@@ -132,7 +132,7 @@ class Counselor(doing.DoDoer):
 
         """
         for (pre,), (number, diger) in self.hby.db.gpse.getTopItemIter():  # group partially signed escrow
-            sdig = self.hby.db.kels.getLast(keys=pre, on=number.sn)
+            sdig = self.hby.db.lastDig(pre=pre, sn=number.sn)
             if sdig:
                 sdig = sdig.encode("utf-8")
                 self.hby.db.gpse.rem(keys=(pre,))
@@ -532,7 +532,7 @@ def getEscrowedEvent(db, pre, sn):
     vals = db.pses.getLast(keys=pre, on=sn)
     dig = vals if vals else None
     if dig is None:
-        dig = db.kels.getLast(keys=pre, on=sn)
+        dig = db.lastDig(pre=pre, sn=sn)
     dig = dig.encode("utf-8")
     serder = db.evts.get(keys=(pre, dig))
     sigers = db.sigs.get(keys=(pre, dig))
@@ -15,7 +15,7 @@ from .configing import Configer
 from .keeping import Keeper, Manager
 
 from ..peer import Exchanger, exchange
-from ..db import Baser, dgKey, fetchTsgs
+from ..db import Baser, dgKey, fetchTsgs, writeMsgs
 from ..help import fromIso8601, toIso8601
 from ..kering import (Vrsn_1_0, Ilks, ClosedError, AuthError,
                 ConfigurationError, ValidationError, MissingEntryError,
@@ -53,7 +53,7 @@ def openHby(*, name="test", base="", temp=True, salt=None, **kwa):
             random salt is generated when ``None``.
         **kwa: Additional keyword arguments forwarded to ``Habery.__init__``.
             See ``Habery`` for the full list (``seed``, ``aeid``, ``bran``,
-            ``pidx``, ``algo``, ``tier``, ``free``).
+            ``pidx``, ``algo``, ``tier``, ``free``, ``cache``).
 
     Yields:
         Habery: Fully initialised ``Habery`` instance.
@@ -167,7 +167,7 @@ class Habery:
             **kwa: Keyword arguments forwarded to ``setup`` and stored in
                 ``_inits`` for deferred initialisation.  See ``setup`` for the
                 full parameter list (``seed``, ``aeid``, ``bran``, ``pidx``,
-                ``algo``, ``salt``, ``tier``, ``free``).
+                ``algo``, ``salt``, ``tier``, ``free``, ``cache``).
         """
         self.name = name
         self.base = base
@@ -213,7 +213,7 @@ class Habery:
 
 
     def setup(self, *, seed=None, aeid=None, bran=None, pidx=None, algo=None,
-              salt=None, tier=None, free=False, temp=None, ):
+              salt=None, tier=None, free=False, temp=None, cache=None):
         """Finish initialisation of the ``Habery`` after ``db`` and ``ks`` are open.
 
         Intended to be called once both ``.db`` and ``.ks`` have been opened.
@@ -252,6 +252,8 @@ class Habery:
                 associated ``Doer`` exits.
             temp (bool | None): When ``True``, overrides the instance
                 ``temp`` flag to use fast salt-stretch methods during setup.
+            cache (SignerCache | None): Opt-in cache of decrypted signers
+                forwarded to the ``Manager``.  ``None`` means no cache.
 
         Raises:
             ClosedError: If ``.ks`` or ``.db`` is not open when called.
@@ -282,7 +284,7 @@ class Habery:
 
         try:
             self.mgr = Manager(ks=self.ks, seed=seed, aeid=aeid, pidx=pidx,
-                                       algo=algo, salt=salt, tier=tier)
+                                       algo=algo, salt=salt, tier=tier, cache=cache)
         except AuthError as ex:
             self.close()
             raise ex
@@ -1227,7 +1229,7 @@ class BaseHab:
             ConfigurationError: if inception event is missing from the KEL or
                 the event store.
         """
-        if (dig := self.db.kels.getLast(keys=self.pre, on=0)) is None:
+        if (dig := self.db.lastDig(pre=self.pre, sn=0)) is None:
             raise ConfigurationError("Missing inception event in KEL for "
                                             "Habitat pre={}.".format(self.pre))
         dig = dig.encode("utf-8")
@@ -1680,18 +1682,48 @@ class BaseHab:
         Returns:
             bytearray: serialized event log messages.
         """
+        msgs = bytearray()
+        for msg in self.replayIter(pre=pre, fn=fn):
+            msgs.extend(msg)
+
+        return msgs
+
+
+    def replayIter(self, pre=None, fn=0):
+        """Iterator of replay messages of FEL (first-seen event log) for
+        ``pre`` starting from ``fn`` preceded by the delegation chain if any.
+        Same as ``.replay`` one message at a time. Default pre is own ``.pre``.
+
+        Args:
+            pre (str or None): qb64 str or bytes of identifier prefix.
+                Default is own ``.pre``.
+            fn (int): first-seen ordering number to start from.
+
+        Yields:
+            bytearray: serialized event message with attachments.
+        """
         if not pre:
             pre = self.pre
 
-        msgs = bytearray()
         kever = self.kevers[pre]
-        for msg in self.db.cloneDelegation(kever=kever):
-            msgs.extend(msg)
+        yield from self.db.cloneDelegation(kever=kever)
+        yield from self.db.clonePreIter(pre=pre, fn=fn)
 
-        for msg in self.db.clonePreIter(pre=pre, fn=fn):
-            msgs.extend(msg)
 
-        return msgs
+    def exportReplay(self, out, pre=None, fn=0):
+        """Write replay of FEL (first-seen event log) for ``pre`` to ``out``
+        one message at a time as ``.replayIter`` yields them.
+
+        Args:
+            out: binary file like object with .write or socket with .sendall
+            pre (str or None): qb64 str or bytes of identifier prefix.
+                Default is own ``.pre``.
+            fn (int): first-seen ordering number to start from.
+
+        Returns:
+            int: total number of bytes written.
+        """
+        return writeMsgs(self.replayIter(pre=pre, fn=fn), out)
 
 
     def replayAll(self):
@@ -1726,7 +1758,7 @@ class BaseHab:
             return None
 
         msg = bytearray()
-        dig = self.db.kels.getLast(keys=pre, on=sn)
+        dig = self.db.lastDig(pre=pre, sn=sn)
         if dig is None:
             raise MissingEntryError("Missing event for pre={} at sn={}."
                                            "".format(pre, sn))
@@ -2255,7 +2287,7 @@ class BaseHab:
         Raises:
             MissingEntryError: if no event is found for own prefix at ``sn``.
         """
-        dig = self.db.kels.getLast(keys=self.pre, on=sn)
+        dig = self.db.lastDig(pre=self.pre, sn=sn)
         dig = dig.encode("utf-8") if dig else None
         if dig is None and allowPartiallySigned:
             vals = self.db.pses.getLast(keys=self.pre, on=sn)
@@ -211,11 +211,155 @@ def streamCESRRequests(client, ims, dest, path=None, headers=None):
     return cnt
 
 
+class ClientPool(doing.DoDoer):
+    """
+    ClientPool is a DoDoer that shares keep-alive hio HTTP clients between requests to the same host.
+
+    Clients are pooled by (scheme, hostname, port). A leased client runs its queued requests
+    one after another over a single persistent connection so that a CESR stream sent as several
+    POST requests, or repeated requests to the same witness or mailbox, reuse one connection
+    instead of connecting once per request. Released clients wait idle for the next lease of
+    the same host, up to .maxPerHost of them per host. Clients whose connection was cut off by
+    the far side, that are released with requests still in flight, or that sit idle longer
+    than .idleTimeout are closed instead of reused.
+
+    The ClientDoer of every pooled client runs inside this pool, so a pool shared between
+    several DoDoers must be run by exactly one of them.
+
+    Doers:
+        - poolDo: Periodically closes clients that have been idle longer than the idle timeout.
+    """
+
+    MaxPerHost = 4  # maximum number of idle clients kept per host
+    IdleTimeout = 60  # seconds an idle client is kept before it is closed
+
+    def __init__(self, maxPerHost=None, idleTimeout=None):
+        """Initialize pool with no clients.
+
+        Parameters:
+            maxPerHost (int): maximum number of idle clients kept per host. Defaults to .MaxPerHost
+            idleTimeout (float): seconds an idle client is kept before it is closed.
+                Defaults to .IdleTimeout
+
+        Attributes:
+            idle (dict): idle client tuples keyed by (scheme, hostname, port). Each value is a
+                list of (``Client``, ``ClientDoer``, ``datetime``) tuples ordered least to
+                most recently released.
+            leased (dict): (key, ``ClientDoer``) tuples of leased clients keyed by ``Client``.
+        """
+        self.maxPerHost = maxPerHost if maxPerHost is not None else self.MaxPerHost
+        self.idleTimeout = idleTimeout if idleTimeout is not None else self.IdleTimeout
+        self.idle = dict()
+        self.leased = dict()
+        doers = [doing.doify(self.poolDo)]
+        super(ClientPool, self).__init__(doers=doers)
+
+    def acquire(self, scheme, hostname, port=None, path=None):
+        """
+        Lease a client for the host, reusing the most recently released idle client if any.
+
+        Parameters:
+            scheme (str): http or https
+            hostname (str): host name or address of the remote server
+            port (int): port of the remote server, optional
+            path (str): base path used to build request paths, e.g. by streamCESRRequests.
+                Left unchanged when None
+
+        Returns:
+            http.clienting.Client: leased client, return it with .release when done
+        """
+        key = (scheme, hostname, port)
+        idles = self.idle.get(key, [])
+        while idles:
+            client, doer, _ = idles.pop()
+            if not client.connector.cutoff:
+                break
+            self.close(doer)
+        else:
+            client = http.clienting.Client(scheme=scheme,
+                                           hostname=hostname,
+                                           port=port,
+                                           portOptional=True)
+            doer = http.clienting.ClientDoer(client=client)
+            if self.deeds:  # running so enter doer now
+                self.extend([doer])
+            else:  # entered with the rest of .doers once this pool runs
+                self.doers.append(doer)
+
+        if path is not None:
+            client.requester.path = path
+
+        self.leased[client] = (key, doer)
+        return client
+
+    def release(self, client):
+        """
+        Return a leased client to the pool. Clients not leased from this pool are ignored.
+
+        Parameters:
+            client (http.clienting.Client): client leased with .acquire
+        """
+        if client not in self.leased:
+            return
+
+        key, doer = self.leased.pop(client)
+        if client.requests or client.waited or client.connector.cutoff:
+            self.close(doer)  # can not tell which response belongs to the next lease
+            return
+
+        client.responses.clear()
+        idles = self.idle.setdefault(key, [])
+        idles.append((client, doer, nowUTC()))
+        while len(idles) > self.maxPerHost:
+            (_, stale, _) = idles.pop(0)
+            self.close(stale)
+
+    def close(self, doer):
+        """
+        Close the client of doer by removing doer from the pool.
+
+        Parameters:
+            doer (http.clienting.ClientDoer): doer of the client to close
+        """
+        self.remove([doer])
+
+    def poolDo(self, tymth, tock=0.0, **kwa):
+        """ Periodically close idle clients
+
+        Closes any idle clients released longer than idle timeout ago or whose connection was cut off
+
+        Parameters:
+            tymth (function): injected function wrapper closure returned by .tymen() of
+                Tymist instance. Calling tymth() returns associated Tymist .tyme.
+            tock (float): injected initial tock value
+
+        """
+        self.wind(tymth)
+        self.tock = tock
+        yield self.tock
+
+        while True:
+            now = nowUTC()
+            for key, idles in list(self.idle.items()):
+                for tup in list(idles):
+                    (client, doer, dt) = tup
+                    if client.connector.cutoff or \
+                            (now - dt) > datetime.timedelta(seconds=self.idleTimeout):
+                        idles.remove(tup)
+                        self.close(doer)
+
+                if not idles:
+                    del self.idle[key]
+
+            yield self.tock
+
+
 class Clienter(doing.DoDoer):
     """
-    Clienter is a DoDoer that manages hio HTTP clients using a ClientDoer for each HTTP request.
-    It executes HTTP requests using a HIO HTTP Client run by a ClientDoer. Once a request has
-    received a response then the corresponding Doer is removed from this Clienter.
+    Clienter is a DoDoer that manages hio HTTP clients leased from a ClientPool for each HTTP request.
+    It executes HTTP requests using a HIO HTTP Client run by a ClientDoer of the pool. Once a request has
+    received a response then the corresponding Client is released back to the pool so that later
+    requests to the same host reuse its connection.
 
     Doers:
         - clientDo: Periodically checks for stale clients and removes them if they have not received a response
@@ -224,22 +368,29 @@ class Clienter(doing.DoDoer):
 
     TimeoutClient = 300  # seconds to wait for response before removing client, default is 5 minutes
 
-    def __init__(self):
+    def __init__(self, pool=None):
         """Initialize clienter with an empty list of client tuples.
 
+        Parameters:
+            pool (ClientPool): pool to lease clients from. When provided the caller is
+                responsible for running the pool, otherwise this Clienter creates and runs its own.
+
         Attributes:
-            clients (list[tuple]): Active client tuples, each containing a
-                ``ClientDoer`` instance, an hio HTTP ``Client`` instance,
-                and a ``datetime`` timestamp.
-            doers (list): Doers managed by this Clienter, initialized with clientDo.
+            clients (list[tuple]): Active client tuples, each containing an hio HTTP
+                ``Client`` instance and a ``datetime`` timestamp.
+            pool (ClientPool): pool of keep-alive clients requests are sent with.
+            doers (list): Doers managed by this Clienter, initialized with clientDo and the pool if owned.
         """
         self.clients = []
+        self.pool = pool if pool is not None else ClientPool()
         doers = [doing.doify(self.clientDo)]
+        if pool is None:
+            doers.insert(0, self.pool)
         super(Clienter, self).__init__(doers=doers)
 
     def request(self, method, url, body=None, headers=None):
         """
-        Perform an HTTP request using a hio http Client and ClientDoer and returns the Client.
+        Perform an HTTP request using a hio http Client leased from the pool and returns the Client.
 
         Parameters:
             method (str): HTTP method to use (e.g., "GET", "POST")
@@ -253,10 +404,9 @@ class Clienter(doing.DoDoer):
         purl = parse.urlparse(url)
 
         try:
-            client = http.clienting.Client(scheme=purl.scheme,
-                                           hostname=purl.hostname,
-                                           port=purl.port,
-                                           portOptional=True)
+            client = self.pool.acquire(scheme=purl.scheme,
+                                       hostname=purl.hostname,
+                                       port=purl.port)
         except Exception as e:
             print(f"error establishing client connection={e}")
             return None
@@ -272,27 +422,23 @@ class Clienter(doing.DoDoer):
             body=body
         )
 
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
-        self.clients.append((client, clientDoer, nowUTC()))
+        self.clients.append((client, nowUTC()))
 
         return client
 
     def remove(self, client):
         """
-        Find a client tuple by hio HTTP Client and remove it and its Doer from the Clienter.
+        Find a client tuple by hio HTTP Client, remove it from the Clienter and release the Client to the pool.
 
         Parameters:
             client (http.clienting.Client): The hio HTTP Client to remove from the Clienter.
         """
-        doers = [(c, d, dt) for (c, d, dt) in self.clients if c == client]
-        if len(doers) == 0:
+        tups = [(c, dt) for (c, dt) in self.clients if c == client]
+        if len(tups) == 0:
             return
 
-        tup = doers[0]
-        self.clients.remove(doers[0])
-        (_, doer, _) = tup
-        super(Clienter, self).remove([doer])
+        self.clients.remove(tups[0])
+        self.pool.release(client)
 
     def clientDo(self, tymth, tock=0.0, **kwa):
         """ Periodically prune stale clients
@@ -311,7 +457,7 @@ class Clienter(doing.DoDoer):
 
         while True:
             toRemove = []
-            for (client, doer, dt) in self.clients:
+            for (client, dt) in self.clients:
                 if client.responses:
                     now = nowUTC()
                     if (now - dt) > datetime.timedelta(seconds=self.TimeoutClient):
@@ -77,7 +77,8 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                 lax=True,
                 local=False,
                 rvy=rvy,
-                cues=cues)
+                cues=cues,
+                indexed=True)
     kvy.registerReplyRoutes(router=rvy.rtr)
 
     from ..vdr import Tevery  # dynamic import because of circular import
@@ -93,7 +94,8 @@ def setupWitness(hby, alias="witness", mbx=None, aids=None, tcpPort=5631, httpPo
                             tvy=tvy,
                             exc=exchanger,
                             rvy=rvy,
-                            version=Vrsn_1_0)
+                            version=Vrsn_1_0,
+                            cursor=True)
 
     httpEnd = HttpEnd(rxbs=parser.ims, mbx=mbx)
     app.add_route("/", httpEnd)
@@ -1011,6 +1013,13 @@ class QryRpyMailboxIterable:
 
 
 class MailboxIterable:
+    """
+    Server sent event stream of the messages stored in mailbox mbx for the
+    topics of pre. Each topic is read from the database only on the first
+    iteration and thereafter only when the mailbox append notification
+    sequence number of the topic shows new messages. Reads resume at the
+    next ordinal of each topic.
+    """
     TimeoutMBX = 30000000
 
     def __init__(self, mbx, pre, topics, retry=5000):
@@ -1018,6 +1027,7 @@ class MailboxIterable:
         self.pre = pre
         self.topics = topics
         self.retry = retry
+        self.seqs = dict()  # notification seq of last read of each topic
 
     def __iter__(self):
         self.start = self.end = time.perf_counter()
@@ -1032,6 +1042,11 @@ class MailboxIterable:
             data = bytearray()
             for topic, idx in self.topics.items():
                 key = self.pre + topic
+                seq = self.mbx.topicSeq(key)
+                if self.seqs.get(key) == seq:  # nothing new stored since last read
+                    continue
+                self.seqs[key] = seq
+
                 for fn, _, msg in self.mbx.cloneTopicIter(key, idx):
                     data.extend(bytearray("id: {}\nevent: {}\nretry: {}\ndata: ".format(fn, topic, self.retry)
                                           .encode("utf-8")))
@@ -1140,7 +1155,7 @@ class ReceiptEnd(doing.DoDoer):
             raise falcon.HTTPBadRequest(description="either 'sn' or 'said' query param is required")
 
         if sn is not None:
-            said = self.hab.db.kels.getLast(keys=preb, on=sn)
+            said = self.hab.db.lastDig(pre=preb, sn=sn)
         if said is None:
             raise falcon.HTTPNotFound(description=f"event for {pre} at {sn} ({said}) not found")
         said = said.encode("utf-8")
@@ -1254,7 +1269,7 @@ class QueryEnd:
 
             sn = req.get_param_as_int("sn")
             if sn is not None: ## query for event with seq-num >= sn
-                dig = self.hab.db.kels.getLast(keys=pre, on=sn)
+                dig = self.hab.db.lastDig(pre=pre, sn=sn)
                 if dig is None:
                     raise falcon.HTTPBadRequest(description=f"non-existant event at seq-num {sn}")
                 for dig in self.hab.db.kels.getAllIter(keys=pre, on=sn):
@@ -25,7 +25,8 @@ Example usage::
 
 """
 import math
-from collections import namedtuple, deque
+import time
+from collections import namedtuple, deque, OrderedDict
 from dataclasses import dataclass, asdict, field
 
 import pysodium
@@ -608,6 +609,147 @@ class Creatory:
 Initage = namedtuple("Initage", 'aeid pidx salt tier')
 
 
+class SignerCache:
+    """
+    SignerCache is bounded in memory cache of decrypted Signer instances keyed
+    by qb64 public key so that repeated signing with the same keys does not
+    read and decrypt the private key from the keystore each time.
+
+    Entries expire .ttl seconds after they are cached and are swept out on
+    every lookup and insertion. The least recently used entry is evicted when
+    more than .size entries. Every entry removed for any reason is zeroized.
+
+    Attributes:
+        size (int): maximum number of cached signers
+        ttl (float): seconds a cached signer lives
+        hits (int): count of lookups found in cache
+        misses (int): count of lookups not found or expired
+
+    Hidden:
+        _signers (OrderedDict): of (signer, expiry) duples keyed by qb64
+            public key in least recently used first order
+        _expiries (deque): of (expiry, pub) duples in insertion order which is
+            expiry order for a fixed .ttl
+    """
+
+    def __init__(self, size=1024, ttl=300.0):
+        """
+        Parameters:
+            size (int): maximum number of cached signers
+            ttl (float): seconds a cached signer lives
+        """
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._signers = OrderedDict()
+        self._expiries = deque()
+
+    def __len__(self):
+        return len(self._signers)
+
+    def __contains__(self, pub):
+        return pub in self._signers
+
+    def get(self, pub, keep=()):
+        """
+        Returns:
+            signer (Signer|None): cached signer for qb64 public key pub or None
+                if not cached or expired
+
+        Parameters:
+            pub (str): qb64 public key
+            keep (Iterable): qb64 public keys of signers in use so not swept
+        """
+        self.sweep(keep=keep)
+        if (entry := self._signers.get(pub)) is None:
+            self.misses += 1
+            return None
+
+        signer, expiry = entry
+        if time.monotonic() >= expiry:
+            self.rem(pub)
+            self.misses += 1
+            return None
+
+        self._signers.move_to_end(pub)  # most recently used
+        self.hits += 1
+        return signer
+
+    def put(self, pub, signer, keep=()):
+        """
+        Caches signer at qb64 public key pub evicting least recently used
+        signers when more than .size
+
+        Parameters:
+            pub (str): qb64 public key
+            signer (Signer): instance of private key for pub
+            keep (Iterable): qb64 public keys of signers in use so not evicted
+        """
+        self.sweep(keep=keep)
+        if pub in self._signers:
+            self.rem(pub)
+        expiry = time.monotonic() + self.ttl
+        self._signers[pub] = (signer, expiry)
+        self._expiries.append((expiry, pub))
+
+        victims = []
+        excess = len(self._signers) - self.size
+        for key in self._signers:  # least recently used first
+            if excess <= len(victims):
+                break
+            if key != pub and key not in keep:
+                victims.append(key)
+        for key in victims:
+            self.rem(key)
+
+    def sweep(self, keep=()):
+        """
+        Removes and zeroizes all expired signers from the expired head of
+        ._expiries. Entries already removed or re-cached since are skipped.
+
+        Parameters:
+            keep (Iterable): qb64 public keys of signers in use so not swept
+        """
+        now = time.monotonic()
+        kept = []
+        while self._expiries and self._expiries[0][0] <= now:
+            expiry, pub = self._expiries.popleft()
+            if (entry := self._signers.get(pub)) is not None and entry[1] == expiry:
+                if pub in keep:
+                    kept.append((expiry, pub))  # sweep on later call
+                else:
+                    self.rem(pub)
+        self._expiries.extendleft(reversed(kept))
+
+    def rem(self, pub):
+        """
+        Removes and zeroizes signer cached at qb64 public key pub if any
+        """
+        if (entry := self._signers.pop(pub, None)) is not None:
+            self.zeroize(entry[0])
+
+    def clear(self):
+        """
+        Removes and zeroizes all cached signers
+        """
+        while self._signers:
+            _, (signer, _) = self._signers.popitem()
+            self.zeroize(signer)
+        self._expiries.clear()
+
+    @staticmethod
+    def zeroize(signer):
+        """
+        Zeroizes signer by replacing its private key seed with zeros and
+        disabling its signing function so any stale reference to it can no
+        longer sign. Python bytes are immutable so this drops the seed held
+        by signer instead of overwriting the seed memory in place.
+        """
+        signer._raw = bytes(len(signer._raw))
+        signer._sign = None
+
+
 class Manager:
     """Manages key pairs creation, storage, and signing
     Class for managing key pair creation, storage, retrieval, and message signing.
@@ -620,6 +762,9 @@ class Manager:
             decryption key is derived seed (private signing key seed)
         inited (bool): True means fully initialized wrt database.
                           False means not yet fully initialized
+        cache (SignerCache|None): opt in cache of decrypted signers used by
+            .sign and .decrypt. Cleared on .rotate, .replay, .move and
+            .updateAeid. None means no cache.
 
     Attributes (Hidden):
 
@@ -659,12 +804,14 @@ class Manager:
 
     """
 
-    def __init__(self, *, ks=None, seed=None, **kwa):
+    def __init__(self, *, ks=None, seed=None, cache=None, **kwa):
         """
         Setup Manager.
 
         Parameters:
             ks (Keeper): key store instance (LMDB)
+            cache (SignerCache|None): opt in cache of decrypted signers.
+                None means fetch and decrypt private key for every signature.
             seed (str): qb64 private-signing key (seed) for the aeid from which
                 the private decryption key may be derived. If aeid stored in
                 database is not empty then seed may required to do any key
@@ -696,6 +843,7 @@ class Manager:
         self.decrypter = None
         self._seed = seed if seed is not None else ""
         self.inited = False
+        self.cache = cache
 
         # save keyword arg parameters to init later if db not opened yet
         self._inits = kwa
@@ -792,6 +940,7 @@ class Manager:
             seed (str): qb64 of new seed from which new aeid is derived (private signing
                         key seed)
         """
+        self.clearCache()
         if self.aeid:  # check that last current seed matches last current .aeid
             # verifies seed belongs to aeid
             if not self.seed or not self.encrypter.verifySeed(self.seed):
@@ -1092,6 +1241,7 @@ class Manager:
         if old == new:
             return
 
+        self.clearCache()
         if self.ks.pres.get(old) is None:
             raise ValueError("Nonexistent old pre={}, nothing to assign.".format(old))
 
@@ -1184,6 +1334,7 @@ class Manager:
         if not ps.nxt.pubs:  # empty nxt public keys so non-transferable prefix
             raise ValueError("Attempt to rotate nontransferable pre={}.".format(pre))
 
+        self.clearCache()
         old = ps.old  # save prior old so can clean out if rotate successful
         ps.old = ps.new  # move prior new to old so save previous one step
         ps.new = ps.nxt  # move prior nxt to new which new is now current signer
@@ -1246,6 +1397,42 @@ class Manager:
         return (verfers, digers)
 
 
+    def fetchSigner(self, pub, keep=()):
+        """
+        Returns Signer of private key for qb64 public key pub from .cache when
+        cached otherwise fetched and decrypted from keystore and then cached.
+
+        Parameters:
+            pub (str|bytes): qb64 public key
+            keep (Iterable): qb64 public keys of signers already fetched for
+                the same operation so not evicted from .cache while in use
+        """
+        if self.aeid and not self.decrypter:
+            raise DecryptError("Unauthorized decryption attempt. "
+                                      "Aeid but no decrypter.")
+        if hasattr(pub, "decode"):
+            pub = pub.decode("utf-8")
+
+        if self.cache is not None and (signer := self.cache.get(pub, keep=keep)) is not None:
+            return signer
+
+        if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
+                is None):
+            raise ValueError("Missing prikey in db for pubkey={}".format(pub))
+
+        if self.cache is not None:
+            self.cache.put(pub, signer, keep=keep)
+        return signer
+
+
+    def clearCache(self):
+        """
+        Clears and zeroizes all signers in .cache if any
+        """
+        if self.cache is not None:
+            self.cache.clear()
+
+
     def sign(self, ser, pubs=None, verfers=None, indexed=True,
              indices=None, ondices=None, pre=None, path=None):
         """
@@ -1353,25 +1540,12 @@ class Manager:
             # use paths to generate signers
 
         if pubs:
-            for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
-
+            keep = [pub.decode("utf-8") if hasattr(pub, "decode") else pub
+                    for pub in pubs]
         else:
-            for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+            keep = [verfer.qb64 for verfer in verfers]
+        for pub in keep:
+            signers.append(self.fetchSigner(pub, keep=keep))
 
         if indices and len(indices) != len(signers):
             raise ValueError(f"Mismatch indices length={len(indices)} and resultant"
@@ -1435,25 +1609,12 @@ class Manager:
         """
         signers = []
         if pubs:
-            for pub in pubs:
-                if self.aeid and not self.decrypter:
-                    raise DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(pub, decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(pub))
-                signers.append(signer)
-
+            keep = [pub.decode("utf-8") if hasattr(pub, "decode") else pub
+                    for pub in pubs]
         else:
-            for verfer in verfers:
-                if self.aeid and not self.decrypter:
-                    raise DecryptError("Unauthorized decryption attempt. "
-                                              "Aeid but no decrypter.")
-                if ((signer := self.ks.pris.get(verfer.qb64,
-                                                decrypter=self.decrypter))
-                        is None):
-                    raise ValueError("Missing prikey in db for pubkey={}".format(verfer.qb64))
-                signers.append(signer)
+            keep = [verfer.qb64 for verfer in verfers]
+        for pub in keep:
+            signers.append(self.fetchSigner(pub, keep=keep))
 
         if hasattr(qb64, "encode"):
             qb64 = qb64.encode()  # convert str to bytes
@@ -1681,7 +1842,7 @@ class Manager:
         if (ps := self.ks.sits.get(pre)) is None:
             raise ValueError("Attempt to replay nonexistent pre={}.".format(pre))
 
-
+        self.clearCache()
         if advance:
             old = ps.old  # save prior old so can clean out if rotate successful
             ps.old = ps.new  # move prior new to old so save previous one step
@@ -1790,4 +1951,4 @@ class ManagerDoer(doing.Doer):
 
     def exit(self):
         """"""
-        pass
+        self.manager.clearCache()
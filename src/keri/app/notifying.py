@@ -192,6 +192,30 @@ class DicterSuber(Suber):
                                                top=self._tokey(keys)):
             yield self._tokeys(key), self.klas(raw=bytes(val))
 
+    def getNextItemIter(self, keys: Union[str, Iterable] = b""):
+        """ Return iterator over the items in subdb with key after key made
+        from keys in key order. Seeks directly to key so earlier items are
+        neither read nor deserialized.
+
+        Parameters:
+            keys (tuple): of key strs to be combined in order to form key.
+                Empty means iterate over all items in subdb
+
+        Returns:
+            iterator: of tuples of keys tuple and val Dicter for each entry
+            in db after key
+
+        """
+        key = self._tokey(keys) if keys else b""
+        with self.db.begin(db=self.sdb, write=False, buffers=True) as txn:
+            cursor = txn.cursor()
+            if cursor.set_range(key):  # move to val at key >= key if any
+                for ckey, cval in cursor.iternext():
+                    ckey = bytes(ckey)
+                    if ckey == key:  # skip item at key itself
+                        continue
+                    yield self._tokeys(ckey), self.klas(raw=bytes(cval))
+
     def cntAll(self):
         """
         Return count over the all the items in subdb
@@ -207,6 +231,11 @@ class Noter(LMDBer):
     Noter stores Notifications generated by the agent that are
     intended to be read and dismissed by the controller of the agent.
 
+    Notes are keyed by (datetime, rid) so are in datetime order. .getNotePage
+    pages through them by continuation token, the key of the last note of
+    the previous page, so late pages are as cheap as the first. The count of
+    notes is maintained in .ncnt as notes are added and removed.
+
     """
     TailDirPath = os.path.join("keri", "not")
     AltTailDirPath = os.path.join(".keri", "not")
@@ -224,6 +253,7 @@ class Noter(LMDBer):
         self.notes = None
         self.nidx = None
         self.ncigs = None
+        self.ncnt = None
 
         super(Noter, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -238,6 +268,7 @@ class Noter(LMDBer):
         self.notes = DicterSuber(db=self, subkey='nots.', sep='/', klas=Notice)
         self.nidx = Suber(db=self, subkey='nidx.')
         self.ncigs = CesrSuber(db=self, subkey='ncigs.', klas=Cigar)
+        self.ncnt = Suber(db=self, subkey='ncnt.')
 
         return self.env
 
@@ -252,12 +283,15 @@ class Noter(LMDBer):
         """
         dt = note.datetime
         rid = note.rid
-        if self.nidx.get(keys=(rid,)) is not None:
-            return False
+        with self.txn():
+            if self.nidx.get(keys=(rid,)) is not None:
+                return False
 
-        self.nidx.pin(keys=(rid,), val=dt.encode())
-        self.ncigs.pin(keys=(rid,), val=cigar)
-        return self.notes.pin(keys=(dt, rid), val=note)
+            cnt = self.getNoteCnt()
+            self.nidx.pin(keys=(rid,), val=dt.encode())
+            self.ncigs.pin(keys=(rid,), val=cigar)
+            self.ncnt.pin(keys=("cnt",), val=str(cnt + 1))
+            return self.notes.pin(keys=(dt, rid), val=note)
 
     def update(self, note, cigar):
         """
@@ -314,19 +348,26 @@ class Noter(LMDBer):
         note, _ = res
         dt = note.datetime
         rid = note.rid
-        self.nidx.rem(keys=(rid,))
-        self.ncigs.rem(keys=(rid,))
-        return self.notes.rem(keys=(dt, rid))
+        with self.txn():
+            self.nidx.rem(keys=(rid,))
+            self.ncigs.rem(keys=(rid,))
+            if removed := self.notes.rem(keys=(dt, rid)):
+                self.ncnt.pin(keys=("cnt",), val=str(self.getNoteCnt() - 1))
+            return removed
 
     def getNoteCnt(self):
         """
-        Return count over the all Notes
+        Return count over the all Notes from the maintained count. Counts all
+        notes once when there is no maintained count yet.
 
         Returns:
             int: count of all items
 
         """
-        return self.notes.cntAll()
+        if (cnt := self.ncnt.get(keys=("cnt",))) is None:
+            cnt = self.notes.cntAll()
+            self.ncnt.pin(keys=("cnt",), val=str(cnt))
+        return int(cnt)
 
     def getNotes(self, start=0, end=25):
         """
@@ -358,6 +399,32 @@ class Noter(LMDBer):
 
         return notes
 
+    def getNotePage(self, token=None, limit=25):
+        """
+        Returns page of notes for controller of agent after continuation token
+
+        Parameters:
+            token (str|None): continuation token from previous page. None
+                means first page
+            limit (int): maximum number of notes in page
+
+        Returns:
+            page (tuple): (notes, token) where notes is list of tuples
+                (note, cigar) and token is continuation token for next page
+                or None when there are no more notes
+        """
+        notes = []
+        keys = token.split(self.notes.sep) if token else ()
+        for nkeys, note in self.notes.getNextItemIter(keys=keys):
+            cig = self.ncigs.get(keys=(note.rid,))
+            notes.append((note, cig))
+            if len(notes) == limit:
+                break
+        else:
+            return notes, None
+
+        return notes, self.notes.sep.join(nkeys)
+
 
 class Notifier:
     """ Class for sending notifications to the controller of an agent.
@@ -501,3 +568,26 @@ class Notifier:
             notes.append(note)
 
         return notes
+
+    def getNotePage(self, token=None, limit=25):
+        """
+        Returns page of notes for controller of agent after continuation token
+
+        Parameters:
+            token (str|None): continuation token from previous page. None
+                means first page
+            limit (int): maximum number of notes in page
+
+        Returns:
+            page (tuple): (notes, token) where notes is list of notes and token
+                is continuation token for next page or None when no more notes
+        """
+        notesigs, token = self.noter.getNotePage(token=token, limit=limit)
+        notes = []
+        for note, cig in notesigs:
+            if not self.hby.signator.verify(ser=note.raw, cigar=cig):
+                raise ValidationError("note stored without valid signature")
+
+            notes.append(note)
+
+        return notes, token
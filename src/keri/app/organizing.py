@@ -10,11 +10,34 @@ from ordered_set import OrderedSet as oset
 
 from ..kering import ValidationError
 
+GramSize = 3  # size of lowercase n-grams in substring search index
+MaxIdxSize = 256  # max chars of field value in index key, longer truncated
+
+Metas = re.compile(r"[.^$*+?{}\[\]\\|()]")  # regex special chars in search val
+
+
+def grams(val, size=GramSize):
+    """ Returns set of lowercase n-grams of val for substring search index
+
+    Parameters:
+        val (str): field value
+        size (int): number of chars in each n-gram
+    """
+    val = val.lower()
+    return {val[i:i + size] for i in range(len(val) - size + 1)}
+
 
 class BaseOrganizer:
-    """ Base class for organizing contact or identifier information """
+    """ Base class for organizing contact or identifier information
+
+    When provided, idxdb is an inverted index of field values to prefixes for
+    indexed exact and prefix lookups, and gramdb an inverted index of lowercase
+    n-grams of field values to prefixes for substring search. Both are
+    maintained as fields are written and removed. Without them lookups scan
+    fielddb.
+    """
 
-    def __init__(self, hby, cigsdb, datadb, fielddb, imgsdb):
+    def __init__(self, hby, cigsdb, datadb, fielddb, imgsdb, idxdb=None, gramdb=None):
         """ Create base Organizer
 
         Parameters:
@@ -23,12 +46,63 @@ class BaseOrganizer:
             datadb: database for storing main data
             fielddb: database for storing individual fields
             imgsdb: database for storing images
+            idxdb: optional IoSetSuber index of (field, value) to prefixes
+            gramdb: optional IoSetSuber index of (field, n-gram) to prefixes
         """
         self.hby = hby
         self.cigsdb = cigsdb
         self.datadb = datadb
         self.fielddb = fielddb
         self.imgsdb = imgsdb
+        self.idxdb = idxdb
+        self.gramdb = gramdb
+
+    def index(self, pre, field, val):
+        """ Add field value val of identifier prefix to the field indexes
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            field (str): field name
+            val (str): field value
+        """
+        if self.idxdb is not None:
+            self.idxdb.add(keys=(field, val[:MaxIdxSize]), val=pre)
+        if self.gramdb is not None:
+            for gram in grams(val):
+                self.gramdb.add(keys=(field, gram), val=pre)
+
+    def unindex(self, pre, field, val):
+        """ Remove field value val of identifier prefix from the field indexes
+
+        Parameters:
+            pre (str): qb64 identifier prefix
+            field (str): field name
+            val (str): field value
+        """
+        if self.idxdb is not None:
+            self.idxdb.rem(keys=(field, val[:MaxIdxSize]), val=pre)
+        if self.gramdb is not None:
+            for gram in grams(val):
+                self.gramdb.rem(keys=(field, gram), val=pre)
+
+    def indexed(self, db):
+        """ Returns True if field index db can serve lookups, False if lookups
+        must scan fielddb because db is not provided or is empty while fielddb
+        has fields written before the index existed and not yet backfilled
+
+        Parameters:
+            db (IoSetSuber|None): .idxdb or .gramdb
+        """
+        return db is not None and (next(db.getTopItemIter(), None) is not None or
+                                   next(self.fielddb.getTopItemIter(), None) is None)
+
+    def reindex(self):
+        """ Rebuild the field indexes from all fields in fielddb """
+        for db in (self.idxdb, self.gramdb):
+            if db is not None:
+                db.trim()
+        for (pre, field), val in self.fielddb.getTopItemIter():
+            self.index(pre, field, val)
 
     def update(self, pre, data):
         """ Add or update contact information in data for the identifier prefix
@@ -51,7 +125,10 @@ class BaseOrganizer:
         self.datadb.pin(keys=(pre,), val=raw)
 
         for field, val in data.items():
+            if (old := self.fielddb.get(keys=(pre, field))) is not None:
+                self.unindex(pre, field, old)
             self.fielddb.pin(keys=(pre, field), val=val)
+            self.index(pre, field, val)
 
     def replace(self, pre, data):
         """ Replace all contact information for identifier prefix with data
@@ -102,6 +179,8 @@ class BaseOrganizer:
         """
         self.cigsdb.rem(keys=(pre,))
         self.datadb.rem(keys=(pre,))
+        for (_, field), val in self.fielddb.getTopItemIter(keys=(pre, "")):
+            self.unindex(pre, field, val)
         return self.fielddb.trim(keys=(pre,))
 
     def get(self, pre, field=None):
@@ -170,6 +249,19 @@ class BaseOrganizer:
         """
         pres = []
         prog = re.compile(f".*{val}.*", re.I)
+        if self.indexed(self.gramdb) and len(val) >= GramSize and not Metas.search(val):
+            cands = None  # literal val so candidates have all n-grams of val
+            for gram in grams(val):
+                found = set(self.gramdb.getIter(keys=(field, gram)))
+                cands = found if cands is None else cands & found
+                if not cands:
+                    break
+            for pre in sorted(cands):
+                if (v := self.fielddb.get(keys=(pre, field))) is not None and prog.match(v):
+                    pres.append(pre)
+
+            return [self.get(pre) for pre in pres]
+
         for (pre, f), v in self.fielddb.getTopItemIter():
             if f == field and prog.match(v):
                 pres.append(pre)
@@ -192,12 +284,42 @@ class BaseOrganizer:
 
         """
         pres = []
+        if self.indexed(self.idxdb):
+            for pre in sorted(self.idxdb.getIter(keys=(field, val[:MaxIdxSize]))):
+                if len(val) < MaxIdxSize or self.fielddb.get(keys=(pre, field)) == val:
+                    pres.append(pre)
+
+            return [self.get(pre) for pre in pres]
+
         for (pre, f), v in self.fielddb.getTopItemIter():
             if f == field and v == val:
                 pres.append(pre)
 
         return [self.get(pre) for pre in pres]
 
+    def findPrefix(self, field, val):
+        """ Find all contacts where field starts with val, case-sensitive
+
+        Parameters:
+            field (str): field name to search for
+            val (str): prefix of value to match (case-sensitive)
+
+        Returns:
+            list: All contacts whose field starts with val
+
+        """
+        pres = set()
+        if self.indexed(self.idxdb):
+            for (_, v), pre in self.idxdb.getTopItemIter(keys=(field, val[:MaxIdxSize])):
+                if len(val) <= len(v) or self.fielddb.get(keys=(pre, field)).startswith(val):
+                    pres.add(pre)
+        else:
+            for (pre, f), v in self.fielddb.getTopItemIter():
+                if f == field and v.startswith(val):
+                    pres.add(pre)
+
+        return [self.get(pre) for pre in sorted(pres)]
+
     def values(self, field, val=None):
         """ Find unique values for field in all contacts
 
@@ -212,6 +334,17 @@ class BaseOrganizer:
         prog = re.compile(f".*{val}.*", re.I) if val is not None else None
 
         vals = oset()
+        if self.indexed(self.idxdb):
+            items = sorted((pre, v) for (_, v), pre in  # scan order of fielddb
+                           self.idxdb.getTopItemIter(keys=(field, "")))
+            for pre, v in items:
+                if len(v) == MaxIdxSize:  # truncated so get full value
+                    v = self.fielddb.get(keys=(pre, field))
+                if prog is None or prog.match(v):
+                    vals.add(v)
+
+            return list(vals)
+
         for (pre, f), v in self.fielddb.getTopItemIter():
             if f == field and (prog is None or prog.match(v)):
                 vals.add(v)
@@ -305,7 +438,9 @@ class Organizer(BaseOrganizer):
             cigsdb=hby.db.ccigs,
             datadb=hby.db.cons,
             fielddb=hby.db.cfld,
-            imgsdb=hby.db.imgs
+            imgsdb=hby.db.imgs,
+            idxdb=hby.db.cidx,
+            gramdb=hby.db.cgrm
         )
 
 
@@ -323,5 +458,7 @@ class IdentifierOrganizer(BaseOrganizer):
             cigsdb=hby.db.icigs,
             datadb=hby.db.sids,
             fielddb=hby.db.ifld,
-            imgsdb=hby.db.iimgs
+            imgsdb=hby.db.iimgs,
+            idxdb=hby.db.iidx,
+            gramdb=hby.db.igrm
         )
@@ -44,9 +44,16 @@ class Mailboxer(LMDBer):
         and the value is the serialized messag itself.
         Multiple messages can share the same topic but with a different ordinal.
 
+        Mailboxer also keeps in memory .seqs, the append notification sequence
+        number of each topic, incremented by each .storeMsg at that topic. A
+        reader compares .topicSeq with the sequence number of its last read
+        of a topic to wake only when the topic has new messages instead of
+        polling the database. Only stores made by this process notify.
+
         """
         self.tpcs = None
         self.msgs = None
+        self.seqs = dict()  # append notification sequence number by topic
 
         super(Mailboxer, self).__init__(name=name, headDirPath=headDirPath, reopen=reopen, **kwa)
 
@@ -126,7 +133,27 @@ class Mailboxer(LMDBer):
 
         digb = Diger(ser=msg, code=MtrDex.Blake3_256).qb64b
         on = self.tpcs.append(keys=topic, val=digb)
-        return self.msgs.pin(keys=digb, val=msg)
+        result = self.msgs.pin(keys=digb, val=msg)
+
+        if hasattr(topic, "decode"):
+            topic = topic.decode("utf-8")
+        self.seqs[topic] = self.seqs.get(topic, 0) + 1  # notify readers of topic
+        return result
+
+
+    def topicSeq(self, topic):
+        """
+        Returns:
+            seq (int): append notification sequence number of topic which
+                changes whenever a message is stored at topic. Zero when none
+                stored at topic by this process.
+
+        Parameters:
+            topic (str | bytes): topic of messages
+        """
+        if hasattr(topic, "decode"):
+            topic = topic.decode("utf-8")
+        return self.seqs.get(topic, 0)
 
 
     def cloneTopicIter(self, topic, fn=0):
@@ -29,6 +29,8 @@ parser = argparse.ArgumentParser(description='Cleans and migrates a database and
                                  parents=[Parsery.keystore()])
 parser.set_defaults(handler=handler)
 parser.add_argument('--temp', '-t', help='create a temporary keystore, used for testing', default=False)
+parser.add_argument('--workers', '-w', type=int, default=None,
+                    help='number of worker processes to re-verify events in parallel')
 
 class CleanDoer(doing.Doer):
 
@@ -52,7 +54,7 @@ class CleanDoer(doing.Doer):
                        bran=self.args.bran, temp=self.args.temp)
 
         print("Database open, performing clean...")
-        hby.db.clean()
+        hby.db.clean(workers=self.args.workers)
         print("Finished")
 
         return True
@@ -12,8 +12,6 @@ from hio.help import ogler
 
 from ..common import Parsery, setupHby
 
-from ...core import SerderKERI
-
 
 logger = ogler.getLogger()
 
@@ -81,21 +79,13 @@ class ExportDoer(doing.DoDoer):
         sys.stdout.flush()
 
     def outputKEL(self, pre):
-        f = None
-        if self.files:
-            f = open(f"{pre}-kel.cesr", "w")
+        if self.files:  # write each message as cloned, not whole KEL at once
+            with open(f"{pre}-kel.cesr", "wb") as f:
+                self.hby.db.exportPre(pre=pre, out=f)
+            return
 
         for msg in self.hby.db.clonePreIter(pre=pre):
-            if f is not None:
-                f.write(msg.decode("utf-8"))
-            else:
-                serder = SerderKERI(raw=msg)
-                atc = msg[serder.size:]
-                sys.stdout.write(serder.raw.decode("utf-8"))
-                sys.stdout.write(atc.decode("utf-8"))
-
-        if f is not None:
-            f.close()
+            sys.stdout.write(msg.decode("utf-8"))
 
     def outputEnds(self, pre):
         f = None
@@ -63,10 +63,9 @@ class ImportDoer(doing.DoDoer):
         self.tock = tock
         _ = (yield self.tock)
 
-        with open(self.file, 'rb') as f:
-            ims = f.read()
+        with open(self.file, 'rb') as f:  # fixed size reads, not whole file
             Parser(kvy=self.hby.kvy, rvy=self.hby.rvy, local=False,
-                   version=Vrsn_1_0).parse(ims=ims)
+                   version=Vrsn_1_0, cursor=True).parseFile(f)
             self.hby.kvy.processEscrows()
 
         self.exit()
@@ -153,7 +153,7 @@ class GroupMultisigRotate(doing.DoDoer):
                     if mid not in self.hby.kevers:
                         raise ConfigurationError(f"unknown signing member {mid}")
 
-                    dig = self.hby.db.kels.getLast(keys=mid, on=int(sn))
+                    dig = self.hby.db.lastDig(pre=mid, sn=int(sn))
                     if dig is None:
                         raise ConfigurationError(f"non-existant event {sn} for signing member {mid}")
                     dig = dig.encode("utf-8")  # convert it from str to bytes because we're calling bytes(dig)
@@ -182,7 +182,7 @@ class GroupMultisigRotate(doing.DoDoer):
                     if mid not in self.hby.kevers:
                         raise ConfigurationError(f"unknown rotation member {mid}")
 
-                    dig = self.hby.db.kels.getLast(keys=mid, on=int(sn))
+                    dig = self.hby.db.lastDig(pre=mid, sn=int(sn))
                     if dig is None:
                         raise ConfigurationError(f"non-existant event {sn} for rotation member {mid}")
                     dig = dig.encode("utf-8")
@@ -61,7 +61,7 @@ def rollback(tymth, tock=0.0, **opts):
                                              f"{len(wigers)} witnesses, unable to rollback.")
 
             ked = hby.db.states.getDict(keys=serder.pre)
-            pdig = hby.db.kels.getLast(keys=serder.preb, on=serder.sn - 1)
+            pdig = hby.db.lastDig(pre=serder.preb, sn=serder.sn - 1)
             pdig = pdig.encode("utf-8")
 
             pserder = hby.db.evts.get(keys=(serder.preb, bytes(pdig)))
@@ -73,6 +73,7 @@ def rollback(tymth, tock=0.0, **opts):
             hby.db.sigs.rem(keys=(serder.preb, serder.saidb))  # idempotent
             hby.db.dtss.rem(keys=dgkey)  # idempotent
             hby.db.kels.rem(keys=serder.preb, on=serder.sn)
+            hby.db.lels.rem(keys=serder.preb, on=serder.sn)
 
             seqner = Number(num=serder.sn - 1)
             fner = Number(numh=ked['f'])
@@ -85,6 +86,7 @@ def rollback(tymth, tock=0.0, **opts):
             ked['d'] = pserder.said
             ked['f'] = fner.numh
             ked['dt'] = helping.nowIso8601()
+            hby.db.indexTail(pserder, fn=fner.num, last=False)
 
             state = SerderKERI(ked=ked)  # This is wrong key state is not Serder anymore
             hby.db.states.pin(keys=hab.pre,
@@ -4,7 +4,8 @@ keri.core.coring module
 
 """
 import json
-from collections import namedtuple
+import os
+from collections import namedtuple, OrderedDict
 from collections.abc import Sequence, Mapping
 from dataclasses import dataclass, astuple, asdict
 from base64 import urlsafe_b64encode as encodeB64
@@ -3404,12 +3405,125 @@ class Labeler(Matter):
         return self.raw.decode()  # everything else is just raw as str
 
 
+KERIVerifyCacheCapKey = "KERI_VERIFY_CACHE_CAP"
+
+
+class VerifyCache:
+    """VerifyCache is a bounded LRU of signature verification results shared by
+    all Verfer instances as Verfer.Cache so that the same signature on the same
+    serialization by the same verifier key is only verified once no matter how
+    often escrow sweeps, stored exn loads or credential clones verify it again.
+
+    Results are keyed by the blake3 digest of the verifier code and key, the
+    length prefixed signature and the serialization. Both valid and invalid
+    results are cached since either is determined by those inputs alone.
+
+    Class Attributes:
+        Cap (int): default maximum number of cached results
+
+    Attributes:
+        cap (int): maximum number of cached results. 0 disables caching
+        enabled (bool): False means bypass cache and always verify
+        results (OrderedDict): LRU of bool results keyed by digest
+        hits (int): number of lookups answered from .results
+        misses (int): number of lookups that had to verify
+
+    Properties:
+        ratio (float): fraction of lookups answered from .results
+
+    Methods:
+        digest: returns cache key of verification inputs
+        get: returns cached result if any
+        put: caches result
+        clear: removes all results and resets counters
+
+    """
+    Cap = 4096  # default max verification results in .results LRU
+
+    def __init__(self, cap=None, enabled=True):
+        """Initialize instance
+
+        Parameters:
+            cap (int|None): maximum number of cached results. 0 disables caching.
+                None means use KERI_VERIFY_CACHE_CAP env var if any otherwise .Cap
+            enabled (bool): False means bypass cache and always verify
+        """
+        if cap is None and (cap := os.getenv(KERIVerifyCacheCapKey)) is not None:
+            cap = int(cap)
+        self.cap = cap if cap is not None else self.Cap
+        self.enabled = True if enabled else False
+        self.results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def ratio(self):
+        """Returns fraction of lookups answered from cache, 0.0 when none yet"""
+        lookups = self.hits + self.misses
+        return (self.hits / lookups) if lookups else 0.0
+
+    @staticmethod
+    def digest(code, key, sig, ser):
+        """Returns bytes cache key of verification inputs
+
+        Parameters:
+            code (str): verifier cipher suite derivation code
+            key (bytes): verifier public key
+            sig (bytes): signature
+            ser (bytes): signed serialization
+        """
+        return blake3.blake3(b''.join((code.encode(), key,
+                                       len(sig).to_bytes(4, "big"),
+                                       sig, ser))).digest()
+
+    def get(self, dig):
+        """Returns cached bool result at dig if any else None
+
+        Parameters:
+            dig (bytes): cache key from .digest
+        """
+        if (result := self.results.get(dig)) is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.results.move_to_end(dig)
+        return result
+
+    def put(self, dig, result):
+        """Cache bool result at dig evicting least recently used over .cap
+
+        Parameters:
+            dig (bytes): cache key from .digest
+            result (bool): verification result
+        """
+        self.results[dig] = result
+        self.results.move_to_end(dig)
+        while len(self.results) > self.cap:
+            self.results.popitem(last=False)
+
+    def clear(self):
+        """Removes all cached results and resets hit and miss counters"""
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 class Verfer(Matter):
     """Verfer is Matter subclass with method to verify signature of serialization
     using the .raw as verifier key and .code for signature cipher suite.
 
     See Matter for inherited attributes and properties:
 
+    Class Attributes:
+        Verifieds (set|None): of (key, sig, ser) triples of bytes already
+            verified in batch by eventing.verifyBatch. When not None then
+            .verify returns True for any triple in Verifieds without verifying
+            again. Only ever holds verified triples so a miss just verifies.
+            None means always verify.
+        Cache (VerifyCache|None): LRU of verification results shared by all
+            instances. None or Cache.enabled False means always verify.
+
     Attributes:
 
     Properties:
@@ -3418,6 +3532,8 @@ class Verfer(Matter):
         verify: verifies signature
 
     """
+    Verifieds = None  # batch verified (key, sig, ser) triples when not None
+    Cache = VerifyCache()  # shared LRU of verification results
 
     def __init__(self, **kwa):
         """
@@ -3446,7 +3562,26 @@ class Verfer(Matter):
             sig is bytes signature
             ser is bytes serialization
         """
-        return (self._verify(sig=sig, ser=ser, key=self.raw))
+        if self.Verifieds:
+            try:
+                if (self.raw, sig, ser) in self.Verifieds:
+                    return True
+            except TypeError:  # unhashable sig or ser so verify as usual
+                pass
+
+        if (cache := self.Cache) is None or not cache.enabled or not cache.cap:
+            return (self._verify(sig=sig, ser=ser, key=self.raw))
+
+        try:
+            dig = cache.digest(self.code, self.raw, sig, ser)
+        except TypeError:  # sig or ser not bytes like so verify as usual
+            return (self._verify(sig=sig, ser=ser, key=self.raw))
+
+        if (result := cache.get(dig)) is None:
+            result = self._verify(sig=sig, ser=ser, key=self.raw)
+            cache.put(dig, result)
+
+        return result
 
 
     @staticmethod
@@ -1136,12 +1136,15 @@ class Counter:
 
     def _exfil(self, qb64b):
         """Extracts self.code and self.count from qualified base64 bytes qb64b
+        of type str or bytes or bytearray or memoryview
         """
         if not qb64b or len(qb64b) < 2:  # need more bytes
             raise ShortageError("Empty material, Need more characters.")
 
 
         first = qb64b[:2]  # extract first two char code selector
+        if isinstance(first, memoryview):
+            first = bytes(first)
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
         if first not in self.Hards:
@@ -1156,6 +1159,8 @@ class Counter:
             raise ShortageError("Need {} more characters.".format(hs - len(qb64b)))
 
         hard = qb64b[:hs]  # get hard code
+        if isinstance(hard, memoryview):
+            hard = bytes(hard)
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")  # decode converts bytearray/bytes to str
         if hard not in self._sizes:  # Sizes needs str not bytes
@@ -1171,6 +1176,8 @@ class Counter:
             raise ShortageError("Need {} more characters.".format(fs - len(qb64b)))
 
         count = qb64b[hs:fs]  # extract count chars
+        if isinstance(count, memoryview):
+            count = bytes(count)
         if hasattr(count, "decode"):
             count = count.decode("utf-8")
         count = b64ToInt(count)  # compute int count
@@ -5,7 +5,9 @@ keri.core.eventing module
 """
 import datetime
 import logging
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from dataclasses import asdict
 from urllib.parse import urlsplit
 from math import ceil
@@ -35,7 +37,7 @@ from .structing import SealEvent, SealLast, StateEstEvent
 from .indexing import Siger
 from .serdering import SerderKERI
 
-from ..db import Baser, dgKey, snKey
+from ..db import Baser, dgKey, snKey, tmKey
 from ..recording import (EndpointRecord, EventSourceRecord, KeyStateRecord,
                          LocationRecord, OobiRecord, ObservedRecord,
                          StateEERecord)
@@ -298,19 +300,16 @@ def deTransReceiptQuintuple(data, strip=False):
     return ediger, sprefixer, snumber, sdiger, siger
 
 
-def verifySigs(raw, sigers, verfers):
+def assignVerfers(sigers, verfers):
     """
-    Returns tuple of (vsigers, vindices) where:
-        vsigers is list  of unique verified sigers with assigned verfer
-        vindices is list of indices from those verified sigers
+    Returns list of unique sigers each with assigned verfer from verfers
+    based on siger index. Sigers whose index is too large are skipped.
 
-    The returned vsigers  and vindices may be used for threshold validation
-
-    Assigns appropriate verfer from verfers to each siger based on siger index
-    If no signatures verify then sigers and indices are empty
+    Does not modify in place passed in sigers list, but instead depends on
+    caller to use indices of returned sigers to modify its copy to filter out
+    unverifiable or duplicate sigers.
 
     Parameters:
-        raw (bytes) signed data
         sigers is list of indexed Siger instances (signatures)
         verfers is list of Verfer instance (public keys)
 
@@ -318,9 +317,7 @@ def verifySigs(raw, sigers, verfers):
     if sigers is None:
         sigers = []
     # Ensure no duplicate sigers by using set math on sigers' sigs otherwise
-    # indices count for threshold will be erroneous. Does not modify in place
-    # passed in sigers list, but instead depends on caller to use indices to
-    # modify its copy to filter out unverifiable or duplicate sigers
+    # indices count for threshold will be erroneous.
     usigs = oset([siger.qb64 for siger in sigers])
     usigers = [Siger(qb64=sig) for sig in usigs]
 
@@ -335,6 +332,28 @@ def verifySigs(raw, sigers, verfers):
         siger.verfer = verfers[siger.index]  # assign verfer
         uvsigers.append(siger)
 
+    return uvsigers
+
+
+def verifySigs(raw, sigers, verfers):
+    """
+    Returns tuple of (vsigers, vindices) where:
+        vsigers is list  of unique verified sigers with assigned verfer
+        vindices is list of indices from those verified sigers
+
+    The returned vsigers  and vindices may be used for threshold validation
+
+    Assigns appropriate verfer from verfers to each siger based on siger index
+    If no signatures verify then sigers and indices are empty
+
+    Parameters:
+        raw (bytes) signed data
+        sigers is list of indexed Siger instances (signatures)
+        verfers is list of Verfer instance (public keys)
+
+    """
+    uvsigers = assignVerfers(sigers, verfers)
+
     # create lists of unique verified signatures and indices
     vindices = []
     vsigers = []
@@ -346,6 +365,70 @@ def verifySigs(raw, sigers, verfers):
     return (vsigers, vindices)
 
 
+def verifyBatch(triples, workers=None):
+    """
+    Returns list of bool one per triple in triples where True means signature
+    verified. Verifies each (verfer, sig, ser) triple with verfer.verify(sig, ser).
+
+    When workers is greater than one the triples are split into one chunk per
+    worker and verified on a thread pool. The underlying libsodium and
+    cryptography verifiers release the GIL so the chunks verify in parallel.
+
+    Parameters:
+        triples (Iterable): of (verfer, sig, ser) triples where verfer is
+            Verfer instance of public key, sig is bytes of signature, and ser
+            is bytes of signed serialization
+        workers (int|None): number of worker threads. None or <= 1 means
+            verify serially in the calling thread.
+
+    """
+    triples = list(triples)
+    if not workers or workers <= 1 or len(triples) <= 1:
+        return [verfer.verify(sig, ser) for verfer, sig, ser in triples]
+
+    size = ceil(len(triples) / workers)  # one chunk per worker
+    chunks = [triples[i:i + size] for i in range(0, len(triples), size)]
+    with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+        results = pool.map(lambda chunk: [verfer.verify(sig, ser)
+                                          for verfer, sig, ser in chunk],
+                           chunks)
+        return [result for chunk in results for result in chunk]
+
+
+def verifySigsBatch(items, workers=None):
+    """
+    Returns list of (vsigers, vindices) tuples one per item in items each the
+    same as would be returned by verifySigs(raw, sigers, verfers) for that item.
+    Gathers all the (verfer, sig, raw) triples across items and verifies them
+    together with verifyBatch.
+
+    Parameters:
+        items (Iterable): of (raw, sigers, verfers) triples each as would be
+            provided to verifySigs
+        workers (int|None): number of worker threads. None or <= 1 means
+            verify serially in the calling thread.
+
+    """
+    items = list(items)
+    assigned = [assignVerfers(sigers, verfers) for raw, sigers, verfers in items]
+    triples = [(siger.verfer, siger.raw, raw)
+               for (raw, _, _), uvsigers in zip(items, assigned)
+               for siger in uvsigers]
+    results = iter(verifyBatch(triples, workers=workers))
+
+    verifieds = []
+    for uvsigers in assigned:
+        vindices = []
+        vsigers = []
+        for siger in uvsigers:
+            if next(results):
+                vindices.append(siger.index)
+                vsigers.append(siger)
+        verifieds.append((vsigers, vindices))
+
+    return verifieds
+
+
 def validateSigs(serder, sigers, verfers, tholder):
     """
     Validates signatures given by sigers using keys given by verfers on msg
@@ -2299,7 +2382,7 @@ class Kever:
 
                 psn = sner.num - 1  # use sn of prior event to fetch prior event
                 # fetch raw serialization of last inserted  event at psn
-                pdig = self.db.kels.getLast(keys=pre, on=psn)
+                pdig = self.db.lastDig(pre=pre, sn=psn)
                 if pdig is None:
                     raise ValidationError("Invalid recovery attempt: "
                                           "Bad sn = {} for event = {}."
@@ -2989,7 +3072,7 @@ class Kever:
             # get the dig of the delegating event. Using getKeLast ensures delegating
             #  event has not already been superceded
             # get dig of last delegating event purported at sn
-            raw = self.db.kels.getLast(keys=delpre, on=ssn)  # last means not disputed or superseded
+            raw = self.db.lastDig(pre=delpre, sn=ssn)  # last means not disputed or superseded
             if raw is None:  # no delegatint event yet. no index at key pre, sn
                 # Have to wait until delegating event at sn shows up in kel
                 # ToDo XXXX process  this cue of query to fetch delegating event from
@@ -3310,63 +3393,66 @@ class Kever:
         """
         local = True if local else False
         fn = None  # None means not a first seen log event so does not return an fn
-        dgkeys = (serder.pre, serder.said)
-        dgkey = dgKey(serder.preb, serder.saidb)
-        nowdater = Dater()  # now timestamp
-        self.db.dtss.put(keys=dgkey, val=nowdater)  # idempotent do not change dts if already
-        if sigers:
-            self.db.sigs.put(keys=dgkey, vals=sigers)  # idempotent
-        if wigers:
-            self.db.wigs.put(keys=dgkey, vals=wigers)
-        if wits:
-            self.db.wits.put(keys=dgkey, vals=[Prefixer(qb64=w) for w in wits])
-
-        self.db.evts.put(keys=(serder.pre, serder.said), val=serder)  # idempotent (maybe already excrowed)
-        # update event source
-
-        # delegation for authorized delegated or issued event
-        # when delnum and diger are provided they are only assured to be valid
-        # kever for event if kel is delegated and not locallyOwned
-        # and not locallyWitnessed as the validateDelegation is short circuited
-        # for non delegated kels, local controllers, and local witnesses.
-        # These checks prevent ddos via malicious source seal attachments.
-        # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
-        if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
-            and not self.locallyWitnessed(wits=wits) and delnum and diger):
-            self.db.aess.pin(keys=(serder.preb, serder.saidb), val=(Number(num=delnum.num, code=NumDex.Huge), diger))  # authorizer (delegator/issuer) event seal
-
-        if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
-            if local and not esr.local:  # local overwrites prexisting remote
-                esr.local = local
-                self.db.esrs.pin(keys=dgkeys, val=esr)
-            # otherwise don't change
-        else:  # not preexisting so put
-            esr = EventSourceRecord(local=local)
-            self.db.esrs.put(keys=dgkeys, val=esr)
-
-        pre = self.prefixer.qb64
-        if first:  # append event dig to first seen database in order
-            fn = self.db.fels.append(keys=serder.preb, val=serder.saidb)
-            if firner and fn != firner.sn:  # cloned replay but replay fn not match
-                if self.cues is not None:  # cue to notice BadCloneFN
-                    self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
-                                        fn=fn, firner=firner, dater=dater))
-                logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
-                            "ordinal fn %s and clone fn %s, said=%s",
-                            serder.preb, fn, firner.sn, serder.said)
-                logger.debug("Event body=\n%s\n", serder.pretty())
-            if dater:  # cloned replay use original's dts from dater
-                nowdater = dater
-            self.db.dtss.pin(keys=dgkey, val=nowdater)  # first seen so set dts to now
-            self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
-            logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
-                         pre[:4], pre[-4:], serder.ilk, fn, serder.said,
-                         serder.pre, nowdater.dts)
+        with self.db.txn():  # commit all logs of event at once
+            dgkeys = (serder.pre, serder.said)
+            dgkey = dgKey(serder.preb, serder.saidb)
+            nowdater = Dater()  # now timestamp
+            self.db.dtss.put(keys=dgkey, val=nowdater)  # idempotent do not change dts if already
+            if sigers:
+                self.db.sigs.put(keys=dgkey, vals=sigers)  # idempotent
+            if wigers:
+                self.db.wigs.put(keys=dgkey, vals=wigers)
+            if wits:
+                self.db.wits.put(keys=dgkey, vals=[Prefixer(qb64=w) for w in wits])
+
+            self.db.evts.put(keys=(serder.pre, serder.said), val=serder)  # idempotent (maybe already excrowed)
+            # update event source
+
+            # delegation for authorized delegated or issued event
+            # when delnum and diger are provided they are only assured to be valid
+            # kever for event if kel is delegated and not locallyOwned
+            # and not locallyWitnessed as the validateDelegation is short circuited
+            # for non delegated kels, local controllers, and local witnesses.
+            # These checks prevent ddos via malicious source seal attachments.
+            # MUST NOT setAes if not delegated or locallyOwned or locallyWitnessed
+            if (self.delpre and not serder.ilk == Ilks.ixn and not self.locallyOwned()
+                and not self.locallyWitnessed(wits=wits) and delnum and diger):
+                self.db.aess.pin(keys=(serder.preb, serder.saidb), val=(Number(num=delnum.num, code=NumDex.Huge), diger))  # authorizer (delegator/issuer) event seal
+
+            if esr := self.db.esrs.get(keys=dgkeys):  # preexisting esr
+                if local and not esr.local:  # local overwrites prexisting remote
+                    esr.local = local
+                    self.db.esrs.pin(keys=dgkeys, val=esr)
+                # otherwise don't change
+            else:  # not preexisting so put
+                esr = EventSourceRecord(local=local)
+                self.db.esrs.put(keys=dgkeys, val=esr)
+
+            pre = self.prefixer.qb64
+            if first:  # append event dig to first seen database in order
+                fn = self.db.fels.append(keys=serder.preb, val=serder.saidb)
+                if firner and fn != firner.sn:  # cloned replay but replay fn not match
+                    if self.cues is not None:  # cue to notice BadCloneFN
+                        self.cues.push(dict(kin="noticeBadCloneFN", serder=serder,
+                                            fn=fn, firner=firner, dater=dater))
+                    logger.info("Kever: Mismatch Cloned Replay FN: %s First seen "
+                                "ordinal fn %s and clone fn %s, said=%s",
+                                serder.preb, fn, firner.sn, serder.said)
+                    logger.debug("Event body=\n%s\n", serder.pretty())
+                if dater:  # cloned replay use original's dts from dater
+                    nowdater = dater
+                self.db.dtss.pin(keys=dgkey, val=nowdater)  # first seen so set dts to now
+                self.db.fons.pin(keys=dgkey, val=Seqner(sn=fn))
+                logger.debug("AID %s...%s: First seen %s at sn=%s valid event SAID=%s for %s at %s",
+                             pre[:4], pre[-4:], serder.ilk, fn, serder.said,
+                             serder.pre, nowdater.dts)
+                logger.debug("Event Body=\n%s\n", serder.pretty())
+            added = self.db.kels.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+            self.db.indexTail(serder, fn=fn, last=added)  # sn and tail indexes
+            self.db.indexSeals(serder)  # anchored seal index for seal lookups
+            logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
+                        pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
             logger.debug("Event Body=\n%s\n", serder.pretty())
-        self.db.kels.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
-        logger.info("AID %s...%s: Added to KEL %s at sn=%s valid event SAID=%s",
-                    pre[:4], pre[-4:], serder.ilk, serder.sn, serder.said)
-        logger.debug("Event Body=\n%s\n", serder.pretty())
         return (fn, nowdater.dts)  # (fn int, dts str) if first else (None, dts str)
 
 
@@ -3483,8 +3569,8 @@ class Kever:
             esr = EventSourceRecord(local=local)
             self.db.esrs.put(keys=dgkey, val=esr)
 
-        snkey = snKey(serder.preb, serder.sn)
         self.db.pses.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        self.db.indexEscrow("pses", serder.pre, serder.sn, serder.said)
         logger.debug("Kever: Escrowed partially signed or delegated event = \n%s\n", serder.pretty())
 
 
@@ -3529,6 +3615,7 @@ class Kever:
 
         logger.trace("Kever state: Escrowed partially witnessed event = %s", serder.said)
         logger.trace("Event Body=\n%s\n", serder.pretty())
+        self.db.indexEscrow("pwes", serder.pre, serder.sn, serder.said)
         return self.db.pwes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
 
 
@@ -3593,6 +3680,7 @@ class Kever:
             self.db.esrs.put(keys=dgkey, val=esr)
 
         logger.debug(f"Kever: Escrowed partially delegated event=\n%s\n", serder.pretty())
+        self.db.indexEscrow("pdes", serder.pre, serder.sn, serder.said)
         return self.db.pdes.add(keys=serder.pre, on=serder.sn, val=serder.said)
 
 
@@ -3800,6 +3888,19 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+        indexed (bool): True means event driven escrow processing so each
+                .processEscrows pass only retries escrowed entries of the
+                prefixes in .wakes, with a full sweep every .SweepPeriod
+                seconds for timeouts. False means full sweep every pass.
+        wakes (oset): prefixes woken since last escrow pass by a KEL advance,
+                a receipt, an anchored delegation seal, or a new or merged
+                escrow entry
+        escrowing (bool): True while an escrow pass is in progress so that
+                entries re-escrowed by their own retry do not wake again
+        swept (datetime|None): time of last full escrow sweep if any
+        dups (OrderedDict): LRU of raw of up to .DupCap recently accepted
+                events keyed by (pre, said) so that resent duplicates are
+                recognized before their SAIDs are verified again
 
 
     Properties:
@@ -3810,18 +3911,21 @@ class Kevery:
 
     """
     TimeoutOOE = 1200  # seconds to timeout out of order escrows
-    TimeoutPSE = 3600  # seconds to timeout partially signed or delegated escrows
+    TimeoutPSE = 3600  # seconds to timeout partially signed escrows
     TimeoutPWE = 3600  # seconds to timeout partially witnessed escrows
+    TimeoutPDE = 3600  # seconds to timeout partially delegated escrows
     TimeoutLDE = 3600  # seconds to timeout likely duplicitous escrows
     TimeoutUWE = 3600  # seconds to timeout unverified receipt escrows
     TimeoutURE = 3600  # seconds to timeout unverified receipt escrows
     TimeoutVRE = 3600  # seconds to timeout unverified transferable receipt escrows
     TimeoutKSN = 3600  # seconds to timeout key state notice message escrows
     TimeoutQNF = 300   # seconds to timeout query not found escrows
+    SweepPeriod = 60  # seconds between full escrow sweeps when indexed
+    DupCap = 1024  # max recently accepted events in .dups duplicate LRU
 
     def __init__(self, *, cues=None, db=None, rvy=None, exc=None, tvy=None,
                  kramer=None, lax=True, local=False, cloned=False, direct=True,
-                 check=False):
+                 check=False, indexed=False):
         """
         Initialize instance:
 
@@ -3847,6 +3951,9 @@ class Kevery:
                 non-idempotent way. Useful for reinitializing the Kevers from
                 a persisted KEL without updating non-idempotent first seen .fels
                 and timestamps.
+            indexed (bool): True means event driven escrow processing of only
+                woken prefixes with periodic full sweep.
+                False means full sweep of all escrows every pass.
         """
         self.cues = cues if cues is not None else decking.Deck()  # subclass of deque
         if db is None:
@@ -3865,6 +3972,11 @@ class Kevery:
         self.cloned = True if cloned else False  # process as cloned
         self.direct = True if direct else False  # process as direct mode
         self.check = True if check else False  # process as check mode
+        self.indexed = True if indexed else False  # event driven escrows
+        self.wakes = oset()  # prefixes whose escrows to retry on next pass
+        self.escrowing = False  # True while escrow pass in progress
+        self.swept = None  # datetime of last full escrow sweep
+        self.dups = OrderedDict()  # LRU of raw of recently accepted events
 
 
     @property
@@ -3963,19 +4075,25 @@ class Kevery:
                 # raises exception if problem
                 # otherwise adds to KEL
                 # create kever from serder
-                kever = Kever(serder=serder,
-                              sigers=sigers,
-                              wigers=wigers,
-                              db=self.db,
-                              delseqner=delnum,
-                              deldiger=deldiger,
-                              firner=firner if self.cloned else None,
-                              dater=dater if self.cloned else None,
-                              cues=self.cues,
-                              eager=eager,
-                              local=local,
-                              check=self.check)
+                try:
+                    kever = Kever(serder=serder,
+                                  sigers=sigers,
+                                  wigers=wigers,
+                                  db=self.db,
+                                  delseqner=delnum,
+                                  deldiger=deldiger,
+                                  firner=firner if self.cloned else None,
+                                  dater=dater if self.cloned else None,
+                                  cues=self.cues,
+                                  eager=eager,
+                                  local=local,
+                                  check=self.check)
+                except (MissingSignatureError, MissingWitnessSignatureError,
+                        MissingDelegationError):  # escrowed or merged into escrow
+                    self.escrowed(pre)
+                    raise
                 self.kevers[pre] = kever  # not exception so add to kevers
+                self.remember(serder)
 
                 # At this point  the inceptive event (icp or dip) given by serder
                 # together with its attachments has been accepted as valid with finality.
@@ -3999,6 +4117,8 @@ class Kevery:
                     # one receipt is generated not two
                     self.cues.push(dict(kin="witness", serder=serder))
 
+                self.wake(serder)  # retry escrows that may depend on this event
+
 
             else:  # not inception so can't verify sigs etc, add to out-of-order escrow
                 self.escrowOOEvent(serder=serder, sigers=sigers,
@@ -4013,6 +4133,9 @@ class Kevery:
                 # check if duplicate of existing inception event since est is icp
                 eserder = self.fetchEstEvent(pre, sn)  # latest est evt wrt sn
                 if eserder.said == said:  # event is a duplicate but not duplicitous
+                    sigers, wigers = self.unlogged(serder, sigers, wigers)
+                    if not (sigers or wigers):  # nothing new so skip verification
+                        return
                     # may have attached valid signature not yet logged
                     # raises ValidationError if no valid sig
                     kever = self.kevers[pre]  # get key state
@@ -4031,6 +4154,7 @@ class Kevery:
                         # Not first seen version of event so ignore return
                         # idempotent update db logs
                         kever.logEvent(serder, sigers=sigers, wigers=wigers)
+                        self.wake(serder)  # late sigs or wigs may fulfill escrows
 
                 else:  # escrow likely duplicitous event
                     self.escrowLDEvent(serder=serder, sigers=sigers)
@@ -4061,11 +4185,17 @@ class Kevery:
                     # verify signatures etc and update state if valid
                     # raise exception if problem.
                     # Otherwise adds to KELs
-                    kever.update(serder=serder, sigers=sigers, wigers=wigers,
-                                 delseqner=delnum, deldiger=deldiger,
-                                 firner=firner if self.cloned else None,
-                                 dater=dater if self.cloned else None,
-                                 eager=eager, local=local, check=self.check)
+                    try:
+                        kever.update(serder=serder, sigers=sigers, wigers=wigers,
+                                     delseqner=delnum, deldiger=deldiger,
+                                     firner=firner if self.cloned else None,
+                                     dater=dater if self.cloned else None,
+                                     eager=eager, local=local, check=self.check)
+                    except (MissingSignatureError, MissingWitnessSignatureError,
+                            MissingDelegationError):  # escrowed or merged into escrow
+                        self.escrowed(pre)
+                        raise
+                    self.remember(serder)
 
                     # At this point the non-inceptive event (rot, drt, or ixn)
                     # given by serder together with its attachments has been
@@ -4090,11 +4220,16 @@ class Kevery:
                         # one receipt is generated not two
                         self.cues.push(dict(kin="witness", serder=serder))
 
+                    self.wake(serder)  # retry escrows that may depend on this event
+
 
                 else:  # maybe duplicitous
                     # check if duplicate of existing valid accepted event
-                    ddig = self.db.kels.getLast(keys=pre, on=sn)
+                    ddig = self.db.lastDig(pre=pre, sn=sn)
                     if ddig == said:  # event is a duplicate but not duplicitous
+                        sigers, wigers = self.unlogged(serder, sigers, wigers)
+                        if not (sigers or wigers):  # nothing new so skip verification
+                            return
                         eserder = self.fetchEstEvent(pre, sn)  # latest est event wrt sn
                         # may have attached valid signature not yet logged
                         # raises ValidationError if no valid sig
@@ -4116,6 +4251,7 @@ class Kevery:
                             # Not first seen version of event so ignore return
                             # idempotent update db logs
                             kever.logEvent(serder, sigers=sigers, wigers=wigers)  # idempotent update db logs
+                            self.wake(serder)  # late sigs or wigs may fulfill escrows
 
                     else:  # escrow likely duplicitous event
                         self.escrowLDEvent(serder=serder, sigers=sigers)
@@ -4162,9 +4298,10 @@ class Kevery:
         sn = serder.sn
 
         # Only accept receipt if for last seen version of event at sn
-        ldig = self.db.kels.getLast(keys=pre, on=sn) # retrieve dig of last event at sn.
+        ldig = self.db.lastDig(pre=pre, sn=sn) # retrieve dig of last event at sn.
 
         if ldig is not None:  # verify digs match
+            self.wakes.add(pre)  # receipts may fulfill partially witnessed escrows
             # retrieve event by dig assumes if ldig is not None that event exists at ldig
             dgkey = dgKey(serder.preb, serder.saidb)
             lserder = self.db.evts.get(keys=(serder.preb, serder.saidb))  # retrieve receipted event at dig
@@ -4242,7 +4379,7 @@ class Kevery:
 
                 # receipted event in db so attempt to get receipter est evt
                 # retrieve dig of last event at sn of est evt of receiptor.
-                sdig = self.db.kels.getLast(keys=sprefixer.qb64b, on=snumber.sn)
+                sdig = self.db.lastDig(pre=sprefixer.qb64b, sn=snumber.sn)
                 if sdig is None:
                     # receiptor's est event not yet in receiptors's KEL
                     # so need cue to discover est evt KEL for receipter from watcher etc
@@ -4449,7 +4586,7 @@ class Kevery:
         if firner:
             ldig = self.db.fels.get(keys=pre, on=firner.sn)
         else:
-            ldig = self.db.kels.getLast(keys=pre, on=sn)  # retrieve dig of last event at sn.
+            ldig = self.db.lastDig(pre=pre, sn=sn)  # retrieve dig of last event at sn.
 
         if ldig is None:  # escrow because event does not yet exist in database
             # # take advantage of fact that receipt and event have same pre, sn fields
@@ -4464,6 +4601,7 @@ class Kevery:
             raise ValidationError("Mismatch replay event at sn = {} with db."
                                   "".format(ked["s"]))
 
+        self.wakes.add(pre)  # receipts may fulfill partially witnessed escrows
         # process each couple to verify sig and write to db
         for cigar in cigars:
             if cigar.verfer.transferable:  # skip transferable verfers
@@ -4533,7 +4671,7 @@ class Kevery:
             ldig = self.db.fels.get(keys=pre, on=firner.sn)
         else:
             # Only accept receipt if for last seen version of receipted event at sn
-            ldig = self.db.kels.getLast(keys=pre, on=sn)  # retrieve dig of last event at sn.
+            ldig = self.db.lastDig(pre=pre, sn=sn)  # retrieve dig of last event at sn.
 
         for sprefixer, snumber, saider, siger in trqs:  # iterate over each trq
             if not self.lax and sprefixer.qb64 in self.prefixes:  # own trans receipt quadruple (chit)
@@ -4556,7 +4694,7 @@ class Kevery:
                                           "".format(ked["s"]))
 
                 # retrieve dig of last event at sn of receipter.
-                sdig = self.db.kels.getLast(keys=sprefixer.qb64b, on=snumber.sn)
+                sdig = self.db.lastDig(pre=sprefixer.qb64b, sn=snumber.sn)
                 if sdig is None:
                     # receipter's est event not yet in receipter's KEL
                     # receipter's seal event not in receipter's KEL
@@ -4944,7 +5082,7 @@ class Kevery:
         if not accepted:
             raise UnverifiedReplyError(f"Unverified key state notice reply. {serder.ked}")
 
-        ldig = self.db.kels.getLast(keys=pre, on=sn)  # retrieve dig of last event at sn.
+        ldig = self.db.lastDig(pre=pre, sn=sn)  # retrieve dig of last event at sn.
         ksr_diger = Diger(qb64=ksr.d)
 
         # Only accept key state if for last seen version of event at sn
@@ -5178,8 +5316,10 @@ class Kevery:
                     raise QueryNotFoundError(msg)
 
             msgs = list()  # outgoing messages
-            for msg in self.db.clonePreIter(pre=pre, fn=fn):
-                msgs.append(msg)
+            tail = self.db.tail(pre)  # (sn, fn, dig) of latest first seen event
+            if tail is None or fn <= tail[1]:  # otherwise nothing at or after fn
+                for msg in self.db.clonePreIter(pre=pre, fn=fn):
+                    msgs.append(msg)
 
             if kever.delpre:
                 cloner = self.db.clonePreIter(pre=kever.delpre, fn=0)  # create iterator at 0
@@ -5255,7 +5395,7 @@ class Kevery:
 
         found = False
         while not found:
-            dig = self.db.kels.getLast(keys=pre, on=sn)
+            dig = self.db.lastDig(pre=pre, sn=sn)
             if not dig:
                 return None
 
@@ -5345,6 +5485,8 @@ class Kevery:
         if delnum and diger:
             self.db.udes.put(keys=dgkey, val=(delnum, diger))  # idempotent
         self.db.ooes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        self.db.indexEscrow("ooes", serder.pre, serder.sn, serder.said)
+        self.escrowed(serder.pre)
         # log escrowed
         logger.debug("Kevery process: escrowed out of order event=\n%s", serder.pretty())
 
@@ -5367,6 +5509,7 @@ class Kevery:
 
         for cigar in cigars:
             self.db.rcts.add(keys=(prefixer.qb64, serder.said), val=(cigar.verfer, cigar))
+        self.escrowed(prefixer.qb64)
 
         # log escrowed
         logger.trace("Kevery: escrowed query not found event = %s", serder.said)
@@ -5398,7 +5541,9 @@ class Kevery:
         self.db.dtss.put(keys=dgkey, val=Dater())
         self.db.sigs.put(keys=dgkey, vals=sigers)
         self.db.evts.put(keys=(serder.preb, serder.saidb), val=serder)
-        self.db.addLde(snKey(serder.preb, serder.sn), serder.saidb)
+        self.db.ldes.add(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        self.db.indexEscrow("ldes", serder.pre, serder.sn, serder.said)
+        self.escrowed(serder.pre)
         # log duplicitous
         logger.debug("Kevery process: escrowed likely duplicitous event=\n%s\n", serder.pretty())
 
@@ -5433,6 +5578,7 @@ class Kevery:
             # if wiger.verfer.transferable:  # skip transferable verfers
             # continue  # skip invalid triplets
             self.db.uwes.add(keys=serder.preb, on=serder.sn, val=(said, wiger.qb64))
+        self.escrowed(serder.pre)
 
         # log escrowed
         logger.debug("Kevery process: escrowed unverified witness indexed receipt"
@@ -5469,6 +5615,7 @@ class Kevery:
                 cigar
             )
             self.db.ures.add(keys=(serder.pre, Number(num=serder.sn, code=NumDex.Huge).qb64), val=trituple)
+        self.escrowed(serder.pre)
         # log escrowed
         logger.debug("Kevery process: escrowed unverified receipt of pre= %s "
                      " sn=%x dig=%s", serder.pre, serder.sn, said)
@@ -5517,6 +5664,7 @@ class Kevery:
                     siger,
                 )
                 self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
+            self.escrowed(serder.pre)
             # log escrowed
             logger.debug("Kevery process: escrowed unverified transferable receipt "
                          "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
@@ -5564,6 +5712,7 @@ class Kevery:
                 siger,
             )
             self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
+        self.escrowed(serder.pre)
         # log escrowed
         logger.debug("Kevery process: escrowed unverified transferable receipt "
                     "of pre=%s sn=%x dig=%s by pre=%s", serder.pre,
@@ -5602,25 +5751,207 @@ class Kevery:
             siger,                              # Siger
         )
         self.db.vres.add(keys=snKey(serder.preb, serder.sn), val=quintuple)
+        self.escrowed(serder.pre)
         # log escrowed
         logger.debug("Kevery process: escrowed unverified transferabe validator "
                      "receipt of pre= %s sn=%x dig=%s", serder.pre, serder.sn,
                      serder.said)
 
-    def processEscrows(self):
+    def remember(self, serder):
         """
-        Iterate throush escrows and process any that may now be finalized
+        Adds accepted event serder to duplicate LRU .dups evicting the least
+        recently used entry when over .DupCap.
+
+        Parameters:
+            serder (SerderKERI): accepted event
+        """
+        key = (serder.pre, serder.said)
+        self.dups[key] = bytes(serder.raw)
+        self.dups.move_to_end(key)
+        while len(self.dups) > self.DupCap:
+            self.dups.popitem(last=False)
+
+
+    def accepted(self, serder):
+        """
+        Returns True if serder is byte identical to the last accepted event at
+        its sn so its SAID(s) were already verified and need not be verified
+        again. Checks LRU .dups of recently accepted events first and then
+        the database. Safe to call on serder whose SAID(s) are not yet verified
+        since only an exact raw match returns True.
+
+        Parameters:
+            serder (SerderKERI): event possibly not yet verified
+        """
+        try:
+            key = (serder.pre, serder.said)
+            if (raw := self.dups.get(key)) is not None:
+                self.dups.move_to_end(key)
+                return raw == serder.raw
+
+            if (serder.ilk not in (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt)
+                    or self.db.lastDig(pre=serder.pre, sn=serder.sn) != serder.said):
+                return False
+        except Exception:  # malformed so let normal verification reject it
+            return False
+
+        if (eserder := self.db.evts.get(keys=key)) is None or eserder.raw != serder.raw:
+            return False
+        self.remember(eserder)
+        return True
+
+
+    def unlogged(self, serder, sigers=None, wigers=None):
+        """
+        Returns duple (sigers, wigers) of only those attached signatures of
+        duplicate event serder that are not already logged in .db.sigs and
+        .db.wigs so that resent duplicates only verify and merge new ones.
+
+        Parameters:
+            serder (SerderKERI): duplicate of accepted event
+            sigers (list[Siger]|None): attached controller indexed signatures
+            wigers (list[Siger]|None): attached witness indexed signatures
+        """
+        dgkey = dgKey(serder.preb, serder.saidb)
+        if sigers:
+            logged = {siger.qb64b for siger in self.db.sigs.get(keys=dgkey)}
+            sigers = [siger for siger in sigers if siger.qb64b not in logged]
+        if wigers:
+            logged = {wiger.qb64b for wiger in self.db.wigs.get(keys=dgkey)}
+            wigers = [wiger for wiger in wigers if wiger.qb64b not in logged]
+        return (sigers or [], wigers or [])
+
+
+    def wake(self, serder):
+        """
+        Wakes escrowed entries of prefix of event serder and of any delegated
+        prefixes whose events serder anchors with seals so that the next
+        indexed escrow pass retries them.
+
+        Parameters:
+            serder (SerderKERI): accepted event
+        """
+        self.wakes.add(serder.pre)
+        for seal in (serder.seals or []):
+            if isinstance(seal, dict) and "i" in seal:
+                self.wakes.add(seal["i"])
+
+
+    def escrowed(self, pre):
+        """
+        Wakes prefix pre of an entry just escrowed or of late signatures or
+        receipts just merged into an existing escrowed entry so that the next
+        indexed escrow pass retries it. Not while .escrowing since retries
+        re-escrow their own entries which would otherwise wake every pass.
+
+        Parameters:
+            pre (str): qb64 prefix of escrowed entry
+        """
+        if not self.escrowing:
+            self.wakes.add(pre)
+
+
+    def escrowIter(self, escrow, pres=None, top=False):
+        """
+        Returns iterator over items of escrow database escrow limited to
+        branches of prefixes in pres.
 
         Parameters:
+            escrow (SuberBase): escrow database keyed by prefix first
+            pres (Iterable|None): prefixes of branches to iterate.
+                None means iterate whole escrow.
+            top (bool): True means iterate with .getTopItemIter
+                False means iterate with .getAllItemIter
+        """
+        if pres is None:
+            return escrow.getTopItemIter() if top else escrow.getAllItemIter(keys=b'')
+        if top:
+            return chain.from_iterable(escrow.getTopItemIter(keys=(pre, ""))
+                                       for pre in pres)
+        return chain.from_iterable(escrow.getAllItemIter(keys=pre) for pre in pres)
+
+
+    def pruneEscrows(self):
         """
+        Remove stale entries from the .ooes, .pses, .pwes, .pdes, and .ldes
+        escrows by walking only the expired head of each escrow's branch of
+        the expiry ordered index .db.exes. Cost is proportional to the number
+        of expired entries not the number of escrowed entries.
+
+        An index entry outlives its escrow entry once the event is unescrowed
+        so the escrow entry is only removed when it is still present.
+
+        Returns:
+            count (int): number of stale escrow entries removed
+        """
+        dtnow = helping.nowUTC()
+        count = 0
+        for escrow, timeout in (("ooes", self.TimeoutOOE),
+                                ("pses", self.TimeoutPSE),
+                                ("pwes", self.TimeoutPWE),
+                                ("pdes", self.TimeoutPDE),
+                                ("ldes", self.TimeoutLDE)):
+            cutoff = tmKey(dtnow - datetime.timedelta(seconds=timeout))
+            expired = []
+            for keys, val in self.db.exes.getTopItemIter(keys=(escrow, "")):
+                if keys[1] >= cutoff:  # rest of branch is not yet expired
+                    break
+                expired.append((keys, val))
+
+            edb = getattr(self.db, escrow)
+            for (_, stamp, pre), (number, diger) in expired:
+                if edb.rem(keys=pre, on=number.num, val=diger.qb64):
+                    if escrow == "pdes":  # remove source seal escrow if any
+                        self.db.udes.rem(keys=dgKey(pre, diger.qb64))
+                    count += 1
+                    logger.trace("Kevery: pruned stale %s escrow at dig = %s",
+                                 escrow, diger.qb64)
+                self.db.exes.rem(keys=(escrow, stamp, pre), val=(number, diger))
+
+        return count
+
+
+    def processEscrows(self, full=None):
+        """
+        Iterate throush escrows and process any that may now be finalized
+
+        When .indexed then only retries escrowed entries of the prefixes in
+        .wakes woken since the last pass and only sweeps all escrows once every
+        .SweepPeriod seconds so that stale escrows still time out.
+
+        Stale escrows are first pruned via the expiry ordered index so that
+        retries only see live escrowed entries.
+
+        Parameters:
+            full (bool|None): True means full sweep of all escrows.
+                False means only retry escrows of woken prefixes.
+                None means full sweep unless .indexed and sweep not due yet.
+        """
+        self.pruneEscrows()
+
+        if full is None:
+            full = (not self.indexed or self.swept is None or
+                    (helping.nowUTC() - self.swept) >
+                    datetime.timedelta(seconds=self.SweepPeriod))
+
+        if full:
+            pres = None
+            self.swept = helping.nowUTC()
+        elif not self.wakes:
+            return  # nothing changed so nothing to retry
+        else:
+            pres = list(self.wakes)
+        self.wakes.clear()  # wakes during this pass are retried next pass
+
+        self.escrowing = True
         try:
-            self.processEscrowOutOfOrders()
-            self.processEscrowUnverWitness()
-            self.processEscrowUnverNonTrans()
+            self.processEscrowOutOfOrders(pres=pres)
+            self.processEscrowUnverWitness(pres=pres)
+            self.processEscrowUnverNonTrans(pres=pres)
             self.processEscrowUnverTrans()
-            self.processEscrowPartialDels()
-            self.processEscrowPartialWigs()
-            self.processEscrowPartialSigs()
+            self.processEscrowPartialDels(pres=pres)
+            self.processEscrowPartialWigs(pres=pres)
+            self.processEscrowPartialSigs(pres=pres)
             self.processEscrowDuplicitous()
             self.processQueryNotFound()
 
@@ -5630,13 +5961,20 @@ class Kevery:
                 logger.exception("Kevery other escrow process error: %s\n", ex.args[0])
             raise ex
 
-    def processEscrowOutOfOrders(self):
+        finally:
+            self.escrowing = False
+
+    def processEscrowOutOfOrders(self, pres=None):
         """
         Process events escrowed by Kever that are recieved out-of-order.
         An event is out of order if its prior event has not been accepted into its KEL.
         Without the prior event there is no way to know the key state and therefore no way
         to verify signatures on the out-of-order event.
 
+        Parameters:
+            pres (Iterable|None): prefixes whose escrowed entries to retry.
+                None means retry all escrowed entries.
+
         Escrowed items are indexed in database table keyed by prefix and
         sn with duplicates given by different dig inserted in insertion order.
         This allows FIFO processing of events with same prefix and sn but different
@@ -5668,7 +6006,7 @@ class Kevery:
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
         """
-        for pre, sn, edig in self.db.ooes.getAllItemIter():
+        for pre, sn, edig in self.escrowIter(self.db.ooes, pres=pres):
 
             if isinstance(pre, (tuple, list)):
                 pre = pre[0]
@@ -5682,23 +6020,6 @@ class Kevery:
                     logger.trace("Kevery unescrow error: %s", msg)
                     raise ValidationError(msg)
 
-                 # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"OOO Missing escrowed event datetime at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutOOE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"OOO Stale event escrow at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
                 # get the escrowed event using edig
                 if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
                     # no event so raise ValidationError which unescrows below
@@ -5758,12 +6079,16 @@ class Kevery:
                 logger.debug("Event=\n%s\n", eserder.pretty())
 
 
-    def processEscrowPartialSigs(self):
+    def processEscrowPartialSigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled,
         either due to missing signatures or missing dependent events like a
         delegating event.  But event has at least one verified signature.
 
+        Parameters:
+            pres (Iterable|None): prefixes whose escrowed entries to retry.
+                None means retry all escrowed entries.
+
         Escrowed items are indexed in database table keyed by prefix and
         sequence number with duplicates inserted in insertion order. This allows
         FIFO processing of events with same prefix and sn.
@@ -5795,7 +6120,7 @@ class Kevery:
 
         #key = ekey = b''  # both start same. when not same means escrows found
         #while True:  # break when done
-        for pre, sn, edig in self.db.pses.getAllItemIter():
+        for pre, sn, edig in self.escrowIter(self.db.pses, pres=pres):
             eserder = None
             try:
                 if isinstance(pre, (tuple, list)):
@@ -5808,23 +6133,6 @@ class Kevery:
                     logger.info("Kevery unescrow error: %s", msg)
                     raise ValidationError(msg)
 
-                # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"PSE Missing escrowed event datetime at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPSE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"PSE Stale event escrow at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
                 # get the escrowed event using edig
                 if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
                     # no event so so raise ValidationError which unescrows below
@@ -5913,12 +6221,16 @@ class Kevery:
                 #break
             #key = ekey  # setup next while iteration, with key after ekey
 
-    def processEscrowPartialWigs(self):
+    def processEscrowPartialWigs(self, pres=None):
         """
         Process events escrowed by Kever that were only partially fulfilled
         due to missing signatures from witnesses. Events only make into this
         escrow after fully signed and if delegated, delegation has been verified.
 
+        Parameters:
+            pres (Iterable|None): prefixes whose escrowed entries to retry.
+                None means retry all escrowed entries.
+
         Escrowed items in .pwes are indexed in database table keyed by prefix and
         sequence number with duplicates inserted in insertion order. This allows
         FIFO processing of events with same prefix and sn.
@@ -5949,7 +6261,7 @@ class Kevery:
                         Process event as if it came in over the wire
                         If successful then remove from escrow table
         """
-        for pre, sn, edig in self.db.pwes.getAllItemIter(keys=b''):
+        for pre, sn, edig in self.escrowIter(self.db.pwes, pres=pres):
             try:
                 if isinstance(pre, (tuple, list)):
                     pre = pre[0]
@@ -5961,23 +6273,6 @@ class Kevery:
                     logger.info("Kevery unescrow error: %s", msg)
                     raise ValidationError(msg)
 
-                # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"PWE Missing escrowed event datetime at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"PWE Stale event escrow at dig = {edig.decode()}"
-                    logger.trace("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
                 # get the escrowed event using edig
                 if (eserder := self.db.evts.get((pre, bytes(edig)))) is None:
                     # no event so so raise ValidationError which unescrows below
@@ -6064,13 +6359,17 @@ class Kevery:
                 logger.debug("Event=\n%s\n", eserder.pretty())
 
 
-    def processEscrowPartialDels(self):
+    def processEscrowPartialDels(self, pres=None):
         """
         Process delgated events escrowed by Kever that were only partially fulfilled
         due to missing or unverified delegation seals from delegators.
         Events only make into this escrow after fully signed and if witnessed
         fully witnessed.
 
+        Parameters:
+            pres (Iterable|None): prefixes whose escrowed entries to retry.
+                None means retry all escrowed entries.
+
         db.pdes is an instance of subing.IoSetSuber and uses instance methods
         for access to the underlying database.
         Escrowed items in .pdes are indexed in database table keyed by prefix and
@@ -6091,7 +6390,7 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        for (epre,), esn, edig in self.db.pdes.getAllItemIter(keys=b''):
+        for (epre,), esn, edig in self.escrowIter(self.db.pdes, pres=pres):
             try:
                 dgkey = dgKey(epre, edig)
                 if not (esr := self.db.esrs.get(keys=dgkey)):  # get event source, otherwise error
@@ -6100,23 +6399,6 @@ class Kevery:
                     logger.info("Kevery unescrow error: %s", msg)
                     raise ValidationError(msg)
 
-                # check date if expired then remove escrow.
-                dater = self.db.dtss.get(keys=dgkey)
-                if dater is None:  # no datetime stored
-                    # no date time so raise ValidationError which unescrows below
-                    msg = f"PDE Missing escrowed event datetime at dig = {edig}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
-                # do date math here and discard if stale
-                dtnow = helping.nowUTC()
-                dte = dater.datetime
-                if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutPWE):
-                    # escrow stale so raise ValidationError which unescrows below
-                    msg = f"PDE Stale event escrow at dig = {edig}"
-                    logger.info("Kevery unescrow error: %s", msg)
-                    raise ValidationError(msg)
-
                 # get the escrowed event using edig
                 if (eserder := self.db.evts.get(keys=(epre, edig))) is None:
                     # no event so so raise ValidationError which unescrows below
@@ -6221,7 +6503,7 @@ class Kevery:
                 logger.debug("Event=\n%s\n", eserder.pretty())
 
 
-    def processEscrowUnverWitness(self):
+    def processEscrowUnverWitness(self, pres=None):
         """
         Process escrowed unverified event receipts from witness receiptors
         A receipt is unverified if the associated event has not been accepted
@@ -6230,6 +6512,10 @@ class Kevery:
         signatures neither to look up the witness list to verify the indexed
         signatures.
 
+        Parameters:
+            pres (Iterable|None): prefixes whose escrowed entries to retry.
+                None means retry all escrowed entries.
+
         The escrow is a couple with edig+wig where:
             edig is receipted event digest
             wig is witness indexed signature by key-pair derived from witness
@@ -6269,7 +6555,7 @@ class Kevery:
                         If successful then remove from escrow table
         """
         #for (pre, snh), (rdiger, wiger) in self.db.uwes.getTopItemIter():
-        for (pre, ), sn, (rdig, wig) in self.db.uwes.getTopItemIter():
+        for (pre, ), sn, (rdig, wig) in self.escrowIter(self.db.uwes, pres=pres, top=True):
             try:
                 #rdigerBytes = rdig.encode('utf-8')
                 # check date if expired then remove escrow.
@@ -6327,13 +6613,17 @@ class Kevery:
                 self.db.uwes.rem(keys=(pre,), on=sn, val=(rdig, wig))
                 logger.info("Kevery UWE unescrow succeeded for event pre=%s sn=%s", pre, sn)
 
-    def processEscrowUnverNonTrans(self):
+    def processEscrowUnverNonTrans(self, pres=None):
         """
         Process escrowed unverified event receipts from nontrans receiptors
         A receipt is unverified if the associated event has not been accepted
         into its KEL.
         Without the event, there is no way to know where to store the receipts.
 
+        Parameters:
+            pres (Iterable|None): prefixes whose escrowed entries to retry.
+                None means retry all escrowed entries.
+
         The escrow is a triple with edig+rpre+cig where:
            edig is event digest
            rpre is receiptor (signer) of event
@@ -6374,7 +6664,7 @@ class Kevery:
                         If successful then remove from escrow table
         """
 
-        for (pre, sn), (rsaider, sprefixer, cigar) in self.db.ures.getTopItemIter():
+        for (pre, sn), (rsaider, sprefixer, cigar) in self.escrowIter(self.db.ures, pres=pres, top=True):
             sn = Seqner(qb64=sn).sn
             try:
                 cigar.verfer = Verfer(qb64b=sprefixer.qb64b)
@@ -6409,7 +6699,7 @@ class Kevery:
                     # get dig of receipted accepted event in kel using lastEvt
                     # at pre and sn
 
-                    dig = self.db.kels.getLast(keys=pre, on=sn)
+                    dig = self.db.lastDig(pre=pre, sn=sn)
                     if dig is None:  # no receipted event so keep in escrow
                         msg = f"URE Missing receipted evt at pre={pre} sn={sn:x}"
                         logger.trace("Kevery unescrow error: %s", msg)
@@ -6868,7 +7158,7 @@ class Kevery:
                         raise ValidationError(msg)
 
                     # get dig of the receipted event using pre and sn lastEvt
-                    raw = self.db.kels.getLast(keys=pre, on=sn)
+                    raw = self.db.lastDig(pre=pre, sn=sn)
                     if raw is None:
                         # no event so keep in escrow
                         msg = f"VRE Missing receipted evt at pre={pre} sn={sn:x}"
@@ -6890,7 +7180,7 @@ class Kevery:
 
                     # get receipter's last est event
                     # retrieve dig of last event at sn of receipter.
-                    sdig = self.db.kels.getLast(keys=sprefixer.qb64b, on=snumber.sn)
+                    sdig = self.db.lastDig(pre=sprefixer.qb64b, sn=snumber.sn)
                     if sdig is None:
                         # no event so keep in escrow
                         msg = f"VRE Missing receipted evt at pre={pre} sn={sn:x}"
@@ -7007,23 +7297,6 @@ class Kevery:
                         logger.info("Kevery unescrow error: %s", msg)
                         raise ValidationError(msg)
 
-                    # check date if expired then remove escrow.
-                    dater = self.db.dtss.get(keys=dgkey)
-                    if dater is None:  # no datetime stored
-                        # no date time so raise ValidationError which unescrows below
-                        msg = f"DUP Missing escrowed event datetime at dig = {edig.decode()}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
-
-                    # do date math here and discard if stale
-                    dtnow = helping.nowUTC()
-                    dte = dater.datetime
-                    if (dtnow - dte) > datetime.timedelta(seconds=self.TimeoutLDE):
-                        # escrow stale so raise ValidationError which unescrows below
-                        msg = f"DUP Stale event escrow at dig = {edig.decode()}"
-                        logger.trace("Kevery unescrow error: %s", msg)
-                        raise ValidationError(msg)
-
                     # get the escrowed event using edig
                     if (eserder := self.db.evts.get(keys=(pre, bytes(edig)))) is None:
                         # no event so raise ValidationError which unescrows below
@@ -7115,7 +7388,7 @@ def loadEvent(db, preb, dig):
     event["ked"] = serder.ked
 
     sn = serder.sn
-    sdig = db.kels.getLast(keys=preb, on=sn)
+    sdig = db.lastDig(pre=preb, sn=sn)
     if sdig is not None:
         event["stored"] = True
 
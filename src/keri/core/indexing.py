@@ -517,6 +517,7 @@ class Indexer:
     def _exfil(self, qb64b):
         """
         Extracts self.code, self.index, and self.raw from qualified base64 bytes qb64b
+        of type str or bytes or bytearray or memoryview
 
         cs = hs + ss
         ms = ss - os (main index size)
@@ -526,6 +527,8 @@ class Indexer:
             raise ShortageError("Empty material.")
 
         first = qb64b[:1]  # extract first char code selector
+        if isinstance(first, memoryview):
+            first = bytes(first)
         if hasattr(first, "decode"):
             first = first.decode("utf-8")
         if first not in self.Hards:
@@ -543,6 +546,8 @@ class Indexer:
             raise ShortageError(f"Need {hs - len(qb64b)} more characters.")
 
         hard = qb64b[:hs]  # get hard code
+        if isinstance(hard, memoryview):
+            hard = bytes(hard)
         if hasattr(hard, "decode"):
             hard = hard.decode("utf-8")
         if hard not in self.Sizes:
@@ -560,11 +565,15 @@ class Indexer:
             raise ShortageError(f"Need {cs - len(qb64b)} more characters.")
 
         index = qb64b[hs:hs+ms]  # extract index/size chars
+        if isinstance(index, memoryview):
+            index = bytes(index)
         if hasattr(index, "decode"):
             index = index.decode("utf-8")
         index = b64ToInt(index)  # compute int index
 
         ondex = qb64b[hs+ms:hs+ms+os]  # extract ondex chars
+        if isinstance(ondex, memoryview):
+            ondex = bytes(ondex)
         if hasattr(ondex, "decode"):
             ondex = ondex.decode("utf-8")
 
@@ -591,6 +600,8 @@ class Indexer:
             raise ShortageError(f"Need {fs - len(qb64b)} more chars.")
 
         qb64b = qb64b[:fs]  # fully qualified primitive code plus material
+        if isinstance(qb64b, memoryview):
+            qb64b = bytes(qb64b)
         if hasattr(qb64b, "encode"):  # only convert extracted chars from stream
             qb64b = qb64b.encode("utf-8")
 
@@ -34,6 +34,35 @@ from ..recording import CacheTypeRecord, MsgCacheRecord, TxnMsgCacheRecord
 logger = ogler.getLogger()
 
 
+def msgExpiry(record):
+    """Returns POSIX ms after which MsgCacheRecord record is pruned
+
+    Falls back to parsing record.mdt for records stored without mdtms.
+    """
+    mdtms = record.mdtms or int(helping.fromIso8601(record.mdt).timestamp() * 1000)
+    return mdtms + record.d + record.pml
+
+
+def txnExpiry(record):
+    """Returns POSIX ms after which TxnMsgCacheRecord record is pruned
+
+    Falls back to parsing record.xdt for records stored without xdtms.
+    """
+    xdtms = record.xdtms or int(helping.fromIso8601(record.xdt).timestamp() * 1000)
+    return xdtms + record.pxl
+
+
+def indexMsgCache(db, key, record):
+    """Adds (AID, MID) key of message cache record to the .kramMEXP expiry index"""
+    db.kramMEXP.pin(keys=(f"{msgExpiry(record):032x}", *key), val=".".join(key))
+
+
+def indexTxnCache(db, key, record):
+    """Adds (AID, XID, MID) key of txn message cache record to the .kramTEXP
+    expiry index"""
+    db.kramTEXP.pin(keys=(f"{txnExpiry(record):032x}", *key), val=".".join(key))
+
+
 @dataclass(frozen=True)
 class AuthTypeCodex:
     """AuthTypeCodex is codex of KRAM authentication type code strings.
@@ -452,7 +481,7 @@ class Kramer:
                 continue
             if (number.sn != kever.sner.num or
                     sdiger.qb64 != kever.serder.said):
-                sdig = self.db.kels.getLast(keys=senderId, on=number.sn)
+                sdig = self.db.lastDig(pre=senderId, sn=number.sn)
                 if sdig is not None and sdig == sdiger.qb64:
                     evtSerder = self.db.evts.get(keys=(senderId, sdiger.qb64))
                     if evtSerder is not None:
@@ -521,7 +550,7 @@ class Kramer:
 
         # Look up event digest at (senderId, sn) in sender's KEL
         prefixer = Prefixer(qb64=senderId)
-        sdig = self.db.kels.getLast(keys=prefixer.qb64b, on=number.sn)
+        sdig = self.db.lastDig(pre=prefixer.qb64b, sn=number.sn)
 
         if sdig is None:
             raise MissingSenderKeyStateError(
@@ -847,8 +876,9 @@ class Kramer:
                     # Create cache and accept
                     mcr = MsgCacheRecord(
                         mdt=mdts, d=d, ml=ml, pml=pml,
-                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl,
+                        mdtms=int(mdt))
+                    self._pinMsgCache(key, mcr)
                     return msg
 
                 elif authType == AuthTypes.AttachedSignatureSingleKey:
@@ -862,8 +892,9 @@ class Kramer:
                     # Create cache and accept
                     mcr = MsgCacheRecord(
                         mdt=mdts, d=d, ml=ml, pml=pml,
-                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl,
+                        mdtms=int(mdt))
+                    self._pinMsgCache(key, mcr)
                     return msg
 
                 elif authType == AuthTypes.AttachedSignatureMultiKey:
@@ -877,8 +908,9 @@ class Kramer:
                     # Create cache entry (at least one sig verified)
                     mcr = MsgCacheRecord(
                         mdt=mdts, d=d, ml=ml, pml=pml,
-                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramMSGC.pin(key, mcr)
+                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl,
+                        mdtms=int(mdt))
+                    self._pinMsgCache(key, mcr)
 
                     # Check if threshold is immediately satisfied
                     sigIndices = [sig.index for sig in sigResult.sigers]
@@ -1108,8 +1140,9 @@ class Kramer:
                         # Create txn cache and accept
                         mcr = TxnMsgCacheRecord(
                             mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
-                            xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                        self.db.kramTMSC.pin(key, mcr)
+                            xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl,
+                            mdtms=int(mdt), xdtms=int(xdt))
+                        self._pinTxnCache(key, mcr)
                         return msg
 
                     elif authType == AuthTypes.AttachedSignatureSingleKey:
@@ -1123,8 +1156,9 @@ class Kramer:
                         # Create txn cache and accept
                         mcr = TxnMsgCacheRecord(
                             mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
-                            xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                        self.db.kramTMSC.pin(key, mcr)
+                            xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl,
+                            mdtms=int(mdt), xdtms=int(xdt))
+                        self._pinTxnCache(key, mcr)
                         return msg
 
                 elif authType == AuthTypes.AttachedSignatureMultiKey:
@@ -1169,8 +1203,9 @@ class Kramer:
                     # At least one sig verified, create txn cache entry
                     mcr = TxnMsgCacheRecord(
                         mdt=mdts, xdt=xdts, d=d, ml=ml, pml=pml,
-                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl)
-                    self.db.kramTMSC.pin(key, mcr)
+                        xl=cacheTypeRecord.xl, pxl=cacheTypeRecord.pxl,
+                        mdtms=int(mdt), xdtms=int(xdt))
+                    self._pinTxnCache(key, mcr)
 
                     # Check if threshold is immediately satisfied
                     sigIndices = [sig.index for sig in sigResult.sigers]
@@ -1738,28 +1773,66 @@ class Kramer:
                 raise KramError("Coverage hole detected, new configuration is invalid")
 
 
+    def _pinMsgCache(self, key, record):
+        """Pins message cache record at (AID, MID) key and indexes its expiry"""
+        self.db.kramMSGC.pin(key, record)
+        indexMsgCache(self.db, key, record)
+
+    def _pinTxnCache(self, key, record):
+        """Pins txn message cache record at (AID, XID, MID) key and indexes its
+        expiry"""
+        self.db.kramTMSC.pin(key, record)
+        indexTxnCache(self.db, key, record)
+
+    def _indexExpiries(self):
+        """Backfills the .kramMEXP and .kramTEXP expiry indexes from their
+        caches when an index is empty so that entries cached before the
+        indexes existed are still pruned. Returns count of entries indexed.
+        """
+        count = 0
+        if next(self.db.kramMEXP.getTopItemIter(), None) is None:
+            for keys, record in self.db.kramMSGC.getTopItemIter():
+                indexMsgCache(self.db, keys, record)
+                count += 1
+        if next(self.db.kramTEXP.getTopItemIter(), None) is None:
+            for keys, record in self.db.kramTMSC.getTopItemIter():
+                indexTxnCache(self.db, keys, record)
+                count += 1
+        return count
+
+    @staticmethod
+    def _expired(idb, rdt_ms):
+        """Returns list of (keys, expiry) of expiry index idb entries that
+        expired before receiver time rdt_ms. Reads only the expired prefix.
+        """
+        expired = []
+        for keys, _ in idb.getTopItemIter():
+            expiry = int(keys[0], 16)
+            if expiry >= rdt_ms:
+                break
+            expired.append((keys, expiry))
+        return expired
+
     def _pruneMessages(self, rdt_ms):
         """
         Check message ID and prune expired cache entries and associated state.
-        rdt (Iso8601): receiver time
-        pml (int): prune lag cache value in milliseconds
-        d (int): drift lag cache value in milliseconds
+
+        An entry expires once rdt_ms - d - pml > mdt. Only entries in the
+        expired prefix of the .kramMEXP expiry index are visited.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
         """
         # Initialize a flag to track if pruned
         pruned = False
 
-        # Iterate over all message cache entries
-        for (aid, mid), cache in list(self.db.kramMSGC.getTopItemIter()):
-
-            # Convert messsage time from cache to milliseconds Int for comparison
-            mdt_ms = int(helping.fromIso8601(cache.mdt).timestamp() * 1000)
-
-            # Get the drift and prune lag values from the cache record
-            d = cache.d
-            pml = cache.pml
-
-            # Apply the comparison from the whitepaper
-            if not rdt_ms - d - pml <= mdt_ms <= rdt_ms + d:
+        # Iterate over expired message cache entries
+        for keys, expiry in self._expired(self.db.kramMEXP, rdt_ms):
+            self.db.kramMEXP.rem(keys=keys)
+            aid, mid = keys[1:]
+            cache = self.db.kramMSGC.get(keys=(aid, mid))
+            # stale when already pruned or re-pinned with another expiry
+            if cache is not None and msgExpiry(cache) == expiry:
                 self.db.kramMSGC.rem(keys=(aid, mid))
                 self.db.kramPMKM.rem(keys=(aid, mid))
                 self.db.kramPMKS.rem(keys=(aid, mid))
@@ -1775,23 +1848,23 @@ class Kramer:
     def _pruneExchanges(self, rdt_ms):
         """
         Check exchanges ID and prune expired cache entries and associated state.
-        rdt (int): receiver time in milliseconds
-        pxl (int): prune lag cache value in milliseconds
+
+        An entry expires once rdt_ms > xdt + pxl. Only entries in the
+        expired prefix of the .kramTEXP expiry index are visited.
+
+        Parameters:
+            rdt_ms (int): receiver time in milliseconds
         """
         # Initialize a flag to track if pruned
         pruned = False
 
-        # Iterate over all message cache entries
-        for (aid, xid, mid), cache in list(self.db.kramTMSC.getTopItemIter()):
-
-            # Get the exchange time from the cache
-            xdt_ms = int(helping.fromIso8601(cache.xdt).timestamp() * 1000)
-
-            # Get the prune lag values from the cache record
-            pxl = cache.pxl
-
-            # Apply the comparison
-            if not xdt_ms <= rdt_ms <= xdt_ms + pxl:
+        # Iterate over expired txn message cache entries
+        for keys, expiry in self._expired(self.db.kramTEXP, rdt_ms):
+            self.db.kramTEXP.rem(keys=keys)
+            aid, xid, mid = keys[1:]
+            cache = self.db.kramTMSC.get(keys=(aid, xid, mid))
+            # stale when already pruned or re-pinned with another expiry
+            if cache is not None and txnExpiry(cache) == expiry:
                 self.db.kramTMSC.rem(keys=(aid, xid, mid))
                 self.db.kramPMKM.rem(keys=(aid, xid, mid))
                 self.db.kramPMKS.rem(keys=(aid, xid, mid))
@@ -1816,6 +1889,9 @@ class Pruner(doing.Doer):
         self.wind(tymth)
         self.tock = tock
 
+        # index any entries cached before the expiry indexes existed
+        self.kramer._indexExpiries()
+
         while True:
             # compute receiver time in ms
             rdt_ms = int(helping.nowUTC().timestamp() * 1000)
@@ -6,13 +6,14 @@ message stream parsing support
 """
 import copy
 import logging
+from contextlib import ExitStack
 from dataclasses import asdict
 from collections import deque
 from base64 import urlsafe_b64encode as encodeB64
 
 from hio.help import ogler
 
-from ..kering import (Colds, sniff, Vrsn_2_0, Version, Ilks,
+from ..kering import (Colds, sniff, smell, SMELLSIZE, Vrsn_2_0, Version, Ilks,
                       UnexpectedCountCodeError, ValidationError,
                       QueryNotFoundError, ExtractionError, ShortageError,
                       ColdStartError, InvalidVersionError,
@@ -21,13 +22,108 @@ from ..kering import (Colds, sniff, Vrsn_2_0, Version, Ilks,
 from .coring import (Seqner, Cigar, Diger, Noncer, Labeler, Number, Verser,
                      Dater, Verfer, Prefixer, Saider, Texter)
 from .counting import Counter, Codens, CtrDex_1_0, CtrDex_2_0, GenDex
-from .indexing import Siger
+from .indexing import Indexer, Siger
 from .serdering import Serdery, SerderKERI, SerderACDC
+from .eventing import verifyBatch
 
 
 logger = ogler.getLogger()
 
 
+class Cursor:
+    """Cursor is an offset based view onto an incoming message stream buffer.
+    Parser in cursor mode consumes the stream by advancing .offset instead of
+    deleting bytes off the front of the buffer. Primitives are extracted from
+    a memoryview of the unconsumed bytes so they are not copied out of the
+    stream first. The consumed bytes are compacted off the front of a
+    bytearray buffer only at frame boundaries via .compact().
+
+    Supports the subset of the bytearray interface used by Parser so that
+    group parse methods may treat a Cursor as an ims. Slices copy out a
+    bytearray so that enclosed group substreams behave exactly as before.
+
+    Attributes:
+        buf (bytearray | bytes | memoryview): underlying stream buffer.
+            Only bytearray buffers may be extended or compacted.
+        offset (int): index into .buf of first unconsumed byte
+
+    Properties:
+        view (memoryview): zero copy view of unconsumed bytes in .buf
+
+    Usage:
+        ims = Cursor(buf=bytearray(msgs))
+        while ims:
+            ...
+            del ims[:size]  # advances .offset
+        ims.compact()  # at frame boundary
+    """
+
+    def __init__(self, buf=None, offset=0):
+        """Initialize instance
+
+        Parameters:
+            buf (bytearray | bytes | memoryview | None): stream buffer
+                None means empty bytearray
+            offset (int): index into buf of first unconsumed byte
+        """
+        self.buf = buf if buf is not None else bytearray()
+        self.offset = offset
+
+
+    def __len__(self):
+        return len(self.buf) - self.offset
+
+
+    def __getitem__(self, key):
+        """Returns int for index key or bytearray copy for slice key where both
+        are relative to .offset as if consumed bytes had been deleted.
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step != 1:
+                raise ValueError(f"Unsupported cursor slice step={step}.")
+            return bytearray(self.view[start:stop])
+
+        size = len(self)
+        if key < 0:
+            key += size
+        if not 0 <= key < size:
+            raise IndexError("Cursor index out of range.")
+        return self.buf[self.offset + key]
+
+
+    def __delitem__(self, key):
+        """Consumes bytes off front of stream by advancing .offset. Only front
+        slices such as del ims[:size] or del ims[:] are supported.
+        """
+        if (not isinstance(key, slice) or key.start not in (None, 0)
+                or key.step not in (None, 1)):
+            raise ValueError(f"Unsupported cursor deletion key={key}.")
+        size = len(self)
+        stop = size if key.stop is None else max(min(key.stop, size), 0)
+        self.offset += stop
+
+
+    @property
+    def view(self):
+        """Returns memoryview of unconsumed bytes in .buf without copying"""
+        return memoryview(self.buf)[self.offset:]
+
+
+    def extend(self, data):
+        """Appends data to underlying bytearray buffer"""
+        self.buf.extend(data)
+
+
+    def compact(self):
+        """Deletes consumed bytes from front of bytearray .buf and resets
+        .offset. Call at frame boundaries. Immutable buffers are left alone.
+        """
+        if self.offset and isinstance(self.buf, bytearray):
+            del self.buf[:self.offset]
+            self.offset = 0
+
+
 class Parser:
     """Parser is stream parser that processes an incoming message stream.
     Each message in the stream is composed of a message body with a message foot
@@ -47,6 +143,12 @@ class Parser:
         framed (bool): True means stream is packet framed
         piped (bool): True means use pipeline processor to process
                 whenever stream includes pipelined count codes.
+        cursor (bool): True means consume ims via offset Cursor and compact
+                only at frame boundaries. False means strip ims bytearray
+        batch (int): number of KEL event and receipt messages to accumulate
+                before verifying their signatures together. 0 means no batch
+        workers (int|None): number of threads used to verify a batch
+        pending (list): accumulated batch of (exts, kvy) not yet dispatched
         kvy (Kevery): route KEL message types to this instance
         tvy (Tevery): route TEL message types to this instance
         exc (Exchanger): route EXN message types to this instance
@@ -142,9 +244,16 @@ class Parser:
     Methods[2][0][Codens.BigTypedMediaQuadruples] = "_TypedMediaQuadruples"
 
 
+    # KERI message ilks dispatched to kvy that may be accumulated in a batch
+    Batchables = (Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt, Ilks.rct)
+
+    # default size of each read of a stream by .parseFile
+    ChunkSize = 1 << 20
+
+
     def __init__(self, ims=None, framed=True, piped=False, kvy=None,
                  tvy=None, exc=None, rvy=None, vry=None, local=False,
-                 version=Vrsn_2_0):
+                 version=Vrsn_2_0, cursor=False, batch=0, workers=None):
         """
         Initialize instance:
 
@@ -163,10 +272,23 @@ class Parser:
                          False means event source is remote (unprotected) for validation
             version (Versionage): instance of version portion of genus version code
                                   for default code table
+            cursor (bool): True means consume ims via offset Cursor and
+                compact only at frame boundaries instead of stripping
+                extracted bytes off the front of ims as it goes.
+            batch (int): number of KEL event and receipt messages to accumulate
+                in .pending before verifying all their attached signatures
+                together and then dispatching them to kvy. 0 means no batch
+                so dispatch each message as soon as parsed.
+            workers (int|None): number of threads used to verify a batch.
+                None means verify batch serially.
         """
         self.ims = ims if ims is not None else bytearray()
         self.framed = True if framed else False  # extract until end-of-stream
         self.piped = True if piped else False  # use pipeline processor
+        self.cursor = True if cursor else False  # offset cursor mode
+        self.batch = max(0, int(batch))  # size of batch to accumulate if any
+        self.workers = workers  # threads to verify batch
+        self.pending = []  # accumulated batch of (exts, kvy) to dispatch
         self.kvy = kvy
         self.tvy = tvy
         self.exc = exc
@@ -252,25 +374,58 @@ class Parser:
         return self._mucodes
 
 
-    def extract(self, ims, klas, cold=Colds.txt):
+    def extract(self, ims, klas, cold=Colds.txt, strip=True):
         """Extract and return instance of klas from input message stream, ims, given
         stream state, cold, is txt or bny. Inits klas from ims using qb64b or
         qb2 parameter based on cold.
 
         Parameters:
-            ims (bytearray): input message stream (must be strippable)
-            klas (Serder | Counter | Matter | Indexer): subclass that is parsable
+            ims (bytearray | Cursor): input message stream (must be strippable)
+            klas (Counter | Matter | Indexer): subclass that is parsable
             cold (Coldage): instance str value
+            strip (bool): True means strip extracted instance from ims
+                          False means do not strip, so can peek at stream
 
+        When ims is a Cursor the instance is extracted from a memoryview of
+        the unconsumed stream and stripping just advances the cursor offset.
         """
+        if isinstance(ims, Cursor):
+            if cold == Colds.txt:
+                instance = klas(qb64b=ims.view, version=self.version)
+            elif cold == Colds.bny:
+                instance = klas(qb2=ims.view, version=self.version)
+            else:
+                raise ColdStartError(f"Invalid stream state {cold=}")
+            if strip:
+                del ims[:self._stripSize(instance, cold=cold)]
+            return instance
+
         if cold == Colds.txt:
-            return klas(qb64b=ims, strip=True, version=self.version)
+            return klas(qb64b=ims, strip=strip, version=self.version)
         elif cold == Colds.bny:
-            return klas(qb2=ims, strip=True, version=self.version)
+            return klas(qb2=ims, strip=strip, version=self.version)
         else:
             raise ColdStartError(f"Invalid stream state {cold=}")
 
 
+    @staticmethod
+    def _stripSize(instance, cold=Colds.txt):
+        """Returns number of stream bytes consumed by extracted instance given
+        cold. Matches what instance would have stripped from a bytearray ims.
+
+        Parameters:
+            instance (Counter | Matter | Indexer): extracted instance
+            cold (Coldage): instance str value either Colds.txt or Colds.bny
+        """
+        if isinstance(instance, Counter):
+            return instance.byteSize(cold=cold)
+        if isinstance(instance, Indexer):  # may be variable length fs
+            return len(instance.qb64b if cold == Colds.txt else instance.qb2)
+        if cold == Colds.txt:
+            return instance.fullSize
+        return instance.fullSize * 3 // 4
+
+
     def _extractor(self, ims, klas, cold=Colds.txt, abort=False, strip=True):
         """Returns generator to extract and return instance of klas from input
         message stream, ims, given stream state, cold, is txt or bny.
@@ -280,8 +435,8 @@ class Parser:
         Yields if not enough bytes in ims to fill out klas instance.
 
         Parameters:
-            ims (bytearray): input message stream (must be strippable)
-            klas (Serder | Counter | Matter | Indexer): subclass that is parsable
+            ims (bytearray | Cursor): input message stream (must be strippable)
+            klas (Counter | Matter | Indexer): subclass that is parsable
             cold (Coldage): instance str value
             abort (bool): True means abort if bad pipelined frame Shortage
                           False means do not abort if Shortage just wait for more
@@ -293,20 +448,18 @@ class Parser:
         """
         while True:
             try:
-                if cold == Colds.txt:
-                    return klas(qb64b=ims, strip=strip, version=self.version)
-                elif cold == Colds.bny:
-                    return klas(qb2=ims, strip=strip, version=self.version)
-                else:
-                    raise ColdStartError(f"Invalid stream state {cold=}")
+                return self.extract(ims=ims, klas=klas, cold=cold, strip=strip)
             except ShortageError as ex:
                 if abort:  # pipelined pre-collects full frame before extracting
                     raise  # bad pipelined frame so abort by raising error
-                yield
+            # yield outside except clause so traceback holding any memoryview
+            # of a Cursor buffer is released while waiting for more bytes
+            yield
 
 
     def parse(self, ims=None, framed=None, piped=None, kvy=None, tvy=None,
-              exc=None, rvy=None, vry=None, local=None, version=None):
+              exc=None, rvy=None, vry=None, local=None, version=None,
+              cursor=None):
         """Processes all messages from incoming message stream, ims,
         when provided. Otherwise process messages from .ims
         Returns when ims is empty.
@@ -330,6 +483,8 @@ class Parser:
                           None means use default .local
             version (Versionage): default version of CESR to use
                                   None means do not change default
+            cursor (bool): True means consume ims via offset Cursor
+                           None means use default .cursor
 
         New Logic:
             Attachments must all have counters so know if txt or bny format for
@@ -348,7 +503,8 @@ class Parser:
                                     rvy=rvy,
                                     vry=vry,
                                     local=local,
-                                    version=version)
+                                    version=version,
+                                    cursor=cursor)
 
         while True:
             try:
@@ -358,7 +514,8 @@ class Parser:
 
 
     def parseOne(self, ims=None, framed=True, piped=False, kvy=None, tvy=None,
-                 exc=None, rvy=None, vry=None, local=None, version=None):
+                 exc=None, rvy=None, vry=None, local=None, version=None,
+                 cursor=None):
         """Processes one messages from incoming message stream, ims,
         when provided. Otherwise process message from .ims
         Returns once one message is processed.
@@ -381,6 +538,8 @@ class Parser:
                           None means use default .local
             version (Versionage): default genera version of CESR to use
                                   None means do not change default
+            cursor (bool): True means consume ims via offset Cursor
+                           None means use default .cursor
 
         New Logic:
             Attachments must all have counters so know if txt or bny format for
@@ -398,7 +557,8 @@ class Parser:
                                      rvy=rvy,
                                      vry=vry,
                                      local=local,
-                                     version=version)
+                                     version=version,
+                                     cursor=cursor)
         while True:
             try:
                 next(parsator)
@@ -406,9 +566,66 @@ class Parser:
                 break
 
 
+    def parseFile(self, f, size=None, kvy=None, tvy=None, exc=None, rvy=None,
+                  vry=None, local=None, version=None, cursor=None):
+        """Processes all messages from binary file like object f by feeding
+        fixed size reads of f into .parsator so memory stays bounded by the
+        read size no matter how large the stream. Returns when f is exhausted.
+
+        Messages are only parsed while at least size bytes are buffered so
+        a message is never cut short at the end of a read. So size must be
+        larger than the largest message plus attachments in the stream.
+
+        Parameters:
+            f: binary file like object with .read such as open file or
+                socket.makefile('rb')
+            size (int|None): number of bytes of each read of f
+                None means use .ChunkSize
+            kvy (Kevery): route KERI KEL message types to this instance
+            tvy (Tevery): route TEL message types to this instance
+            exc (Exchanger) route EXN message types to this instance
+            rvy (Revery): reply (RPY) message handler
+            vry (Verfifier): credential verifier with wallet storage
+            local (bool): True means event source is local (protected) for validation
+                          False means event source is remote (unprotected) for validation
+                          None means use default .local
+            version (Versionage): default version of CESR to use
+                                  None means do not change default
+            cursor (bool): True means consume buffered reads via offset Cursor
+                           None means use default .cursor
+        """
+        size = size if size is not None else self.ChunkSize
+        cursor = cursor if cursor is not None else self.cursor
+        ims = Cursor(buf=bytearray()) if cursor else bytearray()
+        parsator = self.parsator(ims=ims,
+                                 framed=False,
+                                 kvy=kvy,
+                                 tvy=tvy,
+                                 exc=exc,
+                                 rvy=rvy,
+                                 vry=vry,
+                                 local=local,
+                                 version=version,
+                                 cursor=cursor)
+
+        def drain(least):
+            while len(ims) >= least:
+                remaining = len(ims)
+                next(parsator)
+                if len(ims) == remaining:  # waiting on more bytes
+                    break
+
+        while chunk := f.read(size):
+            ims.extend(chunk)
+            drain(least=size)  # keep one read ahead of the message parsed
+
+        drain(least=1)  # end of stream so parse rest
+        self.flush()  # dispatch any remaining pending batch
+
+
     def allParsator(self, ims=None, framed=None, piped=None, kvy=None,
                     tvy=None, exc=None, rvy=None, vry=None, local=None,
-                    version=None):
+                    version=None, cursor=None):
         """Returns generator to parse all messages from incoming message stream,
         ims until ims is exhausted (empty) then returns.
         Generator completes as soon as ims is empty.
@@ -432,17 +649,23 @@ class Parser:
                           None means use default .local
             version (Versionage): default version of CESR to use
                                 None means do not change default
+            cursor (bool): True means consume ims via offset Cursor
+                           None means use default .cursor
 
         New Logic:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
+        cursor = cursor if cursor is not None else self.cursor
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
+            if not cursor and not isinstance(ims, bytearray):
                 ims = bytearray(ims)  # so make bytearray copy
         else:
             ims = self.ims  # use instance attribute by default
 
+        if cursor and not isinstance(ims, Cursor):  # consume in place no copy
+            ims = Cursor(buf=ims)
+
         framed = framed if framed is not None else self.framed
         piped = piped if piped is not None else self.piped
         kvy = kvy if kvy is not None else self.kvy
@@ -488,14 +711,17 @@ class Parser:
                     logger.exception("Parser msg non-extraction error: %s", ex)
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.error("Parser msg non-extraction error: %s", ex)
+            if cursor:  # frame boundary so compact consumed bytes
+                ims.compact()
             yield
 
+        self.flush()  # dispatch any remaining pending batch
         return True
 
 
     def onceParsator(self, ims=None, framed=None, piped=None, kvy=None,
                      tvy=None, exc=None, rvy=None, vry=None, local=None,
-                     version=None):
+                     version=None, cursor=None):
         """Returns generator to parse one message from incoming message stream, ims.
         If ims not provided parse messages from .ims
 
@@ -517,17 +743,23 @@ class Parser:
                           None means use default .local
             version (Versionage): default version of CESR to use
                                   None means do not change default
+            cursor (bool): True means consume ims via offset Cursor
+                           None means use default .cursor
 
         New Logic:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
+        cursor = cursor if cursor is not None else self.cursor
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
+            if not cursor and not isinstance(ims, bytearray):
                 ims = bytearray(ims)  # so make bytearray copy
         else:
             ims = self.ims  # use instance attribute by default
 
+        if cursor and not isinstance(ims, Cursor):  # consume in place no copy
+            ims = Cursor(buf=ims)
+
         framed = framed if framed is not None else self.framed
         piped = piped if piped is not None else self.piped
         kvy = kvy if kvy is not None else self.kvy
@@ -575,12 +807,16 @@ class Parser:
                     logger.error("Kevery msg non-extraction error: %s", ex)
             finally:
                 done = True
+                if cursor:  # frame boundary so compact consumed bytes
+                    ims.compact()
 
+        self.flush()  # dispatch any pending batch
         return done
 
 
     def parsator(self, ims=None, framed=None, piped=None, kvy=None, tvy=None,
-                 exc=None, rvy=None, vry=None, local=None, version=None):
+                 exc=None, rvy=None, vry=None, local=None, version=None,
+                 cursor=None):
         """Returns generator to continually parse messages from incoming message
         stream, ims. Empty yields when ims is emply. Does not return.
         Useful for always running servers.
@@ -606,17 +842,23 @@ class Parser:
                           None means use default .local
             version (Versionage): default version of CESR to use
                                   None means do not change default
+            cursor (bool): True means consume ims via offset Cursor
+                           None means use default .cursor
 
         New Logic:
             Attachments must all have counters so know if txt or bny format for
             attachments. So even when framed==True must still have counters.
         """
+        cursor = cursor if cursor is not None else self.cursor
         if ims is not None:  # needs bytearray not bytes since deletes as processes
-            if not isinstance(ims, bytearray):
+            if not cursor and not isinstance(ims, bytearray):
                 ims = bytearray(ims)  # so make bytearray copy
         else:
             ims = self.ims  # use instance attribute by default
 
+        if cursor and not isinstance(ims, Cursor):  # consume in place no copy
+            ims = Cursor(buf=ims)
+
         framed = framed if framed is not None else self.framed
         piped = piped if piped is not None else self.piped
         kvy = kvy if kvy is not None else self.kvy
@@ -673,6 +915,10 @@ class Parser:
                     logger.exception("Parser msg non-extraction error: %s", ex.args[0])
                 if logger.isEnabledFor(logging.DEBUG):
                     logger.error("Parser msg non-extraction error: %s", ex.args[0])
+            if not ims:  # stream drained so dispatch any partial pending batch
+                self.flush()
+            if cursor:  # frame boundary so compact consumed bytes
+                ims.compact()
             yield
 
         return True  # should never return
@@ -687,9 +933,9 @@ class Parser:
         If ims not provided then parse messages from .ims
 
         Parameters:
-            ims (bytearray): of incoming message stream. May contain one or more
-                sets each of a serialized message with attached cryptographic
-                material such as signatures or receipts.
+            ims (bytearray | Cursor): of incoming message stream. May contain
+                one or more sets each of a serialized message with attached
+                cryptographic material such as signatures or receipts.
             framed (bool): True means ims contains only one frame of msg plus
                 counted attachments instead of stream with multiple messages
             piped (bool): True means use pipeline processor to process
@@ -720,6 +966,9 @@ class Parser:
         done = False
         try:
             while True:  # process stream until done
+                if isinstance(ims, Cursor):  # top-level frame boundary
+                    ims.compact()
+
                 while not ims and stack:  # happens when ascending (un-nesting)
                     svrsn, ims = stack.pop()  # un-nest
                     self.version = svrsn  # only changes if svrsn is not None
@@ -822,7 +1071,7 @@ class Parser:
         attachments. Returns (which raises StopIteration) when finished.
 
         Parameters:
-            ims (bytearray): serialized incoming message stream.
+            ims (bytearray | Cursor): serialized incoming message stream.
                 May contain one or more sets each of a serialized message with
                 attached cryptographic material such as signatures or receipts.
             framed (bool): True means ims contains only one frame of msg plus
@@ -1032,14 +1281,28 @@ class Parser:
             else:   # Otherwise its JSON, CBOR, or MGPK message at top level
                 while True:  # extract, deserialize, and strip message from ims
                     try:
-                        serder = serdery.reap(ims=ims,
-                                              genus=self.genus,
-                                              svrsn=self.version)
+                        if isinstance(ims, Cursor):  # copy out only message
+                            size = smell(ims[:SMELLSIZE]).size
+                            if len(ims) < size:
+                                raise ShortageError(f"Need more bytes to "
+                                                    f"de-serialize Serder")
+                            serder = serdery.reap(ims=ims[:size],
+                                                  genus=self.genus,
+                                                  svrsn=self.version,
+                                                  verify=kvy is None)
+                            del ims[:size]  # advance cursor past message
+                        else:
+                            serder = serdery.reap(ims=ims,
+                                                  genus=self.genus,
+                                                  svrsn=self.version,
+                                                  verify=kvy is None)
                     except ShortageError as ex:  # need more bytes
                         if framed:  # pre-extracted
                             raise  # incomplete frame or group so abort by raising error
                         yield
                     else: # extracted and stripped successfully
+                        if kvy is not None:  # reaped unverified
+                            self._vetSerder(serder, kvy)
                         exts['serder'] = serder
                         break  # break out of while loop
 
@@ -1150,53 +1413,20 @@ class Parser:
             while verstack:  # restore version to what it was
                 self.version = verstack.pop()
 
+        if self.pending and not (isinstance(serder, SerderKERI) and
+                                 serder.ilk in self.Batchables):
+            self.flush()  # dispatch pending batch first to preserve stream order
+
         if isinstance(serder, SerderKERI):
             ilk = serder.ilk  # dispatch abased on ilk
 
-            if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
-                firner, dater = exts['frcs'][-1] if exts['frcs'] else (None, None)  # use last one if more than one
-                # when present assumes this is source seal of delegating event in delegator's KEL
-                delseqner, deldiger = exts['sscs'][-1] if exts['sscs'] else (None, None)  # use last one if more than one
-                if not exts['sigers']: # sigers:
-                    msg = f"Missing attached signature(s) for evt = {serder.ked['d']}"
-                    logger.info(msg)
-                    logger.debug("Event Body = \n%s\n", serder.pretty())
-                    raise ValidationError(msg)
-                try:
-                    exts['firner'] = firner
-                    exts['dater'] = dater
-                    exts['delnum'] = Number(num=delseqner.sn) if delseqner is not None else None
-                    exts['deldiger'] = deldiger
-
-                    kvy.processEvent(**exts)
-
-                    if exts['cigars']:  # cigars
-                        kvy.processAttachedReceiptCouples(**exts)
-
-                    if exts['trqs']:  # trqs
-                        kvy.processAttachedReceiptQuadruples(**exts)
-
-                except AttributeError as ex:
-                    msg = f"No kevery to process so dropped msg={serder.said}"
-                    logger.info(msg)
-                    logger.debug("Event Body = \n%s\n", serder.pretty())
-                    raise ValidationError(msg) from ex
-
-            elif ilk in [Ilks.rct]:  # event receipt msg (nontransferable)
-                if not (exts['cigars'] or exts['wigers'] or exts['tsgs']):  # (cigars or wigers or tsgs)
-                    msg = f"Missing attached signatures on receipt msg sn={serder.sn} SAID={serder.said}"
-                    logger.info(msg)
-                    logger.debug("Receipt body=\n%s\n", serder.pretty())
-                    raise ValidationError(msg)
-
-                try:
-
-                    kvy.processReceipt(**exts)
-
-                except AttributeError as ex:
-                    raise ValidationError(f"No kevery to process so dropped msg"
-                                                 f"= {serder.pretty()}.") from ex
-
+            if ilk in self.Batchables:  # key event msg or receipt msg
+                if self.batch and kvy is not None:  # accumulate batch
+                    self.pending.append((exts, kvy))
+                    if len(self.pending) >= self.batch:
+                        self.flush()
+                else:
+                    self.kevDispatch(exts=exts, kvy=kvy)
 
             elif ilk in (Ilks.rpy,):  # reply message
                 if not (exts['cigars'] or exts['tsgs']):  # (cigars or tsgs)
@@ -1304,6 +1534,183 @@ class Parser:
 
         return True  # done state
 
+
+    def kevDispatch(self, exts, kvy):
+        """Dispatches one parsed KEL event message or receipt message with its
+        extracted attachments given by exts to kvy for processing.
+
+        Parameters:
+            exts (dict): of extracted message serder and its attachments
+            kvy (Kevery): route KERI KEL message types to this instance
+        """
+        serder = exts['serder']
+        ilk = serder.ilk  # dispatch based on ilk
+
+        if ilk in [Ilks.icp, Ilks.rot, Ilks.ixn, Ilks.dip, Ilks.drt]:  # event msg
+            firner, dater = exts['frcs'][-1] if exts['frcs'] else (None, None)  # use last one if more than one
+            # when present assumes this is source seal of delegating event in delegator's KEL
+            delseqner, deldiger = exts['sscs'][-1] if exts['sscs'] else (None, None)  # use last one if more than one
+            if not exts['sigers']: # sigers:
+                msg = f"Missing attached signature(s) for evt = {serder.ked['d']}"
+                logger.info(msg)
+                logger.debug("Event Body = \n%s\n", serder.pretty())
+                raise ValidationError(msg)
+            try:
+                exts['firner'] = firner
+                exts['dater'] = dater
+                exts['delnum'] = Number(num=delseqner.sn) if delseqner is not None else None
+                exts['deldiger'] = deldiger
+
+                kvy.processEvent(**exts)
+
+                if exts['cigars']:  # cigars
+                    kvy.processAttachedReceiptCouples(**exts)
+
+                if exts['trqs']:  # trqs
+                    kvy.processAttachedReceiptQuadruples(**exts)
+
+            except AttributeError as ex:
+                msg = f"No kevery to process so dropped msg={serder.said}"
+                logger.info(msg)
+                logger.debug("Event Body = \n%s\n", serder.pretty())
+                raise ValidationError(msg) from ex
+
+        elif ilk in [Ilks.rct]:  # event receipt msg (nontransferable)
+            if not (exts['cigars'] or exts['wigers'] or exts['tsgs']):  # (cigars or wigers or tsgs)
+                msg = f"Missing attached signatures on receipt msg sn={serder.sn} SAID={serder.said}"
+                logger.info(msg)
+                logger.debug("Receipt body=\n%s\n", serder.pretty())
+                raise ValidationError(msg)
+
+            try:
+
+                kvy.processReceipt(**exts)
+
+            except AttributeError as ex:
+                raise ValidationError(f"No kevery to process so dropped msg"
+                                      f"= {serder.pretty()}.") from ex
+
+
+    def flush(self):
+        """Dispatches .pending batch of accumulated KEL event and receipt
+        messages to their kvy after first verifying all the candidate attached
+        signatures of the whole batch together via verifyBatch.
+
+        The verified (key, sig, ser) triples are handed back to the normal
+        validation flow via Verfer.Verifieds while the batch is dispatched so
+        that Kevery does not verify them again. Any signature not verified in
+        batch, such as one whose key state depends on an earlier message in
+        the batch that fails, is just verified as usual by Kevery.
+
+        Errors processing any one message are logged so that the rest of the
+        batch is still dispatched. All the database writes of the batch are
+        committed together in one transaction per kvy database.
+        """
+        if not self.pending:
+            return
+
+        pending, self.pending = self.pending, []
+        triples = self.batchTriples(pending)
+        verifieds = set()
+        for (verfer, sig, ser), verified in zip(triples,
+                                                verifyBatch(triples,
+                                                            workers=self.workers)):
+            if verified:
+                verifieds.add((verfer.raw, sig, ser))
+
+        prior = Verfer.Verifieds
+        Verfer.Verifieds = verifieds
+        try:
+            with ExitStack() as stack:  # one commit per database for batch
+                for db in {id(kvy.db): kvy.db for _, kvy in pending}.values():
+                    stack.enter_context(db.txn())
+
+                for exts, kvy in pending:
+                    try:
+                        self.kevDispatch(exts=exts, kvy=kvy)
+                    except Exception as ex:  # log and resume with rest of batch
+                        if logger.isEnabledFor(logging.TRACE):
+                            logger.exception("Parser batch msg error: %s", ex)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.error("Parser batch msg error: %s", ex)
+        finally:
+            Verfer.Verifieds = prior
+
+
+    @staticmethod
+    def _vetSerder(serder, kvy):
+        """Verifies said(s) of serder reaped without verification unless kvy
+        has already accepted a byte identical event. Resent duplicates of
+        accepted key events thereby skip SAID recomputation.
+
+        Raises ValidationError when said(s) do not verify
+
+        Parameters:
+            serder (Serder): reaped without verification
+            kvy (Kevery): instance whose accepted events are checked
+        """
+        if isinstance(serder, SerderKERI) and kvy.accepted(serder):
+            return
+        if not serder.verify():  # logs reason
+            raise ValidationError(f"Invalid raw for Serder = {serder.sad}.")
+
+
+    @staticmethod
+    def batchTriples(pending):
+        """Returns list of candidate (verfer, sig, ser) triples for the attached
+        signatures of the pending batch given by pending, list of (exts, kvy).
+        Signing keys come from the latest establishment event for each
+        prefix whether in the batch itself or else in kvy.kevers. Candidates
+        that later turn out to be the wrong key just fail to verify in batch.
+        """
+        triples = []
+        states = {}  # latest (verfers, wits) of each prefix within batch
+        raws = {}  # raw of each event within batch keyed by (pre, said)
+        for exts, kvy in pending:
+            serder = exts['serder']
+            pre = serder.pre
+            if pre in states:
+                verfers, wits = states[pre]
+            elif (kever := kvy.kevers.get(pre)) is not None:
+                verfers, wits = kever.verfers, kever.wits
+            else:
+                verfers, wits = [], []
+
+            if serder.ilk in (Ilks.icp, Ilks.dip, Ilks.rot, Ilks.drt):
+                verfers = serder.verfers
+                if serder.ilk in (Ilks.icp, Ilks.dip):
+                    wits = serder.backs
+                states[pre] = (verfers, wits)
+
+            if serder.ilk == Ilks.rct:  # receipt signs receipted event
+                raw = raws.get((pre, serder.said))
+                if raw is None:
+                    lserder = kvy.db.evts.get(keys=(serder.preb, serder.saidb))
+                    if lserder is None:
+                        continue
+                    raw = lserder.raw
+            else:
+                raw = raws[(pre, serder.said)] = serder.raw
+
+            for siger in exts['sigers']:
+                if siger.index < len(verfers):
+                    triples.append((verfers[siger.index], siger.raw, raw))
+
+            for wiger in exts['wigers']:
+                if wiger.index < len(wits):
+                    try:
+                        verfer = Verfer(qb64=wits[wiger.index])
+                    except Exception:  # unsupported witness prefix code
+                        continue
+                    triples.append((verfer, wiger.raw, raw))
+
+            for cigar in exts['cigars']:
+                if getattr(cigar, "verfer", None) is not None:
+                    triples.append((cigar.verfer, cigar.raw, raw))
+
+        return triples
+
+
     # Group parse/extract methods for dispatch based on CESR version
     def _ControllerIdxSigs1(self, exts, ims, ctr, cold, abort):
         """Generator to extract CESRv1 ControllerIdxSigs group
@@ -141,7 +141,8 @@ class Serdery:
         self.version = version
 
 
-    def reap(self, ims, genus, svrsn, cold=None, ctr=None, size=None, fixed=True):
+    def reap(self, ims, genus, svrsn, cold=None, ctr=None, size=None, fixed=True,
+             verify=True):
         """Extract and return Serder subclass based on protocol type reaped from
         version string inside serialized raw of Serder.
 
@@ -169,6 +170,8 @@ class Serdery:
             fixed (bool): when CESR native message.
                                True means top-level fixed field
                                False means top-level field map
+            verify (bool): True means verify said(s) of reaped Serder.
+                           False means caller verifies later if needed
         """
         if ctr:  # parser sniffed and peekd so native and assigned ctr, size, fixed
             # parser already peeked to see .FixBodyGroup or .MapBodyGroup so
@@ -221,9 +224,9 @@ class Serdery:
 
 
         if smellage.proto == Protocols.keri:
-            return SerderKERI(raw=ims, strip=True, smellage=smellage)
+            return SerderKERI(raw=ims, strip=True, smellage=smellage, verify=verify)
         elif smellage.proto == Protocols.acdc:
-            return SerderACDC(raw=ims, strip=True, smellage=smellage)
+            return SerderACDC(raw=ims, strip=True, smellage=smellage, verify=verify)
         else:
             raise ProtocolError(f"Unsupported protocol type = {smellage.proto}.")
 
@@ -265,6 +268,10 @@ class Serder:
         Proto (str): default message protocol
         Vrsn (Versionage): default version
         Kind (str): default serialization kind one of Serials
+        Memoize (bool): True means cache derived primitive property values such
+            as .verfers or .tholder per instance on first access. Since a
+            Serder is immutable after init each is then only converted once.
+            False means convert anew on every access to save memory.
         Fields (dict): nested dict of field labels keyed by protocol, version,
             and message type (ilk). Felds labels are provided with a Fieldage
             named tuple (saids, reqs, alls) that governs field type and presence.
@@ -303,6 +310,8 @@ class Serder:
             supported kinds are 'json', 'cbor', 'msgpack', 'binary'
         ._size is int of number of bytes in serialed event only
         ._said (str): qb64 given by appropriate saidive field
+        ._memo (dict | None): cached derived property values keyed by label
+            when .Memoize else None
 
     Methods:
         verify()
@@ -358,6 +367,7 @@ class Serder:
     Kind = Kinds.json  # default serialization kind
     Genus = GenDex.KERI  # default CESR genus code
     MUCodes = Counter.MUCodes # message universal code tables from Counter
+    Memoize = True  # cache derived primitive properties per instance
 
 
     # Nested dict keyed by protocol.
@@ -603,6 +613,7 @@ class Serder:
         self._gvrsn = gvrsn
         self._kind = kind
         self._size = None
+        self._memo = {} if self.Memoize else None
 
 
         if raw:  # deserialize raw using property setter
@@ -878,6 +889,7 @@ class Serder:
         self._raw = raw
         self._size = size
         self._sad = sad
+        self._memo = {} if self.Memoize else None  # drop stale derived values
 
 
     def _makify(self, sad, *, proto=None, pvrsn=None, genus=None, gvrsn=None,
@@ -1970,6 +1982,23 @@ class Serder:
         return json.dumps(self._sad, indent=1)[:size]
 
 
+    def _memoize(self, label, make):
+        """Returns derived value for label from ._memo when already cached
+        otherwise computes value with make() and caches it when .Memoize.
+        Returned lists are shallow copies so callers may not alter the cache.
+
+        Parameters:
+            label (str): cache key usually the name of the property
+            make (Callable): computes derived value from ._sad
+        """
+        if self._memo is None:
+            return make()
+        if label not in self._memo:
+            self._memo[label] = make()
+        value = self._memo[label]
+        return list(value) if isinstance(value, list) else value
+
+
     @property
     def raw(self):
         """raw property getter
@@ -2254,7 +2283,8 @@ class SerderKERI(Serder):
             (Number): of ._sad["s"] hex number str converted
         """
         # auto converts hex num str to int
-        return Number(num=self._sad["s"]) if 's' in self._sad else None
+        return self._memoize("sner", lambda: Number(num=self._sad["s"])
+                                             if 's' in self._sad else None)
 
 
     @property
@@ -2306,7 +2336,8 @@ class SerderKERI(Serder):
                 or None if missing.
 
         """
-        return Tholder(sith=self._sad["kt"]) if "kt" in self._sad else None
+        return self._memoize("tholder", lambda: Tholder(sith=self._sad["kt"])
+                                                if "kt" in self._sad else None)
 
 
     @property
@@ -2324,8 +2355,11 @@ class SerderKERI(Serder):
         One for each key.
         verfers property getter
         """
-        keys = self._sad.get("k")
-        return [Verfer(qb64=key) for key in keys] if keys is not None else None
+        def make():
+            keys = self._sad.get("k")
+            return [Verfer(qb64=key) for key in keys] if keys is not None else None
+
+        return self._memoize("verfers", make)
 
 
     @property
@@ -2333,7 +2367,8 @@ class SerderKERI(Serder):
         """Returns Tholder instance as converted from ._sad['nt'] or None if missing.
 
         """
-        return Tholder(sith=self._sad["nt"]) if "nt" in self._sad else None
+        return self._memoize("ntholder", lambda: Tholder(sith=self._sad["nt"])
+                                                 if "nt" in self._sad else None)
 
 
     @property
@@ -2358,8 +2393,11 @@ class SerderKERI(Serder):
         if self.pvrsn.major < 2 and self.pvrsn.minor < 1 and self.ilk == Ilks.vcp:
             return None
 
-        digs = self._sad.get("n")
-        return [Diger(qb64=dig) for dig in digs] if digs is not None else None
+        def make():
+            digs = self._sad.get("n")
+            return [Diger(qb64=dig) for dig in digs] if digs is not None else None
+
+        return self._memoize("ndigers", make)
 
 
     @property
@@ -2370,7 +2408,8 @@ class SerderKERI(Serder):
             (Number): of ._sad["bt"] hex number str converted. Auto converts
             hex num str to int
         """
-        return Number(num=self._sad["bt"]) if 'bt' in self._sad else None
+        return self._memoize("bner", lambda: Number(num=self._sad["bt"])
+                                             if 'bt' in self._sad else None)
 
 
     @property
@@ -2403,8 +2442,11 @@ class SerderKERI(Serder):
                 One for each backer (witness).
 
         """
-        baks = self._sad.get("b")
-        return [Verfer(qb64=bak) for bak in baks] if baks is not None else None
+        def make():
+            baks = self._sad.get("b")
+            return [Verfer(qb64=bak) for bak in baks] if baks is not None else None
+
+        return self._memoize("berfers", make)
 
 
     # properties for priorative Serders like ixn rot drt
@@ -2799,6 +2841,7 @@ class SerderACDC(Serder):
         self._raw = raw
         self._size = size
         self._sad = sad
+        self._memo = {} if self.Memoize else None  # drop stale derived values
 
 
     def _compute(self, sad, saids, compactify=False):
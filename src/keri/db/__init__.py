@@ -6,9 +6,9 @@ keri.db Package
 
 from . import basing, dbing, escrowing, koming, subing, webdbing
 
-from .basing import Baser, BaserDoer, openDB, reopenDB, statedict
+from .basing import Baser, BaserDoer, openDB, reopenDB, statedict, writeMsgs
 from .dbing import (LMDBer, clearDatabaserDir, openLMDB, onKey,
-                    snKey, fnKey, dgKey, dtKey, splitKey, splitOnKey,
+                    snKey, fnKey, dgKey, dtKey, tmKey, splitKey, splitOnKey,
                     splitKeyDT, fetchTsgs, suffix, unsuffix,
                     splitKeyFN, SuffixSize, splitSnKey, MaxSuffix)
 from .webdbing import WebDBer
@@ -4,6 +4,7 @@ KERI
 keri.db.basing module
 """
 import importlib
+import json
 import os
 import shutil
 from collections import namedtuple
@@ -16,7 +17,7 @@ from hio.base import doing
 from hio.help import ogler
 
 from keri import __version__
-from .dbing import LMDBer, dgKey, openLMDB
+from .dbing import LMDBer, dgKey, tmKey, openLMDB
 from ..kering import (MissingEntryError, DatabaseError,
                       ConfigurationError, ValidationError,
                       Vrsn_1_0, Vrsn_2_0)
@@ -49,6 +50,12 @@ MIGRATIONS = [
     ("1.2.0", ["rekey_habs"])
 ]
 
+# Index backfill migrations gated on their .migs record instead of on database
+# version since databases already at a dev version of the release that added an
+# index would otherwise never be backfilled. Each is idempotent.
+BACKFILLS = ["add_seal_index", "add_tail_index", "add_contact_index",
+             "add_kram_expiry_index", "add_escrow_expiry_index"]
+
 
 # ToDo XXXX maybe
 '''
@@ -77,17 +84,36 @@ class statedict(dict):
     Subclass of dict that has db as attribute and employs read through cache
     from db Baser.stts of kever states to reload kever from state in database
     when not found in memory as dict item.
+
+    When .cap is not None the cache is bounded to at most .cap kevers by least
+    recently used (LRU) eviction. Kevers of local prefixes in .db.prefixes and
+    .db.groups are pinned so never evicted. An evicted kever is reloaded from
+    its state in database on its next access.
+
+    Attributes:
+        db (Baser|None): database of states for read through. None means
+            memory only.
+        cap (int|None): maximum number of kevers kept in memory. None means
+            unbounded so never evict.
+        hits (int): count of lookups found in memory
+        misses (int): count of lookups not found in memory so read through db
+        evictions (int): count of kevers evicted from memory
     """
-    __slots__ = ('db')  # no .__dict__ just for db reference
+    __slots__ = ('db', 'cap', 'hits', 'misses', 'evictions')  # no .__dict__
 
-    def __init__(self, *pa, **kwa):
+    def __init__(self, *pa, cap=None, **kwa):
         super(statedict, self).__init__(*pa, **kwa)
         self.db = None
+        self.cap = cap
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def __getitem__(self, k):
         try:
-            return super(statedict, self).__getitem__(k)
+            val = super(statedict, self).__getitem__(k)
         except KeyError as ex:
+            self.misses += 1
             if not self.db:
                 raise ex  # reraise KeyError
             if (ksr := self.db.states.get(keys=k)) is None:
@@ -100,6 +126,19 @@ class statedict(dict):
             self.__setitem__(k, kever)
             return kever
 
+        self.hits += 1
+        if self.cap is not None:  # move to most recently used end
+            super(statedict, self).__delitem__(k)
+            super(statedict, self).__setitem__(k, val)
+        return val
+
+    def __setitem__(self, k, v):
+        if self.cap is not None and super(statedict, self).__contains__(k):
+            super(statedict, self).__delitem__(k)  # reinsert as most recent
+        super(statedict, self).__setitem__(k, v)
+        if self.cap is not None and len(self) > self.cap:
+            self.evict(keep=k)
+
     def __contains__(self, k):
         if not super(statedict, self).__contains__(k):
             try:
@@ -126,6 +165,57 @@ class statedict(dict):
         else:
             return self.__getitem__(k)
 
+    def evict(self, keep=None):
+        """Evicts least recently used unpinned kevers until at most .cap remain.
+        Kevers of .db.prefixes and .db.groups are pinned as is key keep.
+
+        Parameters:
+            keep (str|None): key of item just inserted so not evicted
+        """
+        if self.cap is None:
+            return
+
+        pinned = set()
+        if self.db is not None:
+            pinned.update(self.db.prefixes)
+            pinned.update(self.db.groups)
+        if keep is not None:
+            pinned.add(keep)
+
+        # dict iterates from least recently used first
+        victims = []
+        excess = len(self) - self.cap
+        for k in super(statedict, self).keys():
+            if excess <= len(victims):
+                break
+            if k not in pinned:
+                victims.append(k)
+
+        for k in victims:
+            super(statedict, self).__delitem__(k)
+            self.evictions += 1
+
+
+def writeMsgs(msgs, out):
+    """
+    Writes each message of msgs to out as it is yielded so the whole stream is
+    never held in memory at once.
+
+    Returns:
+        size (int): total number of bytes written
+
+    Parameters:
+        msgs (Iterable[bytes|bytearray]): CESR messages with attachments such
+            as from .clonePreIter
+        out: binary file like object with .write or socket with .sendall
+    """
+    write = out.sendall if hasattr(out, "sendall") else out.write
+    size = 0
+    for msg in msgs:
+        write(msg)
+        size += len(msg)
+    return size
+
 
 def openDB(*, cls=None, name="test", **kwa):
     """
@@ -161,17 +251,24 @@ def reopenDB(db, clear=False, **kwa):
 
 
 KERIBaserMapSizeKey = "KERI_BASER_MAP_SIZE"
+KERIBaserKeverCapKey = "KERI_BASER_KEVER_CAP"
 
 
 class Baser(LMDBer):
     """
     Baser sets up named sub databases with Keri Event Logs within main database
 
+    Class Attributes:
+        CleanChunk (int): number of identifier prefixes replayed per chunk by
+            .cloneObjReplay. Each chunk is verified as one batch and committed
+            as one transaction with its checkpoint.
+
     Attributes:
         see superclass LMDBer for inherited attributes
 
         kevers (dbdict): read-through cache of Kever instances indexed by
-            identifier prefix qb64
+            identifier prefix qb64. Bounded by LRU eviction when kever cap
+            provided otherwise unbounded.
         prefixes (OrderedSet): local prefixes corresponding to habitats for
             this db
         groups (OrderedSet): group hab identifier prefixes for this db
@@ -201,6 +298,33 @@ class Baser(LMDBer):
             Value: qb64 digest used to lookup event in .evts.
             More than one value per DB key is allowed.
 
+        .seas is named subDB instance of CatCesrIoSetSuber
+            (klas=(Number, Diger)) for the anchored seal index of every seal
+            in the seals list of each logged key event. Maps (prefix, sealKey
+            of seal) to (sn, dig) of each event in the KEL of prefix that
+            anchors the seal so that anchoring event lookups for delegation
+            and TEL anchors are a get instead of a scan of the whole KEL.
+            subkey 'seas.'
+            Keys: (identifier prefix of anchoring KEL, sealKey(seal))
+            More than one value per DB key is allowed (insertion ordered).
+
+        .lels is named subDB instance of OnSuber for the sn index of the last
+            event at each sn of each KEL. Mirrors the last duplicate at each
+            key of .kels so that tail lookups by (prefix, sn) are a single get
+            instead of a cursor walk over the duplicates of .kels.
+            subkey 'lels.'
+            Key: identifier prefix + sequence number.
+            Value: qb64 str of digest of last event at sn.
+            Only one value per DB key is allowed.
+
+        .tails is named subDB instance of CatCesrSuber
+            (klas=(Number, Number, Diger)) for the latest first seen event of
+            each KEL. Maps prefix to (sn, fn, dig) of that event in fixed width
+            (Huge) Number encoding.
+            subkey 'tails.'
+            Key: identifier prefix
+            Only one value per DB key is allowed.
+
         .dtss is named subDB instance of CesrSuber (klas=Dater) for datetime
             stamps of when the event was first escrowed and then later first
             seen by log. Used for escrow timeouts and extended validation.
@@ -341,6 +465,17 @@ class Baser(LMDBer):
             Values are qb64 digests used to lookup event in .evts.
             More than one value per DB key is allowed (insertion ordered).
 
+        .exes is named subDB instance of CatCesrIoSetSuber
+            (klas=(Number, Diger)) for the expiry ordered index of the
+            .ooes, .pses, .pwes, .pdes, and .ldes escrows. Maps
+            (escrow, tmKey(escrow datetime), prefix) to (sn, dig) of the
+            escrowed event so that stale escrows are pruned by walking only the
+            expired head of each escrow's branch instead of the whole escrow.
+            subkey 'exes.'
+            Keys: (escrow subkey name, time ordered stamp, identifier prefix)
+            Entries are not removed on unescrow so the pruner tolerates
+            entries whose escrow is already gone.
+
         .qnfs is named subDB instance of IoSetSuber for queued not-first-seen
             event escrows. Maps (prefix, said) to event digest.
             subkey 'qnfs.'
@@ -559,6 +694,15 @@ class Baser(LMDBer):
             subkey 'ecigs.'
             Multiple values per key.
 
+        .exvs is named subDB instance of CesrSuber (klas=Dater) for exchange
+            message verification stamps. Keyed like .esigs by (exn said, signer
+            pre, sn of signer est event, said of signer est event) and maps to
+            the datetime the signatures of that group were verified at ingest.
+            Stored exn messages with a stamp need not be verified again while
+            the stamped est event is still the one at that sn in the KEL.
+            subkey 'exvs.'
+            Only one value per DB key is allowed.
+
         .epath is named subDB instance of IoSetSuber for exchange message
             pathed attachments.
             subkey 'epath.'
@@ -673,6 +817,18 @@ class Baser(LMDBer):
             subkey b'imgs.'
             Raw bytes values; accessed directly via env.open_db.
 
+        .cidx is named subDB instance of IoSetSuber for the index of contact
+            field values of remote identifiers. Keyed by field/value with
+            value truncated to MaxIdxSize chars, sep is unit separator.
+            Values are the prefixes of contacts with that field value.
+            subkey 'cidx.'
+
+        .cgrm is named subDB instance of IoSetSuber for the substring search
+            index of contact field values of remote identifiers. Keyed by
+            field/n-gram of lowercase value, sep is unit separator.
+            Values are the prefixes of contacts with the n-gram in field.
+            subkey 'cgrm.'
+
         .ifld is named subDB instance of Suber for identifier field values
             for local identifiers. Keyed by prefix/field.
             subkey 'ifld.'
@@ -691,6 +847,14 @@ class Baser(LMDBer):
             subkey b'iimgs.'
             Raw bytes values; accessed directly via env.open_db.
 
+        .iidx is named subDB instance of IoSetSuber for the index of
+            identifier field values of local identifiers. Same as .cidx.
+            subkey 'iidx.'
+
+        .igrm is named subDB instance of IoSetSuber for the substring search
+            index of identifier field values of local identifiers. Same as .cgrm.
+            subkey 'igrm.'
+
         .dpwe is named subDB instance of SerderSuber for delegated partial
             witness escrows. Maps key to serialized Serder of the escrowed
             delegated event.
@@ -738,6 +902,17 @@ class Baser(LMDBer):
             datetimes, drift, and lag values.
             subkey 'tmsc.'
 
+        .kramMEXP is named subDB instance of Suber for the KRAM message cache
+            expiry index. Maps (expiry, AID, MID) to the .kramMSGC key where
+            expiry is the 32 char hex of the POSIX ms after which the entry
+            is pruned, so pruning reads only the expired prefix.
+            subkey 'mexp.'
+
+        .kramTEXP is named subDB instance of Suber for the KRAM transactioned
+            message cache expiry index. Maps (expiry, AID, XID, MID) to the
+            .kramTMSC key with expiry as in .kramMEXP.
+            subkey 'texp.'
+
         .kramPMKM is named subDB instance of SerderSuber for KRAM partially signed
             multi-key messages. Maps (AID, MID) key to the associated
             SerderKERI message.
@@ -850,8 +1025,9 @@ class Baser(LMDBer):
         kevers (statedict): read through cache of kevers of states for KELs in db
 
     """
+    CleanChunk = 64  # identifier prefixes per replay chunk and checkpoint
 
-    def __init__(self, headDirPath=None, reopen=False, **kwa):
+    def __init__(self, headDirPath=None, reopen=False, keverCap=None, **kwa):
         """
         Setup named sub databases.
 
@@ -866,12 +1042,24 @@ class Baser(LMDBer):
                 If not provided use default .HeadDirpath
             mode is int numeric os dir permissions for database directory
             reopen (bool): True means database will be reopened by this init
+            keverCap (int|None): maximum number of Kever instances to keep in
+                memory in .kevers read through cache. Local .prefixes and
+                .groups kevers are pinned. None means use KERI_BASER_KEVER_CAP
+                env var if any otherwise unbounded.
 
 
         """
         self.prefixes = oset()  # should change to hids for hab ids
         self.groups = oset()  # group hab ids
-        self._kevers = statedict()
+
+        if keverCap is None and (keverCap := os.getenv(KERIBaserKeverCapKey)) is not None:
+            try:
+                keverCap = int(keverCap)
+            except ValueError:
+                logger.error("KERI_BASER_KEVER_CAP must be an integer value >0!")
+                raise
+
+        self._kevers = statedict(cap=keverCap)
         self._kevers.db = self  # assign db for read through cache of kevers
 
         if (mapSize := os.getenv(KERIBaserMapSizeKey)) is not None:
@@ -918,6 +1106,11 @@ class Baser(LMDBer):
         self.evts = subing.SerderSuber(db=self, subkey='evts.')
         self.fels = subing.OnSuber(db=self, subkey='fels.')
         self.kels = subing.OnIoDupSuber(db=self, subkey='kels.')
+        self.seas = subing.CatCesrIoSetSuber(db=self, subkey='seas.',
+                                             klas=(coring.Number, coring.Diger))
+        self.lels = subing.OnSuber(db=self, subkey='lels.')
+        self.tails = subing.CatCesrSuber(db=self, subkey='tails.',
+                                         klas=(coring.Number, coring.Number, coring.Diger))
         self.dtss = subing.CesrSuber(db=self, subkey='dtss.', klas=coring.Dater)
         self.aess = subing.CatCesrSuber(db=self, subkey='aess.',
                                         klas=(coring.Number, coring.Diger))
@@ -941,6 +1134,8 @@ class Baser(LMDBer):
         self.dels = subing.OnIoDupSuber(db=self, subkey='dels.')
         self.ldes = subing.OnIoDupSuber(db=self, subkey='ldes.')
         self.qnfs = subing.IoSetSuber(db=self, subkey="qnfs.", dupsort=True)
+        self.exes = subing.CatCesrIoSetSuber(db=self, subkey='exes.',
+                                             klas=(coring.Number, coring.Diger))
 
         # events as ordered by first seen ordinals
         self.fons = subing.CesrSuber(db=self, subkey='fons.', klas=coring.Number)
@@ -1073,6 +1268,9 @@ class Baser(LMDBer):
         self.ecigs = subing.CatCesrIoSetSuber(db=self, subkey='ecigs.',
                                               klas=(coring.Verfer, coring.Cigar))
 
+        # exchange message signature group verification stamps
+        self.exvs = subing.CesrSuber(db=self, subkey='exvs.', klas=coring.Dater)
+
         # exchange pathed attachments
         # TODO: clean
         self.epath = subing.IoSetSuber(db=self, subkey="epath.")
@@ -1196,6 +1394,10 @@ class Baser(LMDBer):
                                          klas=(coring.Noncer, coring.Noncer,
                                                coring.Labeler, coring.Texter))
 
+        # Indexes of contact field values and their n-grams to prefixes
+        self.cidx = subing.IoSetSuber(db=self, subkey='cidx.', sep='\x1f')
+        self.cgrm = subing.IoSetSuber(db=self, subkey='cgrm.', sep='\x1f')
+
         # Field values for identifier information for local identifiers. Keyed by prefix/field
         # TODO: clean
         self.ifld = subing.Suber(db=self,
@@ -1216,6 +1418,10 @@ class Baser(LMDBer):
                                           klas=(coring.Noncer, coring.Noncer,
                                                 coring.Labeler, coring.Texter))
 
+        # Indexes of identifier field values and their n-grams to prefixes
+        self.iidx = subing.IoSetSuber(db=self, subkey='iidx.', sep='\x1f')
+        self.igrm = subing.IoSetSuber(db=self, subkey='igrm.', sep='\x1f')
+
         # Delegation escrow dbs #
         # delegated partial witness escrow
         self.dpwe = subing.SerderSuber(db=self, subkey='dpwe.')
@@ -1251,6 +1457,12 @@ class Baser(LMDBer):
         self.kramTMSC = koming.Komer(db=self, subkey='tmsc.',
                                  klas=TxnMsgCacheRecord)
 
+        # KRAM message cache expiry index — key: (expiry, AID, MID), value: AID.MID
+        self.kramMEXP = subing.Suber(db=self, subkey='mexp.')
+
+        # KRAM txn message cache expiry index — key: (expiry, AID, XID, MID), value: AID.XID.MID
+        self.kramTEXP = subing.Suber(db=self, subkey='texp.')
+
         # KRAM partially signed multi-key message key (AID.MID) mapped to associated message (SerderKERI)
         self.kramPMKM = subing.SerderSuber(db=self, subkey='pmkm.')
 
@@ -1321,6 +1533,9 @@ class Baser(LMDBer):
         if not self.current:
             raise DatabaseError(f"Database migrations must be run. DB version {self.version}; current {__version__}")
 
+        if not self.readonly:
+            self.backfill()
+
         removes = []
         for keys, data in self.habs.getTopItemIter():
             if (ksr := self.states.get(keys=data.hid)) is not None:
@@ -1397,6 +1612,32 @@ class Baser(LMDBer):
             self.version = version
 
         self.version = __version__
+        self.backfill()
+
+    def backfill(self):
+        """ Run index backfill migrations in BACKFILLS not already run
+
+        Each is run at most once per database as recorded in .migs regardless
+        of database version. Backfills with nothing to index are recorded
+        without being run.
+
+        """
+        from ..core import coring
+
+        for migration in BACKFILLS:
+            if self.migs.get(keys=(migration,)) is not None:
+                continue
+
+            mod = importlib.import_module(f"keri.db.migrations.{migration}")
+            if mod._check_if_needed(self):
+                try:
+                    print(f"running migration {mod.__name__}")
+                    mod.migrate(self)
+                except Exception as e:
+                    print(f"\nAbandoning migration {migration} with error: {e}")
+                    return
+
+            self.migs.pin(keys=(migration,), val=coring.Dater())
 
     def _trimAllEscrows(self):
         """Trim all escrow databases via low-level .trim().
@@ -1411,7 +1652,7 @@ class Baser(LMDBer):
             self.qnfs, self.uwes, self.misfits, self.delegables,
             self.pdes, self.udes, self.rpes, self.ldes, self.epsd,
             self.eoobi, self.dpub, self.gpwe, self.gdee, self.dpwe,
-            self.gpse, self.epse, self.dune,
+            self.gpse, self.epse, self.dune, self.exes,
         ]
         total = 0
         for escrow in escrows:
@@ -1431,11 +1672,147 @@ class Baser(LMDBer):
                        self.qnfs, self.misfits, self.delegables, self.pdes,
                        self.udes, self.rpes, self.ldes, self.epsd, self.eoobi,
                        self.dpub, self.gpwe, self.gdee, self.dpwe, self.gpse,
-                       self.epse, self.dune]:
+                       self.epse, self.dune, self.exes]:
             count = escrow.cntAll()
             escrow.trim()
             logger.info(f"KEL: Cleared {count} escrows from ({escrow}")
 
+    def indexEscrow(self, escrow, pre, sn, dig):
+        """
+        Add escrowed event to expiry ordered escrow index .exes under the
+        escrow datetime already stored in .dtss for the event. Idempotent
+        because .dtss is only written once per event so re-escrow on retry
+        maps to the same index entry.
+
+        Returns:
+            result (bool): True if index entry added. False if already indexed
+                or no escrow datetime for event.
+
+        Parameters:
+            escrow (str): subkey name of escrow such as "ooes"
+            pre (str|bytes): identifier prefix of escrowed event
+            sn (int): sequence number of escrowed event
+            dig (str|bytes): digest of escrowed event
+        """
+        from ..core import coring
+
+        if hasattr(pre, "decode"):
+            pre = pre.decode()
+        if hasattr(dig, "decode"):
+            dig = dig.decode()
+        if (dater := self.dtss.get(keys=dgKey(pre, dig))) is None:
+            return False
+        return self.exes.add(keys=(escrow, tmKey(dater.datetime), pre),
+                             val=(coring.Number(num=sn), coring.Diger(qb64=dig)))
+
+    @staticmethod
+    def sealKey(seal):
+        """
+        Returns:
+            key (str): qb64 digest of the compact JSON serialization of seal
+                dict in field order. Seals of the same type and field values
+                have the same key.
+
+        Parameters:
+            seal (dict): dict form of seal of any type
+        """
+        from ..core import coring
+
+        return coring.Diger(ser=json.dumps(seal, separators=(",", ":")).encode()).qb64
+
+    def indexSeals(self, serder):
+        """
+        Add every dict seal in the seals list of key event serder to the anchored
+        seal index .seas. Idempotent since .seas is a set per key.
+
+        Parameters:
+            serder (SerderKERI): logged key event
+        """
+        from ..core import coring
+
+        for seal in serder.seals or []:  # or [] for seals 'a' field missing
+            if isinstance(seal, dict):
+                self.seas.add(keys=(serder.pre, self.sealKey(seal)),
+                              val=(coring.Number(num=serder.sn),
+                                   coring.Diger(qb64=serder.said)))
+
+    def sealingEventIter(self, pre, seal, sn=0, last=False):
+        """
+        Returns iterator of events in the KEL of pre at or after sn that anchor
+        seal in sn order as looked up in the anchored seal index .seas.
+
+        Parameters:
+            pre (bytes|str): identifier of the KEL to search
+            seal (dict): dict form of seal of any type to find
+            sn (int): beginning sn to search
+            last (bool): True means only last event at each sn so does not
+                include disputed and/or superseded events.
+                False means include all events at each sn.
+        """
+        if hasattr(pre, "decode"):
+            pre = pre.decode()
+
+        anchors = sorted(((num.num, diger.qb64) for num, diger in
+                          self.seas.getIter(keys=(pre, self.sealKey(seal)))),
+                         key=lambda anchor: anchor[0])  # stable so insertion order at sn
+        for esn, dig in anchors:
+            if esn < sn:
+                continue
+            if last and self.lastDig(pre=pre, sn=esn) != dig:
+                continue  # disputed or superseded
+            if (serder := self.evts.get(keys=(pre, dig))) is not None:
+                yield serder
+
+    def indexTail(self, serder, fn=None, last=True):
+        """
+        Update the sn index .lels and KEL tail index .tails for key event
+        serder just logged to .kels.
+
+        Parameters:
+            serder (SerderKERI): logged key event
+            fn (int|None): first seen ordinal of serder when first seen else None
+            last (bool): True means serder was just added as the last event at
+                its sn in .kels. False means serder was already in .kels.
+        """
+        from ..core import coring
+
+        if last:
+            self.lels.pin(keys=serder.preb, on=serder.sn, val=serder.saidb)
+        if fn is not None:
+            self.tails.pin(keys=serder.preb,
+                           val=(coring.Number(num=serder.sn, code=coring.NumDex.Huge),
+                                coring.Number(num=fn, code=coring.NumDex.Huge),
+                                coring.Diger(qb64=serder.said)))
+
+    def lastDig(self, pre, sn=0):
+        """
+        Returns:
+            dig (str|None): qb64 digest of last event at sn in KEL of pre, or
+                None if no event at sn. Same as .kels.getLast but from the sn
+                index .lels. Falls back to .kels for entries not indexed.
+
+        Parameters:
+            pre (bytes|str): identifier prefix
+            sn (int): sequence number of event
+        """
+        if (dig := self.lels.get(keys=pre, on=sn)) is None:
+            dig = self.kels.getLast(keys=pre, on=sn)
+        return dig
+
+    def tail(self, pre):
+        """
+        Returns:
+            tail (tuple|None): (sn, fn, dig) of latest first seen event in KEL
+                of pre as (int, int, str) or None if not indexed
+
+        Parameters:
+            pre (bytes|str): identifier prefix
+        """
+        if (val := self.tails.get(keys=pre)) is None:
+            return None
+        sner, fner, diger = val
+        return (sner.num, fner.num, diger.qb64)
+
     @property
     def current(self):
         """ Current property determines if we are at the current database migration state.
@@ -1485,6 +1862,8 @@ class Baser(LMDBer):
                     for mig in migs:
                         dater = self.migs.get(keys=(mig,))
                         migrations.append((mig, dater))
+            for mig in BACKFILLS:
+                migrations.append((mig, self.migs.get(keys=(mig,))))
         else:
             for version, migs in MIGRATIONS:  # check all migrations for each version
                 if name not in migs or not self.migs.get(keys=(name,)):
@@ -1493,7 +1872,7 @@ class Baser(LMDBer):
 
         return migrations
 
-    def clean(self):
+    def clean(self, workers=None):
         """
         Clean database by creating re-verified cleaned cloned copy
         and then replacing original with cleaned cloned copy
@@ -1501,15 +1880,33 @@ class Baser(LMDBer):
         Database usage should be offline during cleaning as it will be cloned in
         readonly mode
 
+        The replay of the FELs into the copy records a checkpoint in the copy
+        with each committed chunk of prefixes. The path of the copy is recorded
+        in the original so when cleaning is interrupted a later clean reopens
+        the copy as is, instead of remaking it, and resumes after the last
+        checkpoint.
+
+        Parameters:
+            workers (int|None): number of worker processes to verify the
+                signatures of independent prefixes in parallel. None or <= 1
+                means verify in this process.
         """
-        from ..core import parsing
+        from . import subing
+
+        copy = Baser(name=self.name,
+                     temp=False,
+                     headDirPath=self.headDirPath,
+                     perm=self.perm)  # not opened yet
+
+        # path of copy of interrupted clean if any lives in orig until replaced
+        with reopenDB(db=self, reuse=True):
+            paths = subing.Suber(db=self, subkey='clns.')
+            if (path := paths.get(keys=("path",))) and os.path.exists(path):
+                copy.path = path  # so reopen reuses copy instead of remaking
+            copy.reopen(clean=True, reuse=True)  # create copy to clone into
+            paths.pin(keys=("path",), val=copy.path)
 
-        # create copy to clone into
-        with openDB(name=self.name,
-                    temp=False,
-                    headDirPath=self.headDirPath,
-                    perm=self.perm,
-                    clean=True) as copy:  # copy is Baser instance
+        with reopenDB(db=copy, reuse=True):  # copy is Baser instance
 
             with reopenDB(db=self, reuse=True, readonly=True):  # reopen as readonly
                 if not os.path.exists(self.path):
@@ -1518,14 +1915,13 @@ class Baser(LMDBer):
                 from ..core.eventing import Kevery
                 kvy = Kevery(db=copy)  # promiscuous mode
 
-                # Revise in future to NOT parse msgs but to extract the processed
-                # objects so can pass directly to kvy.processEvent()
-                # need new method cloneObjAllPreIter()
-                # process event doesn't capture exceptions so we can more easily
-                # detect in the cloning that some events did not make it through
-                psr = parsing.Parser(kvy=kvy, version=Vrsn_1_0)
-                for msg in self.cloneAllPreIter():  # clone into copy
-                    psr.parseOne(ims=msg)
+                # checkpoint of last prefix replayed only lives during cleaning
+                clns = subing.Suber(db=copy, subkey='clns.')
+                self.cloneObjReplay(kvy=kvy,
+                                    resume=clns.get(keys=("fels",)),
+                                    workers=workers,
+                                    checkpoint=lambda pre: clns.pin(keys=("fels",),
+                                                                    val=pre))
 
                 # This is the list of non-set based databases that are not created as part of event processing.
                 # for now we are just copying them from self to copy without worrying about being able to
@@ -1544,7 +1940,8 @@ class Baser(LMDBer):
                 # This is the list of set based databases that are not created as part of event processing.
                 # for now we are just copying them from self to copy without worrying about being able to
                 # reprocess them.  We need a more secure method in the future
-                sets = ["esigs", "ecigs", "epath", "chas", "reps", "wkas", "meids", "maids"]
+                sets = ["esigs", "ecigs", "epath", "chas", "reps", "wkas", "meids", "maids",
+                        "cidx", "cgrm", "iidx", "igrm"]
                 for name in sets:
                     srcdb = getattr(self, name)
                     cpydb = getattr(copy, name)
@@ -1581,6 +1978,9 @@ class Baser(LMDBer):
                     if exists:  # only copy end if has at least one matching loc
                         copy.ends.put(keys=(cid, role, eid), val=val)
 
+                with copy.begin(write=True) as txn:  # replay done so drop checkpoint
+                    txn.drop(clns.sdb, delete=True)
+
                 # replace own kevers with copy kevers by clear and copy
                 # future do this by loading kever from .stts  key state subdb
                 self.kevers.clear()
@@ -1664,6 +2064,237 @@ class Baser(LMDBer):
             yield msg
 
 
+    def exportPre(self, pre, out, fn=0):
+        """
+        Writes first seen event messages with attachments for the identifier
+        prefix pre starting at fn to out as .clonePreIter yields them.
+
+        Returns:
+            size (int): total number of bytes written
+
+        Parameters:
+            pre (bytes|str): identifier prefix
+            out: binary file like object with .write or socket with .sendall
+            fn (int): fn to resume replay. Earliest is fn=0
+        """
+        return writeMsgs(self.clonePreIter(pre=pre, fn=fn), out)
+
+
+    def exportAll(self, out):
+        """
+        Writes first seen event messages with attachments for all identifier
+        prefixes to out as .cloneAllPreIter yields them.
+
+        Returns:
+            size (int): total number of bytes written
+
+        Parameters:
+            out: binary file like object with .write or socket with .sendall
+        """
+        return writeMsgs(self.cloneAllPreIter(), out)
+
+
+    def cloneObjPreIter(self, pre, fn=0):
+        """
+        Returns iterator of first seen events as hydrated objects for the
+        identifier prefix pre starting at first seen order number, fn.
+        Same replay as .clonePreIter without serializing to CESR.
+
+        Parameters:
+            pre is bytes of itdentifier prefix
+            fn is int fn to resume replay. Earliset is fn=0
+
+        Returns:
+           exts (Iterator): of dict from .cloneEvtObjs for each event
+        """
+        if hasattr(pre, 'encode'):
+            pre = pre.encode("utf-8")
+
+        for keys, fn, dig in self.fels.getAllItemIter(keys=pre, on=fn):
+            try:
+                exts = self.cloneEvtObjs(pre=pre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            yield exts
+
+
+    def cloneObjAllPreIter(self, resume=None):
+        """
+        Returns iterator of first seen events as hydrated objects for all
+        identifier prefixes in prefix order. Same replay as .cloneAllPreIter
+        without serializing to CESR.
+
+        Parameters:
+            resume (str|None): identifier prefix already replayed so replay
+                resumes with the next prefix after it. None means replay all.
+
+        Returns:
+           exts (Iterator): of dict from .cloneEvtObjs for each event
+        """
+        for keys, fn, dig in self.fels.getAllItemIter(keys=b'', on=0):
+            if resume is not None and keys[0] <= resume:
+                continue  # already replayed
+            pre = keys[0].encode() if isinstance(keys[0], str) else keys[0]
+            try:
+                exts = self.cloneEvtObjs(pre=pre, fn=fn, dig=dig)
+            except Exception:
+                continue  # skip this event
+            yield exts
+
+
+    def cloneObjReplay(self, kvy, *, resume=None, workers=None, checkpoint=None):
+        """
+        Replays FELs of all identifier prefixes after resume into Kevery kvy by
+        handing the hydrated objects from .cloneObjAllPreIter straight to the
+        same dispatch as Parser uses for KEL events with no reparse.
+
+        The replay proceeds in chunks of .CleanChunk prefixes. The candidate
+        signatures of each chunk are verified as a batch with verifyBatch and
+        handed to Kevery via Verfer.Verifieds as with Parser.flush. With
+        workers the batches of the next chunks are verified in worker
+        processes while the current chunk is dispatched. Prefixes of different
+        chunks are independent so may be verified in any order. Each chunk is
+        committed as one transaction together with its checkpoint.
+
+        Parameters:
+            kvy (Kevery): instance to replay into
+            resume (str|None): identifier prefix already replayed. None means
+                replay all.
+            workers (int|None): number of worker processes. None or <= 1
+                means verify in this process.
+            checkpoint (Callable|None): called with last prefix of each chunk
+                inside the chunk's transaction
+
+        Returns:
+            count (int): number of events replayed
+        """
+        from collections import deque
+        from concurrent.futures import ProcessPoolExecutor
+        from itertools import groupby, islice
+        from ..core import parsing
+        from ..core.eventing import verifyBatch
+
+        psr = parsing.Parser(kvy=kvy, version=Vrsn_1_0)
+        groups = groupby(self.cloneObjAllPreIter(resume=resume),
+                         key=lambda exts: exts['serder'].pre)
+        chunks = iter(lambda: [exts for _, group in islice(groups, self.CleanChunk)
+                               for exts in group], [])
+
+        pool = None
+        if workers and workers > 1:
+            pool = ProcessPoolExecutor(max_workers=workers)
+        ahead = workers if pool is not None else 0  # chunks verifying ahead
+        count = 0
+        inflight = deque()
+        try:
+            for chunk in chunks:
+                triples = psr.batchTriples([(exts, kvy) for exts in chunk])
+                if pool is not None:
+                    verified = pool.submit(verifyBatch, triples)
+                else:
+                    verified = verifyBatch(triples)
+                inflight.append((chunk, triples, verified))
+
+                while len(inflight) > ahead:
+                    count += self._replayChunk(psr, kvy, *inflight.popleft(),
+                                               checkpoint=checkpoint)
+
+            while inflight:
+                count += self._replayChunk(psr, kvy, *inflight.popleft(),
+                                           checkpoint=checkpoint)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        return count
+
+
+    def _replayChunk(self, psr, kvy, chunk, triples, verified, *, checkpoint=None):
+        """
+        Dispatches chunk of hydrated events to kvy with the verified triples
+        of the chunk in Verfer.Verifieds. Returns number of events in chunk.
+
+        Parameters:
+            psr (Parser): instance whose .kevDispatch dispatches each event
+            kvy (Kevery): instance to replay into
+            chunk (list): of dict from .cloneEvtObjs
+            triples (list): of candidate (verfer, sig, ser) triples of chunk
+            verified (list|Future): of bool one per triple or Future thereof
+            checkpoint (Callable|None): called with last prefix of chunk
+                inside the chunk's transaction
+        """
+        from ..core.coring import Verfer
+
+        if hasattr(verified, "result"):  # verified in worker process
+            verified = verified.result()
+        verifieds = set((verfer.raw, sig, ser)
+                        for (verfer, sig, ser), ok in zip(triples, verified) if ok)
+
+        prior = Verfer.Verifieds
+        Verfer.Verifieds = verifieds
+        try:
+            with kvy.db.txn():
+                for exts in chunk:
+                    try:
+                        psr.kevDispatch(exts=exts, kvy=kvy)
+                    except Exception as ex:  # log and resume with rest of chunk
+                        logger.error("Baser clean replay error: %s", ex)
+                        logger.debug("Event Body=\n%s\n", exts['serder'].pretty())
+                if checkpoint is not None:
+                    checkpoint(chunk[-1]['serder'].pre)
+        finally:
+            Verfer.Verifieds = prior
+
+        return len(chunk)
+
+
+    def cloneEvtObjs(self, pre, fn, dig):
+        """
+        Clones Event as hydrated objects in the same form as the extracted
+        message and attachments of a parsed cloned event message from
+        .cloneEvtMsg so it may be dispatched without serializing and reparsing.
+
+        Parameters:
+            pre (bytes): identifier prefix of event
+            fn (int): first seen number (ordinal) of event
+            dig (bytes): digest of event
+
+        Returns:
+            exts (dict): of event serder and attachments as Parser would extract
+        """
+        from ..core import coring
+
+        dgkey = dgKey(pre, dig)  # get message
+        if not (serder := self.evts.get(keys=(pre, dig))):
+            raise MissingEntryError("Missing event for dig={}.".format(dig))
+
+        if not (sigers := self.sigs.get(keys=dgkey)):
+            raise MissingEntryError("Missing sigs for dig={}.".format(dig))
+
+        if not (dater := self.dtss.get(keys=dgkey)):
+            raise MissingEntryError("Missing datetime for dig={}.".format(dig))
+
+        sscs = []  # authorizer (delegator/issuer) source seal event couple
+        if (duple := self.aess.get(keys=(pre, dig))) is not None:
+            number, diger = duple
+            sscs.append((coring.Seqner(sn=number.num), diger))
+
+        cigars = []  # nontrans endorsement couples
+        for prefixer, cigar in self.rcts.get(keys=dgkey):
+            cigar.verfer = coring.Verfer(qb64b=prefixer.qb64b)
+            cigars.append(cigar)
+
+        return dict(serder=serder,
+                    sigers=sigers,
+                    wigers=self.wigs.get(keys=dgkey),
+                    cigars=cigars,
+                    trqs=self.vrcs.get(keys=dgkey),  # trans endorsement quadruples
+                    tsgs=[],
+                    frcs=[(coring.Seqner(sn=fn), dater)],
+                    sscs=sscs,
+                    local=False)
+
+
     def cloneEvtMsg(self, pre, fn, dig):
         """
         Clones Event as Serialized CESR Message with Body and attached Foot
@@ -1783,14 +2414,10 @@ class Baser(LMDBer):
         if tuple(seal) != SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = SealEvent(**seal)  #convert to namedtuple
-
-        for srdr in self.getEvtPreIter(pre=pre, sn=sn):  # includes disputed & superseded
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == SealEvent._fields:
-                    eseal = SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        # includes disputed & superseded
+        for srdr in self.sealingEventIter(pre=pre, seal=seal, sn=sn):
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
     # use alias here until can change everywhere for  backwards compatibility
@@ -1822,14 +2449,10 @@ class Baser(LMDBer):
         if tuple(seal) != SealEvent._fields:  # wrong type of seal
             return None
 
-        seal = SealEvent(**seal)  #convert to namedtuple
-
-        for srdr in self.getEvtLastPreIter(pre=pre, sn=sn):  # no disputed or superseded
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == SealEvent._fields:
-                    eseal = SealEvent(**eseal)  # convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        # no disputed or superseded
+        for srdr in self.sealingEventIter(pre=pre, seal=seal, sn=sn, last=True):
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
 
@@ -1850,15 +2473,10 @@ class Baser(LMDBer):
             sn (int): beginning sn to search
 
         """
-        # create generic Seal namedtuple class using keys from provided seal dict
-        Seal = namedtuple('Seal', list(seal))  # matching type
-
-        for srdr in self.getEvtLastPreIter(pre=pre, sn=sn):  # only last evt at sn
-            for eseal in srdr.seals or []:  # or [] for seals 'a' field missing
-                if tuple(eseal) == Seal._fields:  # same type of seal
-                    eseal = Seal(**eseal)  #convert to namedtuple
-                    if seal == eseal and self.fullyWitnessed(srdr):
-                        return srdr
+        # only last evt at sn
+        for srdr in self.sealingEventIter(pre=pre, seal=seal, sn=sn, last=True):
+            if self.fullyWitnessed(srdr):
+                return srdr
         return None
 
     def signingMembers(self, pre: str):
@@ -1929,7 +2547,7 @@ class Baser(LMDBer):
         if prefixer.transferable:
             # receipted event and receipter in database so get receipter est evt
             # retrieve dig of last event at sn of est evt of receipter.
-            sdig = self.kels.getLast(keys=prefixer.qb64b, on=sn)
+            sdig = self.lastDig(pre=prefixer.qb64b, sn=sn)
             if sdig is None:
                 # receipter's est event not yet in receipters's KEL
                 raise ValidationError("key event sn {} for pre {} is not yet in KEL"
@@ -1982,7 +2600,9 @@ class Baser(LMDBer):
         Returns iterator of event messages without attachments
         in sn order from the KEL of identifier prefix pre.
         Essentially a replay of all event messages without attachments
-        for each sn from the KEL of pre including superseded duplicates
+        for each sn from the KEL of pre including superseded duplicates.
+        Reads the sn index .lels unless pre is not indexed from inception in
+        which case falls back to .kels.
 
         Parameters:
             pre (bytes|str): identifier prefix
@@ -1991,7 +2611,12 @@ class Baser(LMDBer):
         if hasattr(pre, 'encode'):
             pre = pre.encode("utf-8")
 
-        for dig in self.kels.getLastIter(keys=pre, on=sn):
+        if self.lels.get(keys=pre, on=0) is None:  # not indexed
+            digs = self.kels.getLastIter(keys=pre, on=sn)
+        else:
+            digs = self.lels.getAllIter(keys=pre, on=sn)
+
+        for dig in digs:
             try:
 
                 if not (serder := self.evts.get(keys=(pre, dig) )):
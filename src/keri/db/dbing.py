@@ -45,6 +45,7 @@ l
 
 """
 
+import datetime
 import os
 import platform
 import shutil
@@ -61,6 +62,8 @@ from keri import __version__
 from ..kering import MaxON  # maximum ordinal number for seqence or first seen
 from ..help import helping
 
+Epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)  # for tmKey
+
 ProemSize = 32  # does not include trailing separator
 MaxProem = int("f"*(ProemSize), 16)
 SuffixSize = 32  # does not include trailing separator
@@ -180,6 +183,19 @@ def dtKey(pre, dts):
         dts = dts.encode("utf-8")  # convert str to bytes
     return (b'%s|%s' % (pre, dts))
 
+
+def tmKey(dt):
+    """
+    Returns str DB key component that lexicographically sorts in time order
+    given tz aware datetime dt. The key is the integer microseconds since the
+    epoch as 16 hex chars so it has no '.' separator unlike ISO8601 and may
+    be used as one element of a keys tuple for time ordered indices.
+
+    '2021-02-13T19:16:50.750302+00:00' -> '0005bb3c98469f5e'
+
+    """
+    return f"{(dt - Epoch) // datetime.timedelta(microseconds=1):016x}"
+
 # ToDo right split so key prefix could be top of key space with more than one
 # part
 def splitKey(key, sep=b'.'):
@@ -332,6 +348,38 @@ def openLMDB(*, cls=None, name="test", temp=True, **kwa):
             lmdber.close(clear=lmdber.temp)  # clears if lmdber.temp
 
 
+class SubTxn:
+    """
+    SubTxn wraps a shared LMDB transaction so that it behaves like a
+    transaction begun on a given named sub db, i.e. env.begin(db=db). Each
+    call defaults to .db so that LMDBer methods written against a per call
+    transaction work unchanged inside a shared unit of work transaction from
+    LMDBer.txn.
+
+    Attributes:
+        txn (lmdb.Transaction): shared transaction
+        db (lmdb._Database|None): named sub db. None means main db.
+    """
+
+    def __init__(self, txn, db=None):
+        self.txn = txn
+        self.db = db
+
+    def cursor(self, db=None):
+        return self.txn.cursor(db=db if db is not None else self.db)
+
+    def get(self, key, default=None, db=None):
+        return self.txn.get(key, default=default,
+                            db=db if db is not None else self.db)
+
+    def put(self, key, value, dupdata=True, overwrite=True, append=False, db=None):
+        return self.txn.put(key, value, dupdata=dupdata, overwrite=overwrite,
+                            append=append, db=db if db is not None else self.db)
+
+    def delete(self, key, value=b'', db=None):
+        return self.txn.delete(key, value, db=db if db is not None else self.db)
+
+
 class LMDBer(filing.Filer):
     """
     LBDBer base class for LMDB manager instances.
@@ -358,6 +406,12 @@ class LMDBer(filing.Filer):
 
     Properties:
 
+    Hidden:
+        _txn (lmdb.Transaction|None): shared unit of work transaction when
+            inside .txn() context otherwise None
+        _write (bool): True means shared transaction ._txn is write
+            transaction. False means read only
+
     File/Directory Creation Mode Notes:
         .Perm provides default restricted access permissions to directory and/or files
         stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR
@@ -381,7 +435,7 @@ class LMDBer(filing.Filer):
     TempPrefix = "keri_lmdb_"
     TempSuffix = "_test"
     Perm = stat.S_ISVTX | stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR  # 0o1700==960
-    MaxNamedDBs = 100
+    MaxNamedDBs = 128
     MapSize = 104857600
 
     def __init__(self, readonly=False, **kwa):
@@ -423,6 +477,8 @@ class LMDBer(filing.Filer):
 
         self.env = None
         self._version = None
+        self._txn = None
+        self._write = False
         self.readonly = True if readonly else False
         super(LMDBer, self).__init__(**kwa)
 
@@ -526,6 +582,77 @@ class LMDBer(filing.Filer):
         return super(LMDBer, self).close(clear=clear)
 
 
+    @contextmanager
+    def txn(self, write=True):
+        """Context manager for one unit of work transaction shared by all the
+        database operations, including those of Suber and Komer instances on
+        this LMDBer, made within its context. Commits once on exit, or aborts
+        all its writes when its context exits with an exception. A nested
+        .txn() joins the outer one.
+
+        Raises ValueError when write transaction is requested inside read only
+        outer transaction.
+
+        Usage:
+            with db.txn():
+                db.evts.put(...)
+                db.kels.add(...)
+
+        Parameters:
+            write (bool): True means write transaction. False means read only
+                transaction for a consistent snapshot across multiple reads.
+
+        Yields:
+            txn (lmdb.Transaction): shared transaction
+        """
+        if self._txn is not None:  # join outer transaction
+            if write and not self._write:
+                raise ValueError("Write transaction inside read only "
+                                 "transaction.")
+            yield self._txn
+            return
+
+        # buffers=False since memoryviews from a write txn are invalidated
+        # by any later write in the same txn
+        with self.env.begin(write=write, buffers=False) as txn:
+            self._txn = txn
+            self._write = write
+            try:
+                yield txn
+            finally:
+                self._txn = None
+                self._write = False
+
+
+    @contextmanager
+    def begin(self, db=None, write=False, buffers=False):
+        """Context manager for transaction on named sub db, db, used by each
+        database operation. Joins the shared transaction from .txn() when in
+        its context. Otherwise begins and commits its own transaction.
+
+        Parameters:
+            db (lmdb._Database|None): named sub db. None means main db.
+            write (bool): True means write transaction. False means read only
+            buffers (bool): True means return memoryview buffers for values
+                from own transaction. Ignored when joining shared transaction.
+
+        Yields:
+            txn (lmdb.Transaction|SubTxn): transaction defaulting to db
+
+        Raises ValueError when write transaction is requested inside read only
+        shared transaction.
+        """
+        if self._txn is not None:
+            if write and not self._write:
+                raise ValueError("Write transaction inside read only "
+                                 "transaction.")
+            yield SubTxn(txn=self._txn, db=db)
+            return
+
+        with self.env.begin(db=db, write=write, buffers=buffers) as txn:
+            yield txn
+
+
     def getVer(self):
         """ Returns the value of the the semver formatted version in the __version__ key in this database
 
@@ -533,7 +660,7 @@ class LMDBer(filing.Filer):
             str: semver formatted version of the database
 
         """
-        with self.env.begin() as txn:
+        with self.begin() as txn:
             cursor = txn.cursor()
             version = cursor.get(b'__version__')
             return version.decode("utf-8") if version is not None else None
@@ -549,7 +676,7 @@ class LMDBer(filing.Filer):
         if hasattr(val, "encode"):
             val = val.encode("utf-8")  # convert str to bytes
 
-        with self.env.begin(write=True) as txn:
+        with self.begin(write=True) as txn:
             cursor = txn.cursor()
             cursor.replace(b'__version__', val)
 
@@ -575,7 +702,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             result = False
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
@@ -608,7 +735,7 @@ class LMDBer(filing.Filer):
         """
         # when deleting can't use cursor.iternext() because the cursor advances
         # twice (skips one) once for iternext and once for delete.
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             count = 0
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to entry at key >= key if any
@@ -627,7 +754,7 @@ class LMDBer(filing.Filer):
         Parameters:
             db is opened named sub db with either dupsort=True or False
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             for _, _ in cursor:  # iter(cursor) same as cursor.iternext()
@@ -663,7 +790,7 @@ class LMDBer(filing.Filer):
         Because cursor.iternext() advances cursor after returning item its safe
         to delete the item within the iteration loop.
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if cursor.set_range(top):  # move to val at key >= key if any
                 for ckey, cval in cursor.iternext():  # get key, val at cursor
@@ -689,7 +816,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.put(key, val, overwrite=False))
             except lmdb.BadValsizeError as ex:
@@ -712,7 +839,7 @@ class LMDBer(filing.Filer):
         """
         if not key:
             return False
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.put(key, val))
             except lmdb.BadValsizeError as ex:
@@ -732,7 +859,7 @@ class LMDBer(filing.Filer):
         """
         if not key:
             return False
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             try:
                 return(txn.get(key))
             except lmdb.BadValsizeError as ex:
@@ -755,7 +882,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -788,7 +915,7 @@ class LMDBer(filing.Filer):
         if val is None or not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)
             try:
                 return (txn.put(onkey, val, overwrite=False))
@@ -818,7 +945,7 @@ class LMDBer(filing.Filer):
         if val is None or not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return (txn.put(onkey, val))
@@ -852,7 +979,7 @@ class LMDBer(filing.Filer):
         if not key or val is None:
             raise ValueError(f"Bad append parameter: {key=} or {val=}")
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, MaxON, sep=sep)
             on = 0  # unless other cases match then zeroth entry at key
             cursor = txn.cursor()
@@ -907,7 +1034,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 if val := txn.get(onkey):
@@ -939,7 +1066,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return(txn.get(onkey))
@@ -965,7 +1092,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
             try:
                 return (txn.delete(onkey))  # when empty deletes whole db
@@ -998,7 +1125,7 @@ class LMDBer(filing.Filer):
             return self.remTop(db=db, top=b'')
 
         # del all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             result = False
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -1037,7 +1164,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate count
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -1109,7 +1236,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -1159,7 +1286,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             result = False
             if not key or not vals:  # empty key or empty vals or vals None
                 return result
@@ -1211,7 +1338,7 @@ class LMDBer(filing.Filer):
             return result  # do not delete
 
         self.remIoSet(db=db, key=key, sep=sep)
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             vals = oset(vals)  # make set
 
             for i, val in enumerate(vals):
@@ -1240,7 +1367,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
 
         """
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             if not key or val is None:  # empty key or val is missing
                 return False
             vals = oset()
@@ -1284,7 +1411,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             if not key:  # empty key
                 return  # raises StopIterationError
             iokey = suffix(key, ion, sep=sep)  # start ion th value for key zeroth default
@@ -1316,7 +1443,7 @@ class LMDBer(filing.Filer):
             sep (bytes): separator character for split
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             last = ()
             if not key:
                 return last
@@ -1352,7 +1479,7 @@ class LMDBer(filing.Filer):
         if not key:
             return result
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start at zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1406,7 +1533,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             iokey = suffix(key, 0, sep=sep)  # start zeroth value for key
             cursor = txn.cursor()
             if cursor.set_range(iokey):  # move to val at key >= iokey if any
@@ -1436,7 +1563,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             count = 0
             if not key:  # empty key
                 return count
@@ -1501,7 +1628,7 @@ class LMDBer(filing.Filer):
             key (bytes): Apparent effective key
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()  # create cursor to walk back
             if not key:  # start at first key if any
                 if not cursor.first():
@@ -1667,7 +1794,7 @@ class LMDBer(filing.Filer):
         if not key or not vals or not helping.isNonStringIterable(vals):
             raise ValueError(f"Bad append parameter: {key=} or {vals=}")
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             onkey = onKey(key, on=MaxON, sep=sep)  # start at max and walk back
             iokey = suffix(onkey, ion=MaxON, sep=sep)
             on = 0  # unless other cases match then zeroth entry at key
@@ -1873,7 +2000,7 @@ class LMDBer(filing.Filer):
             return self.remTop(db=db, top=b'')
 
         # del all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             result = False
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -1939,7 +2066,7 @@ class LMDBer(filing.Filer):
             return self.cntAll(db)
 
         # count all on >= on for key
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             count = 0
             onkey = onKey(key, on, sep=sep)
             cursor = txn.cursor()
@@ -2026,7 +2153,7 @@ class LMDBer(filing.Filer):
             yield from self.getOnTopIoSetItemIter(db=db, top=b'', sep=sep)
             return
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             onkey = onKey(key, on, sep=sep)  # starting on
             iokey = suffix(onkey, ion=0, sep=sep)  # start ion th value for key zeroth default
             cursor = txn.cursor()
@@ -2078,7 +2205,7 @@ class LMDBer(filing.Filer):
                 yield (key, on, val)
             return
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()  # create cursor to walk
             # iterate all on >= on at key
             if not key:  # start at first key if any
@@ -2139,7 +2266,7 @@ class LMDBer(filing.Filer):
         transparently suffixed and unsuffixed
         Assumes DB opened with dupsort=False
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # position cursor at last entry of set of last key
                 return  # empty database so raise StopIteration
@@ -2205,7 +2332,7 @@ class LMDBer(filing.Filer):
         transparently suffixed and unsuffixed
         Assumes DB opened with dupsort=False
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
 
             if key:  # not empty so attempt to position at starting key not last
@@ -2288,7 +2415,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             result = True
             try:
                 for val in vals:
@@ -2324,7 +2451,7 @@ class LMDBer(filing.Filer):
         dups = set(self.getVals(db, key))  #get preexisting dups if any
         result = False
         if val not in dups:
-            with self.env.begin(db=db, write=True, buffers=True) as txn:
+            with self.begin(db=db, write=True, buffers=True) as txn:
                 try:
                     result = txn.put(key, val, dupdata=True)
                 except lmdb.BadValsizeError as ex:
@@ -2347,7 +2474,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -2372,7 +2499,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -2396,7 +2523,7 @@ class LMDBer(filing.Filer):
             db (lmdb._Database): instance of named sub db with dupsort=True
             key is bytes of key within sub db's keyspace
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             try:
@@ -2420,7 +2547,7 @@ class LMDBer(filing.Filer):
         if not key:
             return 0
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2446,7 +2573,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key, val))
             except lmdb.BadValsizeError as ex:
@@ -2489,7 +2616,7 @@ class LMDBer(filing.Filer):
         if not key or not vals or key[:1] == b'.':
             return result
         dups = set(self.getIoDupVals(db, key))  # get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             idx = 0
             cursor = txn.cursor()
             try:
@@ -2562,7 +2689,7 @@ class LMDBer(filing.Filer):
             key (bytes): within sub db's keyspace
 
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             vals = []  # list
             if not key:
                 return vals
@@ -2609,7 +2736,7 @@ class LMDBer(filing.Filer):
             ion (int): starting ordinal value, default 0
         """
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             if not key:  # empty key
                 return  # raise StopIterationError
 
@@ -2655,7 +2782,7 @@ class LMDBer(filing.Filer):
         if not key:
             return None
 
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             val = None
             try:
@@ -2696,7 +2823,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             try:
                 return (txn.delete(key))
             except lmdb.BadValsizeError as ex:
@@ -2737,7 +2864,7 @@ class LMDBer(filing.Filer):
         if not key:
             return False
 
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             cursor = txn.cursor()
             try:
                 if cursor.set_key(key):  # move to first_dup
@@ -2777,7 +2904,7 @@ class LMDBer(filing.Filer):
         """
         if not key:
             return 0
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             count = 0
             try:
@@ -2874,7 +3001,7 @@ class LMDBer(filing.Filer):
 
         result = False
         dups = set(self.getOnIoDupVals(db, key))  #get preexisting dups if any
-        with self.env.begin(db=db, write=True, buffers=True) as txn:
+        with self.begin(db=db, write=True, buffers=True) as txn:
             idx = 0
             cursor = txn.cursor()
             onkey = onKey(key, on, sep=sep)
@@ -2989,7 +3116,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to retrieve
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             vals = []
             if not key: # empty key so no dups
@@ -3137,7 +3264,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if key:  # not empty
                 onkey = onKey(key, on, sep=sep)  # start replay at this enty 0 is earliest
@@ -3304,7 +3431,7 @@ class LMDBer(filing.Filer):
             on (int): ordinal number at which to initiate retrieval
             sep (bytes): separator character for split
         """
-        with self.env.begin(db=db, write=False, buffers=True) as txn:
+        with self.begin(db=db, write=False, buffers=True) as txn:
             cursor = txn.cursor()
             if not cursor.last():  # pre-position cursor at last dup of last key
                 return  # empty database so raise StopIteration
@@ -11,9 +11,8 @@ from hio.help import ogler
 
 
 from ..help import helping
-from ..kering import ValidationError
 
-from .dbing import fetchTsgs
+from .dbing import fetchTsgs, tmKey
 from .subing import CesrSuber, SerderSuber, CesrIoSetSuber, CatCesrIoSetSuber
 
 
@@ -42,6 +41,8 @@ class Broker:
                 Key schema: (said, pre, sn, dig)
             cigardb (CatCesrIoSetSuber): database for non-indexed signatures by ksn SAID
             escrowdb (CesrIoSetSuber): database for escrows by route by (typ, pre, aid) tuple
+            expirydb (CesrIoSetSuber): expiry ordered index of escrowdb by
+                (typ, tmKey(datetime), pre, aid) tuple
             saiderdb (CesrSuber): database for transaction state SAIDs by (pre, aid) tuple
         """
         from ..core.coring import Cigar, Dater, Diger, Verfer
@@ -82,6 +83,11 @@ class Broker:
         # Routes such as /ksn/{aid} or /tsn/registry/{aid}
         self.escrowdb = CesrIoSetSuber(db=self.db, subkey=subkey + '-nes', klas=Diger)
 
+        # expiry ordered index of escrowdb. Maps (typ, tmKey(dater), pre, aid)
+        # to escrowed said so stale escrows are pruned from the expired head
+        # without walking the whole escrow.
+        self.expirydb = CesrIoSetSuber(db=self.db, subkey=subkey + '-nxs.', klas=Diger)
+
         # transaction state SAID database for successfully saved transaction state notices
         # maps key=(prefix, aid) to val=said of transaction state
         self.saiderdb = CesrSuber(db=self.db, subkey=subkey + '-nas.', klas=Diger)
@@ -112,7 +118,11 @@ class Broker:
             processReply (func): function to call to process each message taken out of escrow
             extype (Type[Exception]): the expected exception type if the message should remain in escrow
 
+        Stale escrows are first pruned via .pruneEscrowState.
+
         """
+        self.pruneEscrowState(typ)
+
         for (typ, pre, aid), diger in self.escrowdb.getTopItemIter(keys=(typ, '')):
             try:
                 tsgs = fetchTsgs(db=self.tigerdb, diger=diger)
@@ -134,14 +144,6 @@ class Broker:
                             cigar.verfer = verfer
                             cigars.append(cigar)
 
-                    # do date math for stale escrow
-                    if ((helping.nowUTC() - dater.datetime) >
-                            datetime.timedelta(seconds=self.timeout)):
-                        # escrow stale so raise ValidationError which unescrows below
-                        msg = f"Escrow unescrow error: Stale txn state escrow at pre = {pre}"
-                        logger.trace("Broker %s: %s", typ, msg)
-                        raise ValidationError(msg)
-
                     processReply(serder=serder, diger=diger, route=serder.ked["r"],
                                  cigars=cigars, tsgs=tsgs, aid=aid)
 
@@ -172,6 +174,47 @@ class Broker:
                 else:
                     logger.error("Broker %s: unescrowed due to error: %s", typ, ex.args[0])
 
+    def pruneEscrowState(self, typ):
+        """
+        Remove stale escrows of type typ by walking only the expired head of
+        the expiry ordered index .expirydb.
+
+        Index entries are left behind when an escrow is unescrowed so the
+        escrow state is only removed when the escrow entry is still present.
+        This avoids removing the state of a successfully processed notice.
+        When the index has no entries of type typ any escrows of type typ
+        from before the index existed are indexed first.
+
+        Parameters:
+            typ (str): escrow type
+
+        Returns:
+            count (int): number of stale escrows removed
+        """
+        if next(self.expirydb.getTopItemIter(keys=(typ, "")), None) is None:
+            for (_, pre, aid), diger in self.escrowdb.getTopItemIter(keys=(typ, "")):
+                if (dater := self.daterdb.get(keys=(diger.qb64,))) is not None:
+                    self.expirydb.add(keys=(typ, tmKey(dater.datetime), pre, aid),
+                                      val=diger)
+
+        cutoff = tmKey(helping.nowUTC() - datetime.timedelta(seconds=self.timeout))
+        expired = []
+        for keys, diger in self.expirydb.getTopItemIter(keys=(typ, "")):
+            if keys[1] >= cutoff:  # rest of branch is not yet expired
+                break
+            expired.append((keys, diger))
+
+        count = 0
+        for (_, stamp, pre, aid), diger in expired:
+            if self.escrowdb.rem(keys=(typ, pre, aid), val=diger):
+                self.removeState(diger)
+                count += 1
+                logger.trace("Broker %s: pruned stale txn state escrow at pre = %s",
+                             typ, pre)
+            self.expirydb.rem(keys=(typ, stamp, pre, aid), val=diger)
+
+        return count
+
     def escrowStateNotice(self, *, typ, pre, aid, serder, diger, dater, cigars=None, tsgs=None):
         """
         Escrow reply by route
@@ -205,6 +248,8 @@ class Broker:
         for cigar in cigars:  # process each couple to verify sig and write to db
             self.cigardb.put(keys=keys, vals=[(cigar.verfer, cigar)])
 
+        dater = self.daterdb.get(keys=keys)  # first one so stamp is idempotent
+        self.expirydb.put(keys=(typ, tmKey(dater.datetime), pre, aid), vals=[diger])
         return self.escrowdb.put(keys=(typ, pre, aid), vals=[diger])  # does not overwrite
 
     def updateReply(self, aid, serder, diger, dater):
@@ -0,0 +1,39 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.migrations.add_contact_index module
+
+"""
+from keri import help
+from keri.app.organizing import BaseOrganizer
+
+logger = help.ogler.getLogger()
+
+
+def _check_if_needed(db):
+    return (next(db.cfld.getTopItemIter(), None) is not None or
+            next(db.ifld.getTopItemIter(), None) is not None)
+
+
+def migrate(db):
+    """Populates the field value and n-gram indexes of contact information for
+    remote identifiers and identifier information for local identifiers from
+    their field values. The indexes are otherwise only updated as fields are
+    written so databases created before they existed have empty indexes.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    dbs = [(db.cfld, db.cidx, db.cgrm), (db.ifld, db.iidx, db.igrm)]
+
+    logger.debug(f"Migrating contact and identifier field indexes for {db.path}")
+    with db.txn():
+        for fielddb, idxdb, gramdb in dbs:
+            org = BaseOrganizer(hby=None, cigsdb=None, datadb=None, fielddb=fielddb,
+                                imgsdb=None, idxdb=idxdb, gramdb=gramdb)
+            org.reindex()
+    logger.info("Indexed contact and identifier fields")
@@ -0,0 +1,45 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.migrations.add_escrow_expiry_index module
+
+"""
+from keri import help
+from keri.db.dbing import dgKey
+
+logger = help.ogler.getLogger()
+
+Escrows = ("ooes", "pses", "pwes", "pdes", "ldes")
+
+
+def _check_if_needed(db):
+    return any(next(getattr(db, escrow).getAllItemIter(), None) is not None
+               for escrow in Escrows)
+
+
+def migrate(db):
+    """Populates the expiry ordered escrow index "exes." from the out of order,
+    partially signed, partially witnessed, partially delegated and likely
+    duplicitous escrows. The index is otherwise only updated as events are
+    escrowed so events escrowed before it existed would never be pruned.
+    Escrowed events without an escrow datetime are stamped now so they time
+    out normally.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    from keri.core.coring import Dater
+
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    logger.debug(f"Migrating expiry ordered escrow index for {db.path}")
+    count = 0
+    with db.txn():
+        for escrow in Escrows:
+            for keys, on, dig in getattr(db, escrow).getAllItemIter():
+                db.dtss.put(keys=dgKey(keys[0], dig), val=Dater())  # when missing
+                db.indexEscrow(escrow, keys[0], on, dig)
+                count += 1
+    logger.info(f"Indexed {count} escrowed events")
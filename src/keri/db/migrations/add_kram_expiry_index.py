@@ -0,0 +1,40 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.migrations.add_kram_expiry_index module
+
+"""
+from keri import help
+from keri.core.kraming import indexMsgCache, indexTxnCache
+
+logger = help.ogler.getLogger()
+
+
+def _check_if_needed(db):
+    return (next(db.kramMSGC.getTopItemIter(), None) is not None or
+            next(db.kramTMSC.getTopItemIter(), None) is not None)
+
+
+def migrate(db):
+    """Populates the KRAM cache expiry indexes "mexp." and "texp." from the
+    message and transactioned message caches. The indexes are otherwise only
+    updated as entries are cached so entries cached before they existed would
+    never be pruned.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    logger.debug(f"Migrating KRAM cache expiry indexes for {db.path}")
+    count = 0
+    with db.txn():
+        for keys, record in db.kramMSGC.getTopItemIter():
+            indexMsgCache(db, keys, record)
+            count += 1
+        for keys, record in db.kramTMSC.getTopItemIter():
+            indexTxnCache(db, keys, record)
+            count += 1
+    logger.info(f"Indexed {count} KRAM cache entries")
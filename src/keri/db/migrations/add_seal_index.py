@@ -0,0 +1,36 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.migrations.add_seal_index module
+
+"""
+from keri import help
+
+logger = help.ogler.getLogger()
+
+
+def _check_if_needed(db):
+    return next(db.kels.getAllItemIter(), None) is not None
+
+
+def migrate(db):
+    """Populates the anchored seal index "seas." from the seals of every event
+    in every KEL in the database. The index is otherwise only updated as events
+    are logged so databases created before it existed have an empty index.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    logger.debug(f"Migrating anchored seal index for {db.path}")
+    count = 0
+    with db.txn():
+        for keys, on, dig in db.kels.getAllItemIter():
+            if (serder := db.evts.get(keys=(keys[0], dig))) is None:
+                continue
+            db.indexSeals(serder)
+            count += 1
+    logger.info(f"Indexed anchored seals of {count} events")
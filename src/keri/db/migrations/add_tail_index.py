@@ -0,0 +1,39 @@
+# -*- encoding: utf-8 -*-
+"""
+KERI
+keri.db.migrations.add_tail_index module
+
+"""
+from keri import help
+
+logger = help.ogler.getLogger()
+
+
+def _check_if_needed(db):
+    return next(db.kels.getAllItemIter(), None) is not None
+
+
+def migrate(db):
+    """Populates the sn index "lels." with the last event at each sn of every
+    KEL and the KEL tail index "tails." with the latest first seen event of
+    every KEL. Both are otherwise only updated as events are logged so
+    databases created before they existed have empty indexes.
+
+    Parameters:
+        db(Baser): Baser database object on which to run the migration
+    """
+    if not _check_if_needed(db):
+        print(f"{__name__} migration not needed, database already in correct state")
+        return
+
+    logger.debug(f"Migrating KEL sn and tail indexes for {db.path}")
+    count = 0
+    with db.txn():
+        for keys, on, dig in db.kels.getAllItemIter():  # last dup at sn pinned last
+            db.lels.pin(keys=keys, on=on, val=dig)
+            count += 1
+        for keys, fn, dig in db.fels.getAllItemIter():  # latest fn pinned last
+            if (serder := db.evts.get(keys=(keys[0], dig))) is None:
+                continue
+            db.indexTail(serder, fn=fn, last=False)
+    logger.info(f"Indexed {count} KEL entries")
@@ -7,8 +7,11 @@ Browser-safe plain-value DBer backed by PyScript storage.
 
 from __future__ import annotations
 
+import base64
 import json
+import struct
 from collections.abc import Awaitable, Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -143,6 +146,65 @@ _RECORDS_KEY = "__records__"
 _META_KEY = "__meta__"
 _META_STORE = "__meta__"
 _VERSION_KEY = b"__version__"
+_SEGMENTS_KEY = "__segments__"
+_DELTA_KEY = "__delta__"
+MaxSegments = 16  # default delta segments per store before compaction
+Codecs = ("hex", "b64", "bin")  # record payload encodings, hex is legacy
+CodecVersion = 1  # version of record payload encodings written
+
+
+def _deltaKey(index: int) -> str:
+    """Return the storage key of delta segment at index."""
+    return f"{_DELTA_KEY}.{index:08x}"
+
+
+def _dropDeltas(handle: Any, segments: int) -> None:
+    """Delete the first segments delta segments persisted in handle."""
+    for index in range(segments):
+        if handle.get(_deltaKey(index)) is not None:
+            del handle[_deltaKey(index)]
+
+
+class ChangeDict(SortedDict):
+    """
+    SortedDict that logs which keys changed since the last flush.
+
+    Item assignment, deletion and pop add the key to .changed. clear() drops
+    the log and sets .cleared since only a full rewrite can persist it.
+    Bulk loads through the constructor are not logged.
+
+    Attributes:
+        changed (set): keys set or deleted since the last flush.
+        cleared (bool): True when the map was cleared since the last flush.
+    """
+
+    def __init__(self, *pa, **kwa):
+        super().__init__(*pa, **kwa)
+        self.changed = set()
+        self.cleared = False
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.changed.add(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.changed.add(key)
+
+    def pop(self, key, *pa):
+        if key in self:
+            self.changed.add(key)
+        return super().pop(key, *pa)
+
+    def clear(self):
+        super().clear()
+        self.changed = set()
+        self.cleared = True
+
+    def reset(self):
+        """Forget logged changes once they are persisted."""
+        self.changed = set()
+        self.cleared = False
 
 
 @dataclass
@@ -159,7 +221,11 @@ class SubDb:
             backing storage.
         dirty: True when items differs from the last flushed payload.
         opened: True after the first env.open_db(...).
-        items: Live ordered ``bytes -> bytes`` map used by sync CRUD methods.
+        segments: Number of delta segments persisted after the last full
+            records payload.
+        codec: Encoding of the persisted records payload and segments.
+        items: Live ordered ``bytes -> bytes`` map used by sync CRUD methods
+            that logs keys changed since the last flush.
     """
 
     name: str
@@ -169,7 +235,9 @@ class SubDb:
     flags_persisted: bool = False
     dirty: bool = False
     opened: bool = False
-    items: Any = field(default_factory=lambda: SortedDict() if SortedDict else dict())
+    segments: int = 0
+    codec: str = "hex"
+    items: Any = field(default_factory=ChangeDict)
 
     def flags(self) -> dict[str, bool]:
         """Return the subdb flags used by upstream wrapper tests."""
@@ -219,16 +287,35 @@ class WebDBer:
     Sync callers see immediate reads/writes against the in-memory mirror.
     Persistence only happens at explicit flush points.
 
+    Each store persists as a full records payload followed by append-only
+    delta segments. A flush writes only the keys changed since the previous
+    flush as one new segment, so its cost follows the number of writes
+    rather than the store size. Open replays the segments over the records
+    payload. A store is compacted back into a single records payload once it
+    has maxSegments segments or when its changes are about as large as the
+    store itself.
+
+    Payloads are encoded with one of Codecs. "hex" is hex-encoded JSON,
+    "b64" is base64-encoded JSON and "bin" is a length-prefixed binary blob.
+    Non-hex stores record the codec and CodecVersion in their metadata.
+    A store persisted with another codec than the one requested at open is
+    rewritten with the requested codec on the next flush.
+
     Attributes:
         name: Base namespace prefix shared by all declared stores.
         env: Sync open_db(...) adapter used by upstream wrappers.
+        maxSegments: Delta segments per store before flush compacts it.
+        codec: Encoding used for payloads written by flush.
         _stores: Authoritative mapping of store name to SubDb.
         stores: Declared store names exposed for inspection and tests.
     """
 
-    def __init__(self, *, name: str, stores: dict[str, SubDb]):
+    def __init__(self, *, name: str, stores: dict[str, SubDb],
+                 maxSegments: int = MaxSegments, codec: str = "hex"):
         self.name = name
         self.env = WebEnv(self)
+        self.maxSegments = maxSegments
+        self.codec = codec
         self._stores = stores
         self.stores = list(stores)
         self._version = None
@@ -241,6 +328,8 @@ class WebDBer:
         *,
         clear: bool = False,
         storageOpener: Callable[[str], Awaitable[Any]] | None = None,
+        maxSegments: int = MaxSegments,
+        codec: str = "hex",
     ) -> "WebDBer":
         """
         Open a storage-backed WebDBer instance with a fixed set of stores.
@@ -252,17 +341,25 @@ class WebDBer:
                 loading them into memory, including per-store metadata.
             storageOpener: Async callable that returns a storage handle for a
                 namespace. Defaults to `pyscript.storage`.
+            maxSegments: Delta segments a store may accumulate before
+                `flush()` compacts it into a full records payload.
+            codec: Payload encoding from `Codecs` written by `flush()`.
+                Stores persisted with another codec are still loaded and
+                are migrated to this one on the next flush.
 
         Returns:
             A storage-backed `WebDBer` ready for sync CRUD and async `flush()`.
 
         Raises:
             RuntimeError: If no storage opener is available.
+            ValueError: If codec or a persisted codec marker is unsupported.
         """
 
         opener = storageOpener if storageOpener is not None else storage
         if opener is None:
             raise RuntimeError("pyscript.storage is unavailable in this environment")
+        if codec not in Codecs:
+            raise ValueError(f"Unsupported WebDBer codec: {codec}")
 
         opened: dict[str, SubDb] = {}
         all_store_names = [cls._storify(store) for store in stores]
@@ -272,11 +369,29 @@ class WebDBer:
             namespace = f"{name}:{store_name}"
             handle = await opener(namespace)
             if clear:
-                handle[_RECORDS_KEY] = "{}"
-                handle[_META_KEY] = "{}"
+                _dropDeltas(handle, int(handle.get(_SEGMENTS_KEY) or 0))
+                handle[_RECORDS_KEY] = _serialize_records({}, codec)
+                handle[_META_KEY] = _serialize_meta(_codecMeta(codec))
+                handle[_SEGMENTS_KEY] = "0"
                 await handle.sync()
-            items = SortedDict(_deserialize_records(handle.get(_RECORDS_KEY)))
             meta = _deserialize_meta(handle.get(_META_KEY))
+            stored = meta.get("codec", "hex")
+            if (stored not in Codecs
+                    or meta.get("codecVersion", CodecVersion) > CodecVersion):
+                raise ValueError(
+                    f"Unsupported persisted codec {stored} version "
+                    f"{meta.get('codecVersion')} for store: {namespace}."
+                )
+            records = _deserialize_records(handle.get(_RECORDS_KEY), stored)
+            segments = int(handle.get(_SEGMENTS_KEY) or 0)
+            for index in range(segments):
+                delta = _deserialize_delta(handle.get(_deltaKey(index)), stored)
+                for key, val in delta.items():
+                    if val is None:
+                        records.pop(key, None)
+                    else:
+                        records[key] = val
+            items = ChangeDict(records)
             flags_persisted = "dupsort" in meta
             if items and not flags_persisted:
                 raise ValueError(
@@ -289,10 +404,14 @@ class WebDBer:
                 handle=handle,
                 dupsort=bool(meta.get("dupsort", False)),
                 flags_persisted=flags_persisted,
+                dirty=stored != codec,  # migrate on next flush
+                segments=segments,
+                codec=stored,
                 items=items,
             )
 
-        return cls(name=name, stores=opened)
+        return cls(name=name, stores=opened, maxSegments=maxSegments,
+                   codec=codec)
 
     @staticmethod
     def _storify(key: bytes | str) -> str:
@@ -302,16 +421,26 @@ class WebDBer:
             return key.decode("utf-8")
         raise TypeError(f"Unsupported store handle type: {type(key)}")
 
-    async def flush(self) -> int:
+    async def flush(self, compact: bool = False) -> int:
         """
         Persist dirty stores to their backing storage handles.
 
+        Changed keys of a dirty store are appended as one delta segment.
+        The store is instead rewritten as a full records payload, dropping
+        its segments, when compact is True, when it already has maxSegments
+        segments, when it was cleared, when its changes cover at least
+        half of its items or when it is persisted with another codec.
+
         Stores are synced one at a time. If sync fails partway through,
         already-synced stores will have dirty=False and will NOT be
         re-flushed on retry. This is acceptable because browser IndexedDB
         is BASE (not ACID) and keripy's KEL verification model recovers
         from lost unflushed writes on startup via KEL cleaning.
 
+        Parameters:
+            compact: When `True`, rewrite every dirty store as a full
+                records payload instead of appending a delta segment.
+
         Returns:
             The number of stores whose serialized payload and metadata
             were synced.
@@ -320,13 +449,41 @@ class WebDBer:
         for subdb in self._stores.values():
             if not subdb.dirty:
                 continue
-            subdb.handle[_RECORDS_KEY] = _serialize_records(subdb.items)
-            subdb.handle[_META_KEY] = _serialize_meta({"dupsort": subdb.dupsort})
+            items = subdb.items
+            changed = items.changed
+            if (compact or items.cleared or subdb.codec != self.codec
+                    or subdb.segments >= self.maxSegments
+                    or 2 * len(changed) >= len(items)):
+                segments = 0
+                subdb.handle[_RECORDS_KEY] = _serialize_records(items, self.codec)
+                subdb.handle[_SEGMENTS_KEY] = "0"
+                _dropDeltas(subdb.handle, subdb.segments)
+            elif changed:
+                segments = subdb.segments + 1
+                subdb.handle[_deltaKey(subdb.segments)] = _serialize_delta(
+                    items, changed, self.codec)
+                subdb.handle[_SEGMENTS_KEY] = str(segments)
+            else:  # metadata only
+                segments = subdb.segments
+            subdb.handle[_META_KEY] = _serialize_meta(
+                {"dupsort": subdb.dupsort, **_codecMeta(self.codec)})
             await subdb.handle.sync()
+            subdb.segments = segments
+            subdb.codec = self.codec
+            items.reset()
             subdb.dirty = False
             count += 1
         return count
 
+    @contextmanager
+    def txn(self, write: bool = True):
+        """Unit of work context matching LMDBer.txn.
+
+        Writes already apply immediately to the in-memory mirror and only
+        persist at flush() so there is nothing to batch here.
+        """
+        yield None
+
     @property
     def version(self):
         """Return the database version string, or None if not set.
@@ -2215,14 +2372,99 @@ class WebDBer:
     #  End OnIoSet support methods
 
 
-def _serialize_records(records: dict | Any) -> str:
-    """Serialize a bytes->bytes map as JSON with hex-encoded keys and values.
+def _codecMeta(codec: str) -> dict[str, Any]:
+    """Return the metadata marker of codec. Legacy hex has no marker."""
+    return {} if codec == "hex" else {"codec": codec, "codecVersion": CodecVersion}
+
+
+_Deleted = 0xffffffff  # "bin" value length marking a deleted key in a delta
+
+
+def _encodeEntries(entries: dict, codec: str) -> str | bytes:
+    """Encode a bytes->bytes|None map with codec. None marks deletion.
+
+    "hex" and "b64" are JSON objects of encoded keys and values with null
+    for None. "bin" concatenates big endian 4 byte length prefixed keys and
+    values with a value length of _Deleted for None.
+    """
+    if codec == "bin":
+        blob = bytearray()
+        for key, val in entries.items():
+            blob.extend(struct.pack(">I", len(key)))
+            blob.extend(key)
+            if val is None:
+                blob.extend(struct.pack(">I", _Deleted))
+            else:
+                blob.extend(struct.pack(">I", len(val)))
+                blob.extend(val)
+        return bytes(blob)
+
+    if codec == "b64":
+        encode = lambda b: base64.b64encode(b).decode("ascii")
+    else:
+        encode = bytes.hex
+    return json.dumps({encode(key): (encode(val) if val is not None else None)
+                       for key, val in entries.items()}, sort_keys=True)
+
+
+def _decodeEntries(raw: Any, codec: str, kind: str) -> dict[bytes, bytes | None]:
+    """Decode a payload written by _encodeEntries with codec."""
+    if raw is None or (isinstance(raw, (str, bytes)) and not raw):
+        return {}
+
+    if codec == "bin":
+        if not isinstance(raw, (bytes, bytearray, memoryview)):
+            raise TypeError(f"Unsupported persisted {kind} payload type: {type(raw)}")
+        raw = memoryview(raw)
+        entries = {}
+        offset = 0
+        while offset < len(raw):
+            (size,) = struct.unpack_from(">I", raw, offset)
+            offset += 4
+            key = bytes(raw[offset:offset + size])
+            offset += size
+            (size,) = struct.unpack_from(">I", raw, offset)
+            offset += 4
+            if size == _Deleted:
+                entries[key] = None
+            else:
+                entries[key] = bytes(raw[offset:offset + size])
+                offset += size
+        return entries
+
+    if isinstance(raw, (bytes, memoryview)):
+        raw = bytes(raw).decode("utf-8")
+    if isinstance(raw, str):
+        payload = json.loads(raw)
+    elif isinstance(raw, dict):
+        payload = raw
+    else:
+        raise TypeError(f"Unsupported persisted {kind} payload type: {type(raw)}")
+
+    decode = base64.b64decode if codec == "b64" else bytes.fromhex
+    return {decode(str(key)): (decode(str(val)) if val is not None else None)
+            for key, val in payload.items()}
+
+
+def _serialize_records(records: dict | Any, codec: str = "hex") -> str | bytes:
+    """Serialize a bytes->bytes map with codec.
 
     Hex encoding doubles the byte size (1 KB value -> ~2.1 KB in JSON) but
     browser IndexedDB handles strings natively, not ArrayBuffer, so this is
-    the simplest correct representation for PyScript storage.
+    the simplest correct representation for PyScript storage. "b64" grows
+    it by a third instead and "bin" not at all.
+    """
+    return _encodeEntries(records, codec)
+
+
+def _serialize_delta(records: dict | Any, keys: Iterable[bytes],
+                     codec: str = "hex") -> str | bytes:
+    """Serialize the current values at keys of records as a delta segment.
+
+    Same encoding as _serialize_records with None marking a key deleted
+    from records.
     """
-    return json.dumps({key.hex(): val.hex() for key, val in records.items()}, sort_keys=True)
+    return _encodeEntries({key: records.get(key) for key in sorted(keys)}, codec)
 
 
 def _serialize_meta(meta: dict[str, Any]) -> str:
@@ -2272,22 +2514,12 @@ def _iterOnItems(
         yield ckey, cn, db.items[okey]
 
 
-def _deserialize_records(raw: Any) -> dict[bytes, bytes]:
-    if raw in (None, ""):
-        return {}
-    if isinstance(raw, (bytes, memoryview)):
-        raw = bytes(raw).decode("utf-8")
-    if isinstance(raw, str):
-        payload = json.loads(raw)
-    elif isinstance(raw, dict):
-        payload = raw
-    else:
-        raise TypeError(f"Unsupported persisted record payload type: {type(raw)}")
+def _deserialize_records(raw: Any, codec: str = "hex") -> dict[bytes, bytes]:
+    return _decodeEntries(raw, codec, "record")
+
 
-    return {
-        bytes.fromhex(str(key_hex)): bytes.fromhex(str(val_hex))
-        for key_hex, val_hex in payload.items()
-    }
+def _deserialize_delta(raw: Any, codec: str = "hex") -> dict[bytes, bytes | None]:
+    return _decodeEntries(raw, codec, "delta")
 
 
 def _deserialize_meta(raw: Any) -> dict[str, Any]:
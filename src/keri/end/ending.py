@@ -5,6 +5,7 @@ keri.end.ending module
 ReST API endpoints
 
 """
+import hashlib
 import json
 import os
 import re
@@ -12,7 +13,7 @@ import sys
 
 from http_sfv import Dictionary
 from ordered_set import OrderedSet as oset
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 from collections.abc import Mapping
 
 import falcon
@@ -539,11 +540,21 @@ class AdminEnd(base.Tymee):
 class OOBIEnd:
     """ REST API for OOBI endpoints
 
+    Responses are cached by (aid, role, eid) together with an entity tag that
+    fingerprints the key state and end role and location records they are
+    built from. Requests whose If-None-Match carries the current tag get 304
+    and cached responses are served while their tag is current, so unchanged
+    OOBIs cost a few index reads instead of a KEL replay and signing.
+
     Attributes:
         .hby (Habery): database access
+        .cache (OrderedDict): LRU of (etag, body) duples of up to .CacheCap
+            recent responses keyed by (aid, role, eid)
 
     """
 
+    CacheCap = 256  # max cached responses in .cache LRU
+
     def __init__(self, hby, default=None):
         """  End point for responding to OOBIs
 
@@ -554,6 +565,47 @@ class OOBIEnd:
         """
         self.hby = hby
         self.default = default
+        self.cache = OrderedDict()
+
+    def etag(self, hab, kever, role=None, eid=None):
+        """ Returns entity tag str of the OOBI response by hab for identifier
+        of kever in role for eid
+
+        The tag digests the latest event and first seen ordinal of the
+        identifier, its delegator and hab, the witness receipt count of the
+        identifier's latest event, its end role records and reply SAIDs and
+        the location records and reply SAIDs of its witnesses and endpoint
+        providers. It changes whenever any of these change.
+
+        Parameters:
+            hab (Hab): habitat responding to the OOBI
+            kever (Kever): key state of OOBI identifier
+            role (str): requested role for OOBI rpy message
+            eid (str): qb64 identifier prefix of participant in role
+
+        """
+        db = self.hby.db
+        aid = kever.prefixer.qb64
+        parts = [aid, role or "", eid or ""]
+        for pre in (aid, kever.delpre, hab.pre):
+            if pre and (pkever := self.hby.kevers.get(pre)) is not None:
+                parts.extend((pre, f"{pkever.sn:x}", f"{pkever.fn:x}",
+                              pkever.serder.said))
+        parts.append(f"{db.wigs.cnt(keys=(aid, kever.serder.said)):x}")
+
+        eids = oset(kever.wits)
+        for keys, end in db.ends.getTopItemIter(keys=(aid,)):
+            parts.extend((".".join(keys), repr(end)))
+            eids.add(keys[2])
+        for keys, said in db.eans.getTopItemIter(keys=(aid,)):
+            parts.extend((".".join(keys), said.qb64))
+        for peid in eids:
+            for keys, loc in db.locs.getTopItemIter(keys=(peid,)):
+                parts.extend((".".join(keys), repr(loc)))
+            for keys, said in db.lans.getTopItemIter(keys=(peid,)):
+                parts.extend((".".join(keys), said.qb64))
+
+        return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
 
     def on_get(self, req, rep, aid=None, role=None, eid=None):
         """  GET endoint for OOBI resource
@@ -597,20 +649,43 @@ class OOBIEnd:
             rep.status = falcon.HTTP_NOT_ACCEPTABLE
             return
 
-        eids = []
-        if eid:
-            eids.append(eid)
+        key = (aid, role, eid)
+        etag = self.etag(hab=hab, kever=kever, role=role, eid=eid)
+        matches = [tag.strip().removeprefix("W/") for tag in
+                   (req.get_header("If-None-Match") or "").split(",")]
+        if f'"{etag}"' in matches:  # client copy is current
+            rep.status = falcon.HTTP_NOT_MODIFIED
+            rep.set_header(OOBI_AID_HEADER, aid)
+            rep.set_header("ETag", f'"{etag}"')
+            return
 
-        msgs = hab.replyToOobi(aid=aid, role=role, eids=eids)
-        if not msgs and role is None:
-            msgs = hab.replyToOobi(aid=aid, role=Roles.witness, eids=eids)
-            msgs.extend(hab.replay(aid))
+        cached = self.cache.get(key)
+        if cached is not None and cached[0] == etag:
+            self.cache.move_to_end(key)
+            msgs = cached[1]
+        else:
+            eids = []
+            if eid:
+                eids.append(eid)
+
+            msgs = hab.replyToOobi(aid=aid, role=role, eids=eids)
+            if not msgs and role is None:
+                msgs = hab.replyToOobi(aid=aid, role=Roles.witness, eids=eids)
+                msgs.extend(hab.replay(aid))
+
+            if msgs:
+                msgs = bytes(msgs)
+                self.cache[key] = (etag, msgs)
+                self.cache.move_to_end(key)
+                while len(self.cache) > self.CacheCap:
+                    self.cache.popitem(last=False)
 
         if msgs:
             rep.status = falcon.HTTP_200  # This is the default status
             rep.set_header(OOBI_AID_HEADER, aid)
+            rep.set_header("ETag", f'"{etag}"')
             rep.content_type = "application/cesr"
-            rep.data = bytes(msgs)
+            rep.data = msgs
 
         else:
             rep.status = falcon.HTTP_NOT_FOUND
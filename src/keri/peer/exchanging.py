@@ -271,6 +271,20 @@ class Exchanger:
                 logger.debug("Event=\n%s\n", serder.pretty())
 
     def logEvent(self, serder, pathed=None, tsgs=None, cigars=None, essrs=None):
+        """ Persist verified exn message with its attachments
+
+        Stamps each signature group in tsgs as verified at ingest so that serving
+        the stored message need not verify it again. Only call with signatures
+        that have been verified as in .processEvent.
+
+        Parameters:
+            serder (Serder): verified exn message
+            pathed (list): of bytes of attached paths
+            tsgs (list): of verified (prefixer, seqner, saider, sigers) quadruples
+            cigars (list): of verified Cigar instances of nontrans sigs
+            essrs (list): of Texter instances of ESSR streams
+
+        """
         dig = serder.said
         pdig = serder.ked['p']
         pathed = pathed or []
@@ -282,6 +296,7 @@ class Exchanger:
             quadkeys = (serder.said, prefixer.qb64, f"{seqner.sn:032x}", ssaider.qb64)
             for siger in sigers:
                 self.hby.db.esigs.add(keys=quadkeys, val=siger)
+            self.hby.db.exvs.pin(keys=quadkeys, val=Dater())  # verified at ingest
         for cigar in cigars:
             self.hby.db.ecigs.add(keys=(dig,), val=(cigar.verfer, cigar))
 
@@ -539,12 +554,13 @@ def exchange(route,
     return SerderKERI(sad=sad, makify=True), end  # return serialized ked
 
 
-def cloneMessage(hby, said):
+def cloneMessage(hby, said, stamped=True):
     """ Load and verify signatures on message exn
 
     Parameters:
         hby (Habery): database environment from which to clone message
         said (str): qb64 SAID of message exn to load
+        stamped (bool): True means trust signatures verified at ingest, see verify
 
     Returns:
         tuple: (serder, list) of message exn and pathed signatures on embedded attachments
@@ -554,7 +570,7 @@ def cloneMessage(hby, said):
     if exn is None:
         return None, None
 
-    verify(hby=hby, serder=exn)
+    verify(hby=hby, serder=exn, stamped=stamped)
 
     pathed = dict()
     e = Pather(parts=["e"])
@@ -568,7 +584,19 @@ def cloneMessage(hby, said):
     return exn, pathed
 
 
-def serializeMessage(hby, said, pipelined=False):
+def serializeMessage(hby, said, pipelined=False, stamped=True):
+    """ Load exn message and serialize it with its verified attachments
+
+    Parameters:
+        hby (Habery): database environment from which to load message
+        said (str): qb64 SAID of message exn to serialize
+        pipelined (bool): True means prepend attachment group counter
+        stamped (bool): True means trust signatures verified at ingest, see verify
+
+    Returns:
+        bytearray: exn message followed by its attachments
+
+    """
     atc = bytearray()
 
     exn = hby.db.exns.get(keys=(said,))
@@ -577,7 +605,7 @@ def serializeMessage(hby, said, pipelined=False):
 
     atc.extend(exn.raw)
 
-    tsgs, cigars = verify(hby=hby, serder=exn)
+    tsgs, cigars = verify(hby=hby, serder=exn, stamped=stamped)
 
     if len(tsgs) > 0:
         for (prefixer, seqner, saider, sigers) in tsgs:
@@ -636,12 +664,18 @@ def nesting(paths, acc, val):
         return acc
 
 
-def verify(hby, serder):
+def verify(hby, serder, stamped=False):
     """  Verify that the signatures in the database are valid for the provided exn
 
+    With stamped, a signature group stamped in .exvs as verified at ingest is not
+    verified again as long as its signer est event is still the last event at
+    that sn in the signer's KEL. Otherwise, as when the est event has since been
+    superseded, the group is verified against the current KEL as usual.
+
     Parameters:
         hby (Habery): database environment from which to verify message
         serder (Serder): exn serder to load and verify signatures for
+        stamped (bool): True means trust signature groups verified at ingest
 
     Returns:
         bool: True means threshold satisfyig signatures were loaded and verified successfully
@@ -674,6 +708,12 @@ def verify(hby, serder):
             logger.debug("Exn Body=\n%s\n", serder.pretty())
             raise MissingSignatureError(msg)
 
+        if stamped and hby.db.exvs.get(keys=(serder.said, prefixer.qb64,
+                                             f"{seqner.sn:032x}", ssaider.qb64)) is not None \
+                and hby.db.lastDig(pre=prefixer.qb64b, sn=seqner.sn) == ssaider.qb64:
+            accepted = True  # verified at ingest against est event still in KEL
+            continue
+
         # Verify the signatures are valid and that the signature threshold as of the signing event is met
         tholder, verfers = hby.db.resolveVerifiers(pre=prefixer.qb64, sn=seqner.sn, dig=ssaider.qb64)
         _, indices = verifySigs(serder.raw, sigers, verfers)
@@ -480,6 +480,7 @@ class MsgCacheRecord:
         pml (int): prune message lag in ms (psl or pll from cache-type)
         xl (int): exchange lag in ms from cache-type
         pxl (int): prune exchange lag in ms from cache-type
+        mdtms (int): mdt as POSIX milliseconds, 0 when not recorded
     """
     mdt: str = ''
     d: int = 0
@@ -487,6 +488,7 @@ class MsgCacheRecord:
     pml: int = 0
     xl: int = 0
     pxl: int = 0
+    mdtms: int = 0
 
     def __iter__(self):
         return iter(asdict(self))
@@ -507,6 +509,8 @@ class TxnMsgCacheRecord:
         pml (int): prune message lag in ms (psl or pll from cache-type)
         xl (int): exchange lag in ms from cache-type
         pxl (int): prune exchange lag in ms from cache-type
+        mdtms (int): mdt as POSIX milliseconds, 0 when not recorded
+        xdtms (int): xdt as POSIX milliseconds, 0 when not recorded
     """
     mdt: str = ''
     xdt: str = ''
@@ -515,6 +519,8 @@ class TxnMsgCacheRecord:
     pml: int = 0
     xl: int = 0
     pxl: int = 0
+    mdtms: int = 0
+    xdtms: int = 0
 
     def __iter__(self):
         return iter(asdict(self))
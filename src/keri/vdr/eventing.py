@@ -31,7 +31,7 @@ from ..db import (Baser, Broker, Komer, LMDBer,
                   Suber, OnSuber, CatCesrSuber, IoDupSuber,
                   CesrDupSuber, OnIoDupSuber, SerderSuber,
                   CesrIoSetSuber, CatCesrIoSetSuber, CesrSuber,
-                  openLMDB, dgKey, snKey, dgKey, snKey)
+                  openLMDB, dgKey, snKey, dgKey, snKey, writeMsgs)
 
 
 from ..core import (Counter, Number, Diger, Dater,
@@ -1355,7 +1355,7 @@ class Tever:
         if seqner is None or saider is None:
             return False
 
-        dig = self.db.kels.getLast(keys=self.pre, on=seqner.sn)
+        dig = self.db.lastDig(pre=self.pre, sn=seqner.sn)
         if not dig:
             return False
         else:
@@ -2612,6 +2612,21 @@ class Reger(LMDBer):
             msg = self.cloneTvt(pre, dig)
             yield msg
 
+    def exportPre(self, pre, out, fn=0):
+        """ Writes first seen event messages of TEL pre to out as
+        .clonePreIter yields them
+
+        Parameters:
+            pre (bytes|str): qb64 identifier prefix of registry state TEL
+            out: binary file like object with .write or socket with .sendall
+            fn (int): first seen ordinal
+
+        Returns:
+            int: total number of bytes written
+
+        """
+        return writeMsgs(self.clonePreIter(pre=pre, fn=fn), out)
+
     def cloneTvtAt(self, pre, sn=0):
         snkey = snKey(pre, sn)
         dig = self.tels.get(keys=pre, on=sn)
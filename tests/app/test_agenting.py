@@ -310,3 +310,101 @@ def test_telquery_uses_pre_not_wits():
         assert msg["src"] == hab.pre
         assert msg["target"] == acdc_said
         assert msg["q"]["ri"] == ri
+
+
+def test_receiptor_fanout():
+    """Test Receiptor sends to all witnesses at once and exits on quorum or timeout"""
+    from collections import deque
+    from unittest.mock import patch
+    from keri.app import Receiptor
+
+    class Client:
+        def __init__(self):
+            self.responses = deque()
+
+        def respond(self):
+            return self.responses.popleft()
+
+    class Rep:
+        def __init__(self, body=b"", status=200):
+            self.status = status
+            self.body = body
+
+    with (openHby(name="fanout", temp=True, salt=Salter(raw=b'0123456789abcdef').qb64) as hby,
+          openHby(name="fanwits", temp=True, salt=Salter(raw=b'0123456789abcdef').qb64) as wby):
+        wits = [wby.makeHab(name=f"wit{i}", transferable=False) for i in range(3)]
+        hab = hby.makeHab(name="ctrl", wits=[wit.pre for wit in wits], toad=2)
+        assert hab.kever.toader.num == 2
+
+        def run(quorum, answer, late=False):
+            clients = {wit.pre: Client() for wit in wits}
+            sends = []
+
+            def stream(client, dest, ims, path=None, headers=None):
+                sends.append((dest, path))
+                return 1
+
+            tymist = tyming.Tymist(tock=1.0)
+            receiptor = Receiptor(hby=hby, timeout=5.0, quorum=quorum)
+            receiptor.wind(tymist.tymen())
+            with (patch("keri.app.agenting.httpClient",
+                        lambda hab, wit, pool=None: (clients[wit], None)),
+                  patch("keri.app.agenting.streamCESRRequests", stream)):
+                gen = receiptor.receipt(hab.pre)
+                next(gen)
+                # all witnesses sent to before any response arrives
+                assert sends == [(wit.pre, "/receipts") for wit in wits]
+
+                for wit in wits[:answer]:
+                    clients[wit.pre].responses.append(Rep(body=wit.receipt(hab.kever.serder)))
+                try:
+                    while True:
+                        tymist.tick()
+                        next(gen)
+                        for wit, client in clients.items():  # propagation responses
+                            if any(dest == wit for dest, path in sends[3:]):
+                                client.responses.append(Rep())
+                except StopIteration as ex:
+                    rcts = list(ex.value)
+
+                if late:  # slower witness receipt gathered and propagated in background
+                    assert len(receiptor.lates) == 1
+                    gen = receiptor.lates[0]
+                    for wit in wits[answer:]:
+                        clients[wit.pre].responses.append(Rep(body=wit.receipt(hab.kever.serder)))
+                    count = len(sends)
+                    try:
+                        while True:
+                            tymist.tick()
+                            next(gen)
+                            for wit, client in clients.items():  # propagation responses
+                                if any(dest == wit for dest, path in sends[count:]):
+                                    client.responses.append(Rep())
+                    except StopIteration:
+                        pass
+                    assert [dest for dest, path in sends[count:]] == [wit.pre for wit in wits]
+
+                return rcts, sends[3:], tymist.tyme
+
+        # quorum met by first two receipts so third witness not waited on
+        rcts, propagated, tyme = run(quorum=True, answer=2)
+        assert rcts == [wits[0].pre, wits[1].pre]
+        assert propagated == [(wits[0].pre, None), (wits[1].pre, None)]
+        assert tyme < 5.0
+        assert len(hby.db.wigs.get(keys=(hab.pre, hab.kever.serder.said))) == 2
+
+        # late receipt of third witness still logged and propagated to all
+        rcts, propagated, tyme = run(quorum=True, answer=2, late=True)
+        assert rcts == [wits[0].pre, wits[1].pre]
+        assert len(hby.db.wigs.get(keys=(hab.pre, hab.kever.serder.said))) == 3
+
+        # without quorum exit waits for third witness until timeout
+        rcts, propagated, tyme = run(quorum=False, answer=2)
+        assert rcts == [wits[0].pre, wits[1].pre]
+        assert len(propagated) == 2
+        assert tyme > 5.0
+
+        rcts, propagated, tyme = run(quorum=False, answer=3)
+        assert rcts == [wit.pre for wit in wits]
+        assert len(propagated) == 3
+        assert tyme < 5.0
@@ -22,7 +22,7 @@ from keri.core import (Kevery, Salter, Seqner, Number,
 
 from keri.app import (Configer, ConfigerDoer, Habery,
                       Hab, HaberyDoer, Keeper, KeeperDoer,
-                      openHab, openHby, Algos)
+                      openHab, openHby, Algos, SignerCache)
 
 from keri.db import Baser, BaserDoer
 
@@ -622,6 +622,27 @@ def test_habery_signatory():
         assert len(hby.prefixes) == 0
 
 
+def test_habery_signer_cache():
+    """
+    Test Habery forwards opt in signer cache to its Manager
+    """
+    with openHby(salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
+        assert hby.mgr.cache is None  # no cache by default
+
+    cache = SignerCache(size=8, ttl=60.0)
+    with openHby(salt=Salter(raw=b'0123456789abcdef').qb64, cache=cache) as hby:
+        assert hby.mgr.cache is cache
+        hab = hby.makeHab(name="test")
+        raw = b'this is the raw data'
+        sigers = hab.sign(ser=raw)
+        misses, hits = cache.misses, cache.hits
+        assert [siger.qb64 for siger in hab.sign(ser=raw)] == [siger.qb64 for siger in sigers]
+        assert cache.hits == hits + len(sigers)  # signers from cache
+        assert cache.misses == misses
+
+    """ End Test """
+
+
 def test_habery_reconfigure(mockHelpingNowUTC):
     """
     Test   .reconfigure method using .cf for config file
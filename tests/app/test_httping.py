@@ -4,13 +4,16 @@ tests.peer.httping module
 
 """
 
+import datetime
+
 import falcon
 import pytest
 from falcon.testing import helpers
+from hio.base import doing
 
 from keri.app import (openHab, parseCesrHttpRequest,
                       createCESRRequest, streamCESRRequests,
-                      CESR_CONTENT_TYPE)
+                      CESR_CONTENT_TYPE, Clienter, ClientPool)
 from keri.kering import Ilks
 from keri.core import SerderKERI
 from keri.vdr import Regery, Verifier
@@ -203,5 +206,62 @@ def test_stream_cesr_request(mockHelpingNowUTC):
                                               b'jIu5ZwJILbL2bcID')
 
 
+def test_client_pool():
+    pool = ClientPool(maxPerHost=1, idleTimeout=60)
+    assert pool.maxPerHost == 1
+
+    one = pool.acquire("http", "127.0.0.1", 5642, path="/receipts")
+    two = pool.acquire("http", "127.0.0.1", 5642)
+    other = pool.acquire("http", "127.0.0.1", 5643)
+    assert one is not two
+    assert one.requester.path == "/receipts"
+    assert len(pool.leased) == 3
+    assert len(pool.doers) == 4  # poolDo and a ClientDoer per client
+
+    one.responses.append(dict(status=200))
+    pool.release(one)
+    pool.release(two)  # only maxPerHost idle clients are kept
+    assert len(pool.idle[("http", "127.0.0.1", 5642)]) == 1
+    assert len(pool.doers) == 3
+
+    # reuses most recently released client for the same host and resets base path
+    client = pool.acquire("http", "127.0.0.1", 5642, path="/")
+    assert client is two
+    assert client.requester.path == "/"
+    assert pool.acquire("http", "127.0.0.1", 5642) not in (one, two)
+
+    # clients released with requests in flight or cut off are closed not reused
+    client.request(method="POST", path="/", body=b"")
+    pool.release(client)
+    other.connector.cutoff = True
+    pool.release(other)
+    assert pool.idle[("http", "127.0.0.1", 5642)] == []
+    assert ("http", "127.0.0.1", 5643) not in pool.idle
+    pool.release(client)  # not leased so ignored
+
+    # idle clients are evicted after idle timeout
+    client = pool.acquire("http", "127.0.0.1", 5644)
+    pool.release(client)
+    (client, doer, dt) = pool.idle[("http", "127.0.0.1", 5644)][0]
+    pool.idle[("http", "127.0.0.1", 5644)][0] = (client, doer, dt - datetime.timedelta(seconds=61))
+    doist = doing.Doist(limit=0.1, tock=0.03, real=True)
+    doist.do(doers=[pool])
+    assert ("http", "127.0.0.1", 5644) not in pool.idle
+
+    # Clienter leases from pool and releases on remove so next request reuses the client
+    pool = ClientPool()
+    clienter = Clienter(pool=pool)
+    assert pool not in clienter.doers
+    client = clienter.request("GET", "http://127.0.0.1:5642/oobi?name=wit")
+    assert client in pool.leased
+    client.requests.clear()  # as when response received
+    clienter.remove(client)
+    assert clienter.clients == []
+    assert clienter.request("GET", "http://127.0.0.1:5642/oobi") is client
+
+    clienter = Clienter()  # runs its own pool when none shared
+    assert clienter.pool in clienter.doers
+
+
 if __name__ == '__main__':
     test_parse_cesr_request()
@@ -79,6 +79,42 @@ def test_mailbox_iter():
         next(mbi)
 
 
+def test_mailbox_iter_notify():
+    pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
+    msg = dict(i=pre, t="rct")
+    mbx = Mailboxer(temp=True)
+    mb = MailboxIterable(mbx=mbx, pre=pre, topics={"/receipt": 0, "/challenge": 0},
+                         retry=1000)
+
+    reads = []
+    clone = mbx.cloneTopicIter
+    def cloneTopicIter(topic, fn=0):
+        reads.append((topic, fn))
+        return clone(topic, fn)
+    mbx.cloneTopicIter = cloneTopicIter
+
+    mbi = iter(mb)
+    assert next(mbi) == b'retry: 1000\n\n'
+    assert next(mbi) == b''
+    assert reads == [(f"{pre}/receipt", 0), (f"{pre}/challenge", 0)]  # first read
+
+    reads.clear()
+    assert next(mbi) == b''
+    assert next(mbi) == b''
+    assert reads == []  # idle so no reads
+
+    mbx.storeMsg(topic=f"{pre}/receipt".encode("utf-8"), msg=json.dumps(msg).encode("utf-8"))
+    val = next(mbi)
+    assert val.startswith(b'id: 0\nevent: /receipt\n')
+    assert reads == [(f"{pre}/receipt", 0)]  # only woken topic
+
+    reads.clear()
+    mbx.storeMsg(topic=f"{pre}/receipt", msg=json.dumps(msg).encode("utf-8"))
+    val = next(mbi)
+    assert val.startswith(b'id: 1\nevent: /receipt\n')
+    assert reads == [(f"{pre}/receipt", 1)]  # resumes after last fn
+
+
 def test_mailbox_multiple_iter():
     pre = "EA3mbE6upuYnFlx68GmLYCQd7cCcwG_AtHM6dW_GT068"
     msg = dict(words=["abc", "def"])
@@ -24,8 +24,8 @@ from keri.core import (Prefixer, Signer, Cigar, Siger,
                        Tiers, IdrDex, NonTransDex, MtrDex)
 from keri.app import (PubLot, PrePrm, PreSit, PubSet,
                       Keeper, Creator, RandyCreator,
-                      SaltyCreator, Creatory, Manager,
-                      KeeperDoer, Algos, riKey, openKS)
+                      SaltyCreator, Creatory, Manager, ManagerDoer,
+                      SignerCache, KeeperDoer, Algos, riKey, openKS)
 
 
 def test_dataclasses():
@@ -2006,5 +2006,74 @@ def test_manager_sign_dual_indices():
     assert not manager.ks.opened
     """End Test"""
 
+def test_manager_signer_cache():
+    """
+    test Manager signing with cache of decrypted signers
+    """
+    cache = SignerCache(size=2, ttl=60.0)
+    signers = Salter(raw=b'0123456789abcdef').signers(count=3, temp=True)
+    for signer in signers[:2]:
+        cache.put(signer.verfer.qb64, signer)
+    assert cache.get(signers[0].verfer.qb64) is signers[0]  # now most recent
+    cache.put(signers[2].verfer.qb64, signers[2])  # evicts least recent
+    assert signers[1].verfer.qb64 not in cache
+    assert signers[1].raw == bytes(32)  # zeroized
+    with pytest.raises(TypeError):
+        signers[1].sign(b'abc')
+    cache.put(signers[1].verfer.qb64, signers[1], keep=[signers[0].verfer.qb64,
+                                                       signers[2].verfer.qb64])
+    assert len(cache) == 3  # in use so none evicted
+    cache.ttl = 0.0
+    cache.put(signers[1].verfer.qb64, signers[1])
+    assert cache.get(signers[1].verfer.qb64) is None  # expired
+    assert signers[1].raw == bytes(32)
+
+    # expired entries swept on any lookup or insertion not only their own
+    cache.clear()
+    signers = Salter(raw=b'0123456789abcdef').signers(count=3, temp=True)
+    cache.put(signers[0].verfer.qb64, signers[0])
+    cache.put(signers[1].verfer.qb64, signers[1])
+    cache.ttl = 60.0
+    cache.put(signers[2].verfer.qb64, signers[2], keep=[signers[1].verfer.qb64])
+    assert signers[0].verfer.qb64 not in cache  # swept
+    assert signers[0].raw == bytes(32)
+    assert signers[1].verfer.qb64 in cache  # in use so kept
+    assert cache.get(signers[2].verfer.qb64) is signers[2]
+    assert signers[1].verfer.qb64 not in cache  # swept once not in use
+    assert signers[1].raw == bytes(32)
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    assert signers[0].raw == signers[2].raw == bytes(32)
+
+    salt = Salter(raw=b'0123456789abcdef').qb64
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    with openKS() as keeper:
+        manager = Manager(ks=keeper, salt=salt, cache=SignerCache())
+        verfers, digers = manager.incept(icount=3, salt=salt, temp=True)
+
+        sigers = manager.sign(ser=ser, verfers=verfers)
+        assert len(manager.cache) == 3
+        assert manager.cache.misses == 3
+        again = manager.sign(ser=ser, pubs=[verfer.qb64 for verfer in verfers])
+        assert manager.cache.hits == 3
+        assert [s.qb64 for s in again] == [s.qb64 for s in sigers]
+        assert all(verfer.verify(siger.raw, ser) for verfer, siger in zip(verfers, again))
+
+        manager.cache.size = 1  # keys in use are not evicted by same sign
+        cigars = manager.sign(ser=ser, verfers=verfers, indexed=False)
+        assert all(cigar.verfer.verify(cigar.raw, ser) for cigar in cigars)
+
+        manager.rotate(pre=verfers[0].qb64, ncount=3, temp=True)
+        assert len(manager.cache) == 0  # invalidated
+
+        manager.sign(ser=ser, verfers=verfers)
+        doer = ManagerDoer(manager=manager)
+        doer.exit()
+        assert len(manager.cache) == 0  # zeroized on exit
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     test_manager_sign_dual_indices()
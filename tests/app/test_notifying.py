@@ -182,6 +182,48 @@ def test_noter(mockHelpingNowUTC):
     assert cnt == 13
 
 
+def test_noter_pages():
+    noter = Noter(temp=True)
+    cig = Cigar(qb64="AABr1EJXI1sTuI51TXo4F1JjxIJzwPeCxa-Cfbboi7F4Y4GatPEvK629M7G_5c86_Ssvwg8POZWNMV-WreVqBECw")
+    assert noter.getNotePage() == ([], None)
+    assert noter.getNoteCnt() == 0
+
+    for i in range(7):
+        note = notice(attrs=dict(a=i),
+                      dt=helping.fromIso8601(f"2022-07-08T15:01:0{i}.453632"))
+        assert noter.add(note, cig) is True
+    assert noter.add(note, cig) is False  # duplicate not counted
+    assert noter.getNoteCnt() == 7
+
+    notes, token = noter.getNotePage(limit=3)
+    assert [note.attrs['a'] for note, _ in notes] == [0, 1, 2]
+    assert token == f"{notes[2][0].datetime}/{notes[2][0].rid}"
+    notes, token = noter.getNotePage(token=token, limit=3)
+    assert [note.attrs['a'] for note, _ in notes] == [3, 4, 5]
+    assert notes[0][1].qb64 == cig.qb64
+    notes, token = noter.getNotePage(token=token, limit=3)
+    assert [note.attrs['a'] for note, _ in notes] == [6]
+    assert token is None
+
+    # pages match offset pagination
+    assert [note.rid for note, _ in noter.getNotePage(limit=7)[0]] == \
+           [note.rid for note, _ in noter.getNotes(start=0, end=6)]
+
+    # removing the note of a token still continues after it
+    notes, token = noter.getNotePage(limit=2)
+    assert noter.rem(notes[1][0].rid) is True
+    assert noter.rem(notes[1][0].rid) is False
+    assert noter.getNoteCnt() == 6 == noter.notes.cntAll()
+    notes, token = noter.getNotePage(token=token, limit=2)
+    assert [note.attrs['a'] for note, _ in notes] == [2, 3]
+
+    # count of notes added before the maintained count
+    noter.ncnt.rem(keys=("cnt",))
+    assert noter.getNoteCnt() == 6
+
+    noter.close(clear=True)
+
+
 def test_notifier(mockHelpingNowUTC):
     with openHby(name="test") as hby:
         notifier = Notifier(hby=hby)
@@ -223,6 +265,11 @@ def test_notifier(mockHelpingNowUTC):
 
         assert notes[2].datetime == "2021-01-01T00:00:00.000000+00:00"
 
+        notes, token = notifier.getNotePage(limit=2)
+        assert len(notes) == 2
+        notes, token = notifier.getNotePage(token=token, limit=2)
+        assert len(notes) == 1 and token is None
+
     payload = dict(a=1, b=2, c=3)
     dt = helping.fromIso8601("2022-07-08T15:01:05.453632")
     cig = Cigar(qb64="AABr1EJXI1sTuI51TXo4F1JjxIJzwPeCxa-Cfbboi7F4Y4GatPEvK629M7G_5c86_Ssvwg8POZWNMV-WreVqBECw")
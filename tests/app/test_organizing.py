@@ -211,6 +211,72 @@ def test_find_exact():
         assert exact_bob[0]["id"] == bob
 
 
+def test_organizer_index():
+    """Test lookups from field value and n-gram indexes match scans of fields"""
+    sal = "Eo60ITGA69z4jNBU4RsvbgsjfAHFcTM2HVEXea1SvnXk"
+    sal_direct = "EPzeu5_C80nzPc_BGUHVBkXXfNmlS55Ayl7Rd1I0gWFE"
+    bob = "EuEQX8At31X96iDVpigv-rTdOKvFiWFunbJ1aDfq89IQ"
+    note = "x" * 300
+
+    with openHby(name="test_index", temp=True) as hby:
+        org = Organizer(hby=hby)
+        scan = BaseOrganizer(hby=hby, cigsdb=hby.db.ccigs, datadb=hby.db.cons,
+                             fielddb=hby.db.cfld, imgsdb=hby.db.imgs)  # no indexes
+
+        org.replace(pre=sal, data=dict(first="Sally", alias="sally", note=note))
+        org.replace(pre=sal_direct, data=dict(first="Sally", alias="sally-direct",
+                                              note=note + "y"))
+        org.replace(pre=bob, data=dict(first="Bob", alias="bob.b"))
+        assert list(hby.db.cidx.getIter(keys=("alias", "sally"))) == [sal]
+        assert sorted(hby.db.cgrm.getIter(keys=("first", "sal"))) == sorted([sal, sal_direct])
+
+        def ids(contacts):
+            return [contact["id"] for contact in contacts]
+
+        for field, val in (("alias", "sally"), ("alias", "Sally"), ("alias", "sa"),
+                           ("alias", "ALLY-D"), ("alias", "b.b"), ("alias", "b.*"),
+                           ("note", note), ("first", "none")):
+            assert ids(org.find(field, val)) == ids(scan.find(field, val))
+            assert ids(org.findExact(field, val)) == ids(scan.findExact(field, val))
+            assert ids(org.findPrefix(field, val)) == ids(scan.findPrefix(field, val))
+        assert ids(org.find("alias", "ALLY-D")) == [sal_direct]
+        assert ids(org.findExact("note", note)) == [sal]
+        assert ids(org.findPrefix("note", note)) == sorted([sal, sal_direct])
+        assert ids(org.findPrefix("alias", "sally")) == sorted([sal, sal_direct])
+        assert org.values("note") == scan.values("note")
+        assert org.values("alias") == scan.values("alias")
+        assert org.values("alias") == ["sally-direct", "sally", "bob.b"]  # by pre
+        assert org.values("first") == ["Sally", "Bob"]
+        assert org.values("first", val="sal") == ["Sally"]
+
+        # indexes maintained as fields change
+        org.set(pre=sal, field="alias", val="sal")
+        assert ids(org.findExact("alias", "sally")) == []
+        assert ids(org.findExact("alias", "sal")) == [sal]
+        assert ids(org.find("alias", "ally")) == [sal_direct]
+        org.update(pre=bob, data=dict(first="Sally"))
+        assert ids(org.findExact("first", "Sally")) == sorted([sal, bob, sal_direct])
+        org.unset(pre=bob, field="first")
+        assert ids(org.find("first", "sally")) == sorted([sal, sal_direct])
+        org.rem(pre=sal_direct)
+        assert ids(org.find("first", "sally")) == [sal]
+        assert org.values("note") == [note]
+
+        # fields written before index existed scanned until backfilled
+        hby.db.cidx.trim()
+        hby.db.cgrm.trim()
+        assert not org.indexed(hby.db.cidx)
+        assert ids(org.findExact("alias", "sal")) == [sal]
+        assert ids(org.find("alias", "b.b")) == [bob]
+        assert org.values("alias") == scan.values("alias")
+
+        # rebuild from fields
+        org.reindex()
+        assert org.indexed(hby.db.cidx)
+        assert ids(org.findExact("alias", "sal")) == [sal]
+        assert ids(org.find("alias", "b.b")) == [bob]
+
+
 def test_organizer_imgs():
 
     with openHab(name="test", transferable=True, temp=True) as (hby, hab):
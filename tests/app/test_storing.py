@@ -86,6 +86,9 @@ def test_mailboxing():
                               date="2021-07-15T13:01:37.624492+00:00", sender=dest.qb64)
             mber.storeMsg(topic=dest.qb64b, msg=exn.raw)
 
+        assert mber.topicSeq(dest.qb64b) == mber.topicSeq(dest.qb64) == 10
+        assert mber.topicSeq("nothing") == 0
+
         msgs = []
         for fn, topic, msg in mber.cloneTopicIter(topic=dest.qb64b):
             msgs.append((fn, msg))
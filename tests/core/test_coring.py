@@ -31,7 +31,7 @@ from keri.help import sceil, intToB64, codeB64ToB2, DTS_BASE_0, DTS_BASE_1
 from keri.core import (Saids, Tholder, Seqner, NumDex, Number, Decimer, DecDex,
                        Dater, Bexter, Texter, TagDex, Tagger, Ilker, Traitor,
                        Labeler, LabelDex, Verser, Versage, Sizage, MtrDex, Matter,
-                       Verfer, Cigar, Saider, DigDex, Diger, Prefixer, PreDex,
+                       Verfer, VerifyCache, Cigar, Saider, DigDex, Diger, Prefixer, PreDex,
                        Noncer, NonceDex, MapDom, IceMapDom, SmallVrzDex,
                        LargeVrzDex, Pather, dumps, loads)
 
@@ -5836,6 +5836,67 @@ def test_verfer():
     """ Done Test """
 
 
+def test_verify_cache(monkeypatch):
+    """
+    Test VerifyCache of signature verification results shared by Verfers
+    """
+    seed = pysodium.randombytes(pysodium.crypto_sign_SEEDBYTES)
+    verkey, sigkey = pysodium.crypto_sign_seed_keypair(seed)
+    ser = b'abcdefghijklmnopqrstuvwxyz0123456789'
+    sig = pysodium.crypto_sign_detached(ser, seed + verkey)
+
+    cache = VerifyCache(cap=2)
+    assert cache.cap == 2
+    assert cache.enabled
+    assert cache.ratio == 0.0
+    monkeypatch.setattr(Verfer, "Cache", cache)
+
+    calls = []
+    def _verify(sig, ser, key):
+        calls.append(sig)
+        return Verfer._ed25519(sig=sig, ser=ser, key=key)
+
+    verfer = Verfer(raw=verkey, code=MtrDex.Ed25519)
+    monkeypatch.setattr(verfer, "_verify", _verify)
+
+    assert verfer.verify(sig, ser)
+    assert verfer.verify(bytearray(sig), ser)  # same bytes hit
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cache.ratio == 0.5
+
+    # invalid results are cached too and keyed apart from valid ones
+    assert not verfer.verify(sig, ser + b'x')
+    assert not verfer.verify(sig, ser + b'x')
+    assert len(calls) == 2
+    # signature length is part of key so shifting bytes between sig and ser misses
+    assert not verfer.verify(sig[:-1], sig[-1:] + ser)
+    assert len(calls) == 3
+    assert len(cache.results) == 2  # least recently used evicted at cap
+
+    other = Verfer(raw=verkey, code=MtrDex.Ed25519N)  # code is part of key
+    assert other.verify(sig, ser)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    # disabled cache always verifies and does not count
+    cache.enabled = False
+    assert verfer.verify(sig, ser)
+    assert len(calls) == 4
+    assert cache.hits + cache.misses == 6
+
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache.results)) == (0, 0, 0)
+
+    monkeypatch.setenv("KERI_VERIFY_CACHE_CAP", "0")
+    assert VerifyCache().cap == 0
+    monkeypatch.setattr(Verfer, "Cache", VerifyCache())
+    assert verfer.verify(sig, ser)
+    assert len(calls) == 5
+    assert len(Verfer.Cache.results) == 0
+
+    """ Done Test """
+
+
 def test_cigar():
     """
     Test Cigar subclass of Matter
@@ -11,6 +11,9 @@ import pytest
 
 from hio.help import ogler
 
+from ordered_set import OrderedSet as oset
+
+from keri import kering
 from keri.kering import Vrsn_1_0, MisfitEventSourceError
 
 from keri.core import (Seqner, Counter, Salter, Saider,
@@ -19,6 +22,7 @@ from keri.core import (Seqner, Counter, Salter, Saider,
                        incept, interact, rotate, delcept)
 
 from keri.db import dgKey, snKey, openDB
+from keri.db.migrations import add_escrow_expiry_index
 from keri.app import keeping
 
 
@@ -190,6 +194,7 @@ def test_partial_signed_escrow():
         # Process partials but stale escrow  despite two sigs set Timeout to 0
         kvy.TimeoutPSE = 0  # forces all escrows to be stale
         time.sleep(0.001)
+        kvy.pruneEscrows()
         kvy.processEscrowPartialSigs()
         assert kvr.sn == 0  # key state not updated
         # escrows now empty
@@ -1199,6 +1204,7 @@ def test_out_of_order_escrow():
         # Process partials but stale escrow  set Timeout to 0
         kvy.TimeoutOOE = 0  # forces all escrows to be stale
         time.sleep(0.001)
+        kvy.pruneEscrows()
         kvy.processEscrowOutOfOrders()
         assert pre not in kvy.kevers  # key state not updated
         escrows = kvy.db.ooes.get(keys=pre, on=1)
@@ -1312,10 +1318,11 @@ def test_ooes_missing_db_entries_escrow_cleanup():
         # find dgkey for this escrowed event
         dgkey = dgKey(pre, ixndig)
 
-        # missing DTS → OOES must remove entry
+        # missing DTS → OOES retry does not need it since pruned via index
         db.dtss.rem(keys=dgkey)
         kvy.processEscrowOutOfOrders()
-        assert db.ooes.get(keys=pre, on=1) == []  # cleaned up
+        assert db.ooes.get(keys=pre, on=1) == [ixndig]  # still escrowed
+        db.ooes.rem(keys=pre, on=1, val=ixndig)
 
         # reload interaction event into OOES
         psr.parse(ims=bytearray(ixnmsg), kvy=kvy)
@@ -1979,6 +1986,190 @@ def test_unverified_trans_receipt_escrow():
     """End Test"""
 
 
+def test_indexed_escrow_wakes():
+    """
+    Test event driven escrow processing of only woken prefixes
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+
+    icps = []
+    ixns = []
+    for signer in signers:
+        serder = incept(keys=[signer.verfer.qb64],
+                        ndigs=[Diger(ser=signer.verfer.qb64b).qb64])
+        icps.append((serder, [signer.sign(serder.raw, index=0)]))
+        iserder = interact(pre=serder.pre, dig=serder.said, sn=1)
+        ixns.append((iserder, [signer.sign(iserder.raw, index=0)]))
+    apre = icps[0][0].pre
+    bpre = icps[1][0].pre
+
+    with openDB(name="wake", temp=True) as db:
+        kvy = Kevery(db=db, indexed=True)
+        assert kvy.indexed
+        assert not kvy.wakes
+        assert kvy.swept is None
+
+        for serder, sigers in ixns:  # out of order so escrowed
+            with pytest.raises(kering.OutOfOrderError):
+                kvy.processEvent(serder=serder, sigers=sigers)
+        assert kvy.db.ooes.get(keys=apre, on=1)
+        assert kvy.db.ooes.get(keys=bpre, on=1)
+
+        kvy.processEscrows()  # first pass is full sweep
+        assert kvy.swept is not None
+        swept = kvy.swept
+
+        kvy.processEvent(serder=icps[0][0], sigers=icps[0][1])
+        kvy.processEvent(serder=icps[1][0], sigers=icps[1][1])
+        assert kvy.wakes == oset([apre, bpre])
+        kvy.wakes.remove(bpre)  # pretend b not woken
+
+        kvy.processEscrows()  # indexed pass retries only a
+        assert kvy.swept == swept  # not a full sweep
+        assert kvy.kevers[apre].sn == 1
+        assert not kvy.db.ooes.get(keys=apre, on=1)
+        assert kvy.kevers[bpre].sn == 0  # b not retried
+        assert kvy.db.ooes.get(keys=bpre, on=1)
+        assert kvy.wakes == oset([apre])  # woken again by accepting a ixn
+
+        kvy.wakes.clear()
+        kvy.processEscrows()  # nothing woken so nothing retried
+        assert kvy.kevers[bpre].sn == 0
+
+        kvy.SweepPeriod = 0  # full sweep now due
+        time.sleep(0.001)
+        kvy.processEscrows()
+        assert kvy.swept > swept
+        assert kvy.kevers[bpre].sn == 1
+        assert not kvy.db.ooes.get(keys=bpre, on=1)
+
+        # anchored seal wakes delegated prefix
+        kvy.wakes.clear()
+        serder = interact(pre=apre, dig=ixns[0][0].said, sn=2,
+                          data=[dict(i=bpre, s="2", d=ixns[1][0].said)])
+        kvy.wake(serder)
+        assert kvy.wakes == oset([apre, bpre])
+
+    """End Test"""
+
+
+def test_indexed_escrow_merge_wakes():
+    """
+    Test indexed escrow processing of split multisig signatures and late
+    receipts woken by escrowing or merging into escrows
+    """
+    salter = Salter(raw=b'0123456789abcdef')
+    signers = salter.signers(count=2, temp=True)
+    wits = salter.signers(count=1, path="wit", transferable=False, temp=True)
+
+    serder = incept(keys=[signer.verfer.qb64 for signer in signers],
+                    isith="2",
+                    ndigs=[Diger(ser=signer.verfer.qb64b).qb64 for signer in signers],
+                    code=MtrDex.Blake3_256)
+    pre = serder.pre
+    sigers = [signer.sign(serder.raw, index=i) for i, signer in enumerate(signers)]
+    rserder = eventing.receipt(pre=pre, sn=0, said=serder.said)
+    cigar = wits[0].sign(serder.raw)
+
+    with openDB(name="merge", temp=True) as db:
+        kvy = Kevery(db=db, indexed=True)
+        kvy.processEscrows()  # first pass is full sweep
+        swept = kvy.swept
+        assert not kvy.wakes
+
+        with pytest.raises(kering.MissingSignatureError):  # escrowed to pses
+            kvy.processEvent(serder=serder, sigers=sigers[:1])
+        assert kvy.wakes == oset([pre])
+
+        kvy.processEscrows()  # indexed retry still missing signature
+        assert kvy.swept == swept  # not a full sweep
+        assert pre not in kvy.kevers
+        assert not kvy.wakes  # retry does not wake itself
+
+        with pytest.raises(kering.UnverifiedReceiptError):  # escrowed to ures
+            kvy.processReceipt(serder=rserder, cigars=[cigar])
+        assert kvy.wakes == oset([pre])
+        kvy.processEscrows()
+        assert not kvy.wakes
+        assert kvy.db.ures.get(keys=(pre, Number(num=0, code=NumDex.Huge).qb64))
+
+        with pytest.raises(kering.MissingSignatureError):  # merged into pses
+            kvy.processEvent(serder=serder, sigers=sigers[1:])
+        assert kvy.wakes == oset([pre])
+
+        kvy.processEscrows()  # indexed retry accepts and wakes pre again
+        assert kvy.swept == swept
+        assert pre in kvy.kevers
+        assert kvy.wakes == oset([pre])
+
+        kvy.processEscrows()  # now late receipt unescrowed
+        assert kvy.swept == swept
+        assert not kvy.db.ures.get(keys=(pre, Number(num=0, code=NumDex.Huge).qb64))
+        assert [wiger for wiger in kvy.db.rcts.get(keys=(pre, serder.said))]
+
+    """End Test"""
+
+
+def test_prune_escrows():
+    """
+    Test pruning stale escrows via expiry ordered escrow index
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=2, temp=True)
+
+    icps = []
+    ixns = []
+    for signer in signers:
+        serder = incept(keys=[signer.verfer.qb64],
+                        ndigs=[Diger(ser=signer.verfer.qb64b).qb64])
+        icps.append((serder, [signer.sign(serder.raw, index=0)]))
+        iserder = interact(pre=serder.pre, dig=serder.said, sn=1)
+        ixns.append((iserder, [signer.sign(iserder.raw, index=0)]))
+    apre = icps[0][0].pre
+    bpre = icps[1][0].pre
+
+    with openDB(name="prune", temp=True) as db:
+        kvy = Kevery(db=db)
+
+        for serder, sigers in ixns:  # out of order so escrowed
+            with pytest.raises(kering.OutOfOrderError):
+                kvy.processEvent(serder=serder, sigers=sigers)
+        assert db.exes.cntAll() == 2
+        items = list(db.exes.getTopItemIter(keys=("ooes", "")))
+        stamps = [keys[1] for keys, val in items]
+        assert stamps == sorted(stamps)  # time ordered
+        assert [(keys[2], number.num, diger.qb64) for keys, (number, diger) in items] == \
+               [(apre, 1, ixns[0][0].said), (bpre, 1, ixns[1][0].said)]
+
+        kvy.processEscrows()  # re-escrow on retry is idempotent in index
+        assert db.exes.cntAll() == 2
+        assert kvy.pruneEscrows() == 0  # nothing expired
+
+        kvy.processEvent(serder=icps[0][0], sigers=icps[0][1])
+        kvy.processEscrows()  # unescrows a but leaves its index entry
+        assert kvy.kevers[apre].sn == 1
+        assert db.exes.cntAll() == 2
+
+        kvy.TimeoutOOE = 0
+        time.sleep(0.001)
+        assert kvy.pruneEscrows() == 1  # only b was still escrowed
+        assert not db.ooes.get(keys=bpre, on=1)
+        assert db.exes.cntAll() == 0
+        assert kvy.kevers[apre].sn == 1
+
+        # backfill indexes events escrowed before the index existed
+        db.ooes.add(keys=bpre, on=1, val=ixns[1][0].said)
+        db.dtss.rem(keys=dgKey(bpre, ixns[1][0].said))  # stamped by backfill
+        assert db.exes.cntAll() == 0
+        assert kvy.pruneEscrows() == 0  # not indexed so never pruned
+        add_escrow_expiry_index.migrate(db)
+        assert db.exes.cntAll() == 1
+        time.sleep(0.001)
+        assert kvy.pruneEscrows() == 1
+        assert not db.ooes.get(keys=bpre, on=1)
+
+    """End Test"""
+
+
 if __name__ == "__main__":
     #test_unverified_receipt_escrow()
     test_missing_delegator_escrow()
@@ -23,7 +23,9 @@ from keri.core import (Signer, Counter, Codens, Kever, Parser,
                        deReceiptCouple, deSourceCouple, deReceiptTriple,
                        deTransReceiptQuadruple, deTransReceiptQuintuple,
                        incept, rotate, interact, receipt, query, delcept,
-                       deltate, state, messagize, loadEvent)
+                       deltate, state, messagize, loadEvent, verifySigs,
+                       verifySigsBatch)
+from keri.core.eventing import verifyBatch
 
 from keri.db import openDB, dgKey, snKey
 from keri.help import helping, ogler
@@ -578,6 +580,55 @@ def test_dequintuple():
     """end test"""
 
 
+def test_verify_sigs_batch():
+    """Test verifyBatch and verifySigsBatch match verifySigs"""
+    signers = Salter(raw=b"ABCDEFGH01234567").signers(count=3, path='vb', temp=True)
+    verfers = [signer.verfer for signer in signers]
+    ser0 = b"first serialization"
+    ser1 = b"second serialization"
+
+    sigers0 = [signer.sign(ser0, index=i) for i, signer in enumerate(signers)]
+    sigers0.append(sigers0[0])  # duplicate
+    sigers1 = [signers[0].sign(ser1, index=0),
+               signers[1].sign(ser0, index=1),  # wrong ser so not verify
+               signers[2].sign(ser1, index=5)]  # index too large so skipped
+
+    triples = [(verfers[0], sigers0[0].raw, ser0),
+               (verfers[1], sigers0[0].raw, ser0),  # wrong key
+               (verfers[2], sigers0[2].raw, ser0)]
+    assert verifyBatch(triples) == [True, False, True]
+    assert verifyBatch(triples, workers=2) == [True, False, True]
+    assert verifyBatch([], workers=2) == []
+
+    items = [(ser0, sigers0, verfers), (ser1, sigers1, verfers), (ser1, None, verfers)]
+    for workers in (None, 1, 4):
+        verifieds = verifySigsBatch(items, workers=workers)
+        assert len(verifieds) == len(items)
+        for (raw, sigers, verfers), (vsigers, vindices) in zip(items, verifieds):
+            esigers, eindices = verifySigs(raw=raw, sigers=sigers, verfers=verfers)
+            assert vindices == eindices
+            assert [siger.qb64 for siger in vsigers] == [siger.qb64 for siger in esigers]
+            assert all(siger.verfer is not None for siger in vsigers)
+
+    vsigers, vindices = verifySigsBatch(items)[0]
+    assert vindices == [0, 1, 2]  # duplicate removed
+    vsigers, vindices = verifySigsBatch(items)[1]
+    assert vindices == [0]
+
+    # Verfer hands back batch verified triples without verifying again
+    bad = b"\x00" * 64
+    assert not verfers[0].verify(bad, ser0)
+    Verfer.Verifieds = {(verfers[0].raw, bad, ser0)}
+    try:
+        assert verfers[0].verify(bad, ser0)  # trusts batch result
+        assert not verfers[1].verify(bad, ser0)  # miss so verifies
+        assert not verfers[0].verify(bytearray(bad), ser0)  # unhashable sig
+    finally:
+        Verfer.Verifieds = None
+    assert not verfers[0].verify(bad, ser0)
+    """End Test"""
+
+
 def test_lastestloc():
     """
     Test LastEstLoc namedtuple
@@ -4713,6 +4764,64 @@ def test_process_manual():
     """ Done Test """
 
 
+def test_duplicate_fast_path(monkeypatch):
+    """
+    Test resent duplicate events skip SAID and signature reverification and
+    only merge new attached signatures
+    """
+    signers = Salter(raw=b'0123456789abcdef').signers(count=6, temp=True)
+    keys = [signer.verfer.qb64 for signer in signers[:3]]
+    ndigs = [Diger(ser=signer.verfer.qb64b).qb64 for signer in signers[3:]]
+    icp = incept(keys=keys, isith="2", ndigs=ndigs, nsith="2", code=MtrDex.Blake3_256)
+    ixn = interact(pre=icp.pre, dig=icp.said, sn=1)
+    sigs = {serder.said: [signer.sign(serder.raw, index=i)
+                          for i, signer in enumerate(signers[:3])]
+            for serder in (icp, ixn)}
+
+    def stream(count):  # events each with first count signatures attached
+        msgs = bytearray()
+        for serder in (icp, ixn):
+            msgs.extend(messagize(serder, sigers=sigs[serder.said][:count]))
+        return msgs
+
+    with openDB(name="dup") as db:
+        kvy = Kevery(db=db, lax=False, local=False)
+        Parser(version=Vrsn_1_0).parse(ims=stream(2), kvy=kvy)
+        assert kvy.kevers[icp.pre].sn == 1
+        assert list(kvy.dups) == [(icp.pre, icp.said), (icp.pre, ixn.said)]
+        assert len(db.sigs.get(keys=dgKey(icp.preb, ixn.saidb))) == 2
+
+        verifies = []
+
+        def _verify(self):
+            verifies.append(self.said)
+
+        def verify(self, sig, ser):
+            verifies.append(ser)
+            return True
+
+        monkeypatch.setattr(SerderKERI, "_verify", _verify)
+        monkeypatch.setattr(Verfer, "verify", verify)
+        Parser(version=Vrsn_1_0).parse(ims=stream(2), kvy=kvy)  # same bytes
+        assert verifies == []  # no SAID or signature reverified
+
+        Parser(version=Vrsn_1_0).parse(ims=stream(3), kvy=kvy)  # one more sig
+        assert verifies == [icp.raw, ixn.raw]  # only the new sig of each
+        assert len(db.sigs.get(keys=dgKey(icp.preb, ixn.saidb))) == 3
+
+        # evicted from LRU so found from db instead
+        kvy.dups.clear()
+        verifies.clear()
+        assert kvy.accepted(ixn)
+        assert (icp.pre, ixn.said) in kvy.dups
+        assert not kvy.accepted(interact(pre=icp.pre, dig=icp.said, sn=1,
+                                         data=[dict(d=icp.said)]))
+
+        kvy.DupCap = 1
+        kvy.remember(icp)
+        assert list(kvy.dups) == [(icp.pre, icp.said)]
+
+
 def test_reload_kever(mockHelpingNowUTC):
     """
     Test reload Kever from keystate state message
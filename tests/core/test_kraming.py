@@ -18,11 +18,13 @@ from keri.core import (Kramer, SerderKERI, Kevery, Pruner, Salter,
                        Parser, Seqner, Saider, Prefixer, Diger,
                        Dater, Noncer, Number, Verser, Labeler, Texter,
                        AuthTypes, exchange, exchept, reply, query)
+from keri.core.kraming import msgExpiry, txnExpiry
 
 from keri.app import openHby, openCF
 from keri.db import openDB
+from keri.db.migrations import add_kram_expiry_index
 from keri.peer import Exchanger
-from keri.recording import TxnMsgCacheRecord
+from keri.recording import MsgCacheRecord, TxnMsgCacheRecord
 from keri.help import helping
 
 
@@ -4797,3 +4799,77 @@ def test_pruning_exchanges(fakeHelpingClock):
 
             # Second Cache is also pruned because it belongs to the same exchange
             assert receiverHby.db.kramTMSC.get(keys=(senderHab.pre, xip.said, exn2.said)) is None
+
+
+def test_pruning_expiry_index():
+    """Test pruning reads only the expired prefix of the expiry indexes"""
+    with (openHby(name="expiry", base="test") as hby,
+          openCF(name="kram", base="test") as cf):
+        cf.put(KRAM_INTEGRATION_CONFIG)
+        kramer = Kramer(db=hby.db, cf=cf)
+        db = hby.db
+
+        start = int(helping.fromIso8601("2021-01-01T00:00:00.000000+00:00").timestamp() * 1000)
+        early = MsgCacheRecord(mdt="2021-01-01T00:00:00.000000+00:00",
+                               d=1000, ml=5000, pml=5000, mdtms=start)
+        late = MsgCacheRecord(mdt="2021-01-01T00:00:01.000000+00:00",
+                              d=1000, ml=5000, pml=5000)  # no mdtms as if legacy
+        assert msgExpiry(early) == start + 6000
+        assert msgExpiry(late) == start + 7000
+
+        kramer._pinMsgCache(("Eaid", "Eearly"), early)
+        kramer._pinMsgCache(("Eaid", "Elate"), late)
+        assert [keys for keys, _ in db.kramMEXP.getTopItemIter()] == [
+            (f"{start + 6000:032x}", "Eaid", "Eearly"),
+            (f"{start + 7000:032x}", "Eaid", "Elate")]
+        assert db.kramMEXP.get(keys=(f"{start + 6000:032x}", "Eaid", "Eearly")) == "Eaid.Eearly"
+
+        assert not kramer._pruneMessages(rdt_ms=start + 6000)  # not yet expired
+        assert kramer._pruneMessages(rdt_ms=start + 6001)
+        assert db.kramMSGC.get(keys=("Eaid", "Eearly")) is None
+        assert db.kramMSGC.get(keys=("Eaid", "Elate")) == late
+        assert len([keys for keys, _ in db.kramMEXP.getTopItemIter()]) == 1
+
+        # re-pinned with a later expiry so the stale index entry is only dropped
+        later = MsgCacheRecord(mdt="2021-01-01T00:00:09.000000+00:00",
+                               d=1000, ml=5000, pml=5000, mdtms=start + 9000)
+        kramer._pinMsgCache(("Eaid", "Elate"), later)
+        assert not kramer._pruneMessages(rdt_ms=start + 7001)
+        assert db.kramMSGC.get(keys=("Eaid", "Elate")) == later
+        assert kramer._pruneMessages(rdt_ms=start + 16000)
+        assert next(db.kramMEXP.getTopItemIter(), None) is None
+
+        txn = TxnMsgCacheRecord(mdt="2021-01-01T00:00:00.000000+00:00",
+                                xdt="2021-01-01T00:00:00.000000+00:00",
+                                d=1000, pxl=300000, mdtms=start, xdtms=start)
+        kramer._pinTxnCache(("Eaid", "Exid", "Emid"), txn)
+        assert txnExpiry(txn) == start + 300000
+        assert not kramer._pruneExchanges(rdt_ms=start + 300000)
+        assert kramer._pruneExchanges(rdt_ms=start + 300001)
+        assert db.kramTMSC.get(keys=("Eaid", "Exid", "Emid")) is None
+        assert next(db.kramTEXP.getTopItemIter(), None) is None
+
+        # migration indexes entries cached before the indexes existed
+        db.kramMSGC.pin(("Eaid", "Eold"), early)
+        db.kramTMSC.pin(("Eaid", "Exid", "Eold"), txn)
+        add_kram_expiry_index.migrate(db)
+        assert db.kramMEXP.get(keys=(f"{start + 6000:032x}", "Eaid", "Eold")) == "Eaid.Eold"
+        assert db.kramTEXP.get(keys=(f"{start + 300000:032x}", "Eaid", "Exid", "Eold")) == "Eaid.Exid.Eold"
+        assert kramer._pruneMessages(rdt_ms=start + 6001)
+        assert kramer._pruneExchanges(rdt_ms=start + 300001)
+        assert db.kramMSGC.get(keys=("Eaid", "Eold")) is None
+        assert db.kramTMSC.get(keys=("Eaid", "Exid", "Eold")) is None
+
+        # pruner backfills unindexed entries once before pruning
+        db.kramMSGC.pin(("Eaid", "Eold"), early)
+        db.kramTMSC.pin(("Eaid", "Exid", "Eold"), txn)
+        assert next(db.kramMEXP.getTopItemIter(), None) is None
+        doist = doing.Doist(tock=1, limit=1.0)
+        deeds = doist.enter(doers=[Pruner(kramer, tock=1)])
+        doist.recur(deeds=deeds)
+        assert db.kramMSGC.get(keys=("Eaid", "Eold")) is None
+        assert db.kramTMSC.get(keys=("Eaid", "Exid", "Eold")) is None
+        assert next(db.kramMEXP.getTopItemIter(), None) is None
+        assert kramer._indexExpiries() == 0
+
+    """Done Test"""
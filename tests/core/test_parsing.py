@@ -3,6 +3,7 @@
 tests.core.test_eventing module
 
 """
+import io
 import os
 
 import pytest
@@ -14,9 +15,11 @@ from keri.kering import ValidationError, Vrsn_1_0, Vrsn_2_0, Kinds
 
 from keri.core import (Counter, Diger, GenDex, Codens, Seqner, Dater, Texter, Pather,
                        Blinder, Mediar, TypeMedia, Sealer, SealKind, Verser,
-                       Salter, Parser, Kever, Kevery, incept, rotate, interact)
+                       Salter, Parser, Kever, Kevery, Verfer, incept, rotate,
+                       interact, receipt)
 
-from keri.db import openDB
+from keri.core.parsing import Cursor
+from keri.db import openDB, dgKey
 
 
 logger = ogler.getLogger()
@@ -4830,6 +4833,235 @@ def test_parse_native_cesr_fixed_field():
     """ Done Test """
 
 
+def test_parser_cursor():
+    """Test Parser in cursor mode consumes stream by offset with same results"""
+    logger.setLevel("ERROR")
+
+    # Cursor behaves like strippable bytearray
+    ims = Cursor(buf=bytearray(b'abcdefgh'))
+    assert len(ims) == 8
+    assert ims[0] == ord(b'a')
+    assert ims[-1] == ord(b'h')
+    assert ims[:3] == bytearray(b'abc')
+    assert isinstance(ims[:3], bytearray)
+    del ims[:3]
+    assert ims.offset == 3
+    assert len(ims) == 5
+    assert ims[0] == ord(b'd')
+    assert bytes(ims.view) == b'defgh'
+    assert ims.buf == bytearray(b'abcdefgh')  # not mutated until compacted
+    ims.extend(b'ij')
+    assert ims[:] == bytearray(b'defghij')
+    ims.compact()
+    assert ims.offset == 0
+    assert ims.buf == bytearray(b'defghij')
+    del ims[:]
+    assert not ims
+    ims.compact()
+    assert ims.buf == bytearray()
+    with pytest.raises(ValueError):
+        del ims[1:2]
+
+    ims = Cursor(buf=b'abc')  # immutable buffer not compacted
+    del ims[:1]
+    ims.compact()
+    assert ims.offset == 1
+    assert ims[:] == bytearray(b'bc')
+
+    signers = Salter(raw=b"ABCDEFGH01234567").signers(count=4, path='psr', temp=True)
+
+    # create key event stream with v1 attachments
+    msgs = bytearray()
+    serder = incept(keys=[signers[0].verfer.qb64],
+                    ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64])
+    pre = serder.pre
+    msgs.extend(serder.raw)
+    msgs.extend(Counter(Codens.ControllerIdxSigs, count=1,
+                        version=Vrsn_1_0).qb64b)
+    msgs.extend(signers[0].sign(serder.raw, index=0).qb64b)
+
+    serder = rotate(pre=pre, keys=[signers[1].verfer.qb64], dig=serder.said,
+                    ndigs=[Diger(ser=signers[2].verfer.qb64b).qb64], sn=1)
+    msgs.extend(serder.raw)
+    msgs.extend(Counter(Codens.ControllerIdxSigs, count=1,
+                        version=Vrsn_1_0).qb64b)
+    msgs.extend(signers[1].sign(serder.raw, index=0).qb64b)
+
+    for sn in range(2, 5):
+        serder = interact(pre=pre, dig=serder.said, sn=sn)
+        msgs.extend(serder.raw)
+        msgs.extend(Counter(Codens.ControllerIdxSigs, count=1,
+                            version=Vrsn_1_0).qb64b)
+        msgs.extend(signers[1].sign(serder.raw, index=0).qb64b)
+
+    stream = bytes(msgs)
+
+    with openDB(name="strip") as stripDB, openDB(name="cursor") as cursorDB:
+        kvy = Kevery(db=stripDB)
+        parser = Parser(kvy=kvy, version=Vrsn_1_0)
+        assert not parser.cursor
+        parser.parse(ims=bytearray(stream))
+        assert kvy.kevers[pre].sn == 4
+
+        kvy = Kevery(db=cursorDB)
+        parser = Parser(kvy=kvy, version=Vrsn_1_0, cursor=True)
+        assert parser.cursor
+        parser.parse(ims=stream)  # bytes consumed in place without copy
+        assert kvy.kevers[pre].sn == 4
+        assert kvy.kevers[pre].serder.said == serder.said
+
+    # live .ims bytearray fed in pieces is compacted at frame boundaries
+    with openDB(name="live") as liveDB:
+        kvy = Kevery(db=liveDB)
+        parser = Parser(kvy=kvy, framed=False, version=Vrsn_1_0, cursor=True)
+        parsator = parser.parsator()
+        half = len(stream) // 2
+        parser.ims.extend(stream[:half])
+        next(parsator)
+        assert kvy.kevers[pre].sn >= 1  # some events processed
+        assert len(parser.ims) < half  # consumed frames compacted off front
+        parser.ims.extend(stream[half:])
+        for i in range(4):
+            next(parsator)
+        assert kvy.kevers[pre].sn == 4
+        assert parser.ims == bytearray()
+
+    """ Done Test """
+
+
+def test_parser_batch():
+    """Test Parser batch mode verifies batch together with same results"""
+    logger.setLevel("ERROR")
+
+    signers = Salter(raw=b"ABCDEFGH01234567").signers(count=4, path='psr', temp=True)
+    wsigner = Salter(raw=b"ABCDEFGH01234568").signers(count=1, path='wit',
+                                                         transferable=False,
+                                                         temp=True)[0]
+
+    # create key event stream with v1 attachments plus witness receipts
+    msgs = bytearray()
+    serder = incept(keys=[signers[0].verfer.qb64],
+                    ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64])
+    pre = serder.pre
+    msgs.extend(serder.raw)
+    msgs.extend(Counter(Codens.ControllerIdxSigs, count=1,
+                        version=Vrsn_1_0).qb64b)
+    msgs.extend(signers[0].sign(serder.raw, index=0).qb64b)
+
+    serder = rotate(pre=pre, keys=[signers[1].verfer.qb64], dig=serder.said,
+                    ndigs=[Diger(ser=signers[2].verfer.qb64b).qb64], sn=1)
+    msgs.extend(serder.raw)
+    msgs.extend(Counter(Codens.ControllerIdxSigs, count=1,
+                        version=Vrsn_1_0).qb64b)
+    msgs.extend(signers[1].sign(serder.raw, index=0).qb64b)
+
+    for sn in range(2, 5):
+        serder = interact(pre=pre, dig=serder.said, sn=sn)
+        msgs.extend(serder.raw)
+        msgs.extend(Counter(Codens.ControllerIdxSigs, count=1,
+                            version=Vrsn_1_0).qb64b)
+        if sn == 3:  # bad signature by stale key
+            msgs.extend(signers[0].sign(serder.raw, index=0).qb64b)
+        else:
+            msgs.extend(signers[1].sign(serder.raw, index=0).qb64b)
+
+        # nontrans receipt of event in same batch
+        rserder = receipt(pre=pre, sn=sn, said=serder.said)
+        msgs.extend(rserder.raw)
+        msgs.extend(Counter(Codens.NonTransReceiptCouples, count=1,
+                            version=Vrsn_1_0).qb64b)
+        msgs.extend(wsigner.verfer.qb64b)
+        msgs.extend(wsigner.sign(serder.raw).qb64b)
+
+    stream = bytes(msgs)
+
+    with openDB(name="single") as singleDB, openDB(name="batch") as batchDB:
+        kvy = Kevery(db=singleDB)
+        parser = Parser(kvy=kvy, version=Vrsn_1_0)
+        assert not parser.batch
+        parser.parse(ims=bytearray(stream))
+        assert kvy.kevers[pre].sn == 2  # sn 3 bad sig so 4 out of order
+        said = kvy.kevers[pre].serder.said
+        rcts = [[(prefixer.qb64, cigar.qb64) for prefixer, cigar in
+                 singleDB.rcts.get(keys=dgKey(pre, singleDB.kels.getLast(keys=pre, on=sn)))]
+                for sn in range(0, 3)]
+        assert rcts[2]  # receipt of sn 2 stored
+
+        kvy = Kevery(db=batchDB)
+        parser = Parser(kvy=kvy, version=Vrsn_1_0, batch=4, workers=2)
+        assert parser.batch == 4
+        parser.parse(ims=bytearray(stream))
+        assert not parser.pending
+        assert Verfer.Verifieds is None  # restored after batch
+        assert kvy.kevers[pre].sn == 2
+        assert kvy.kevers[pre].serder.said == said
+        assert [[(prefixer.qb64, cigar.qb64) for prefixer, cigar in
+                 batchDB.rcts.get(keys=dgKey(pre, batchDB.kels.getLast(keys=pre, on=sn)))]
+                for sn in range(0, 3)] == rcts
+
+    # live stream partial batch dispatched when drained
+    with openDB(name="live") as liveDB:
+        kvy = Kevery(db=liveDB)
+        parser = Parser(kvy=kvy, framed=False, version=Vrsn_1_0, batch=100)
+        parsator = parser.parsator()
+        parser.ims.extend(stream)
+        next(parsator)
+        assert not parser.pending
+        assert kvy.kevers[pre].sn == 2
+
+    """ Done Test """
+
+
+def test_parser_file():
+    """Test streaming export to file and socket and chunked import from file"""
+    logger.setLevel("ERROR")
+
+    signers = Salter(raw=b"ABCDEFGH01234567").signers(count=2, path='psr', temp=True)
+
+    msgs = bytearray()
+    serder = incept(keys=[signers[0].verfer.qb64],
+                    ndigs=[Diger(ser=signers[1].verfer.qb64b).qb64])
+    pre = serder.pre
+    for sn in range(0, 40):
+        if sn:
+            serder = interact(pre=pre, dig=serder.said, sn=sn, data=[dict(d=pre * 4)])
+        msgs.extend(serder.raw)
+        msgs.extend(Counter(Codens.ControllerIdxSigs, count=1,
+                            version=Vrsn_1_0).qb64b)
+        msgs.extend(signers[0].sign(serder.raw, index=0).qb64b)
+
+    class Sock:  # stand in for socket
+        def __init__(self):
+            self.sent = bytearray()
+
+        def sendall(self, data):
+            self.sent.extend(data)
+
+    with openDB(name="src") as srcDB:
+        kvy = Kevery(db=srcDB)
+        Parser(kvy=kvy, version=Vrsn_1_0).parse(ims=msgs)
+        assert kvy.kevers[pre].sn == 39
+
+        out = io.BytesIO()
+        size = srcDB.exportPre(pre=pre, out=out)
+        clone = out.getvalue()
+        assert size == len(clone) == sum(len(msg) for msg in srcDB.clonePreIter(pre=pre))
+        sock = Sock()
+        assert srcDB.exportAll(out=sock) == size
+        assert sock.sent == clone
+
+    for cursor in (False, True):
+        with openDB(name="dst") as dstDB:
+            kvy = Kevery(db=dstDB)
+            parser = Parser(kvy=kvy, version=Vrsn_1_0, cursor=cursor)
+            parser.parseFile(io.BytesIO(clone), size=2048)  # reads cut messages
+            assert kvy.kevers[pre].sn == 39
+            assert kvy.kevers[pre].serder.said == serder.said
+            assert len(list(dstDB.clonePreIter(pre=pre))) == 40
+
+    """ Done Test """
+
+
 if __name__ == "__main__":
     test_parser_v1_basic()
     test_parser_v1_version()
@@ -4843,3 +5075,6 @@ if __name__ == "__main__":
     test_parse_generic_group()
     test_group_parsator()
     test_parse_native_cesr_fixed_field()
+    test_parser_cursor()
+    test_parser_batch()
+    test_parser_file()
@@ -1483,6 +1483,50 @@ def test_serderkeri_icp():
     """End Test"""
 
 
+def test_serderkeri_memoize():
+    """Test SerderKERI memoized derived primitive properties"""
+    signers = Salter(raw=b'0123456789abcdef').signers(count=6, temp=True)
+    keys = [signer.verfer.qb64 for signer in signers[:3]]
+    ndigs = [Diger(ser=signer.verfer.qb64b).qb64 for signer in signers[3:]]
+    serder = incept(keys=keys, isith=["1/2", "1/2", "1/2"], ndigs=ndigs,
+                    nsith="2", code=MtrDex.Blake3_256)
+
+    assert serder._memo == {}
+    verfers = serder.verfers
+    assert [verfer.qb64 for verfer in verfers] == keys
+    assert serder.verfers is not verfers  # list copy so cache not altered
+    assert serder.verfers[0] is verfers[0]  # but Verfers converted only once
+    verfers.append(verfers[0])
+    assert len(serder.verfers) == 3
+    assert serder.tholder is serder.tholder
+    assert serder.tholder.weighted
+    assert serder.ntholder is serder.ntholder
+    assert serder.ntholder.thold == 2
+    assert [diger.qb64 for diger in serder.ndigers] == ndigs
+    assert serder.ndigers[0] is serder.ndigers[0]
+    assert serder.sner is serder.sner
+    assert serder.sn == 0
+    assert serder.bner is serder.bner
+    assert serder.berfers == []
+    assert set(serder._memo) == {"verfers", "tholder", "ntholder", "ndigers",
+                                 "sner", "bner", "berfers"}
+
+    # reinhaled serder starts with empty cache
+    serder = SerderKERI(raw=serder.raw)
+    assert serder._memo == {}
+    assert serder.ntholder.thold == 2
+
+    # memoize disabled
+    class SerderKERINoMemo(SerderKERI):
+        Memoize = False
+
+    serder = SerderKERINoMemo(raw=serder.raw)
+    assert serder._memo is None
+    assert serder.tholder is not serder.tholder
+    assert [verfer.qb64 for verfer in serder.verfers] == keys
+    assert serder.verfers[0] is not serder.verfers[0]
+
+
 def test_serderkeri_rot():
     """Test SerderKERI rot msg"""
 
@@ -4598,6 +4642,7 @@ if __name__ == "__main__":
     test_serder()
     test_serderkeri()
     test_serderkeri_icp()
+    test_serderkeri_memoize()
     test_serderkeri_rot()
     test_serderkeri_ixn()
     test_serderkeri_dip()
@@ -19,13 +19,13 @@ from keri.app import openHby
 from keri.core import (Seqner, Diger, Number, Kever, Serder,
                        Signer, Siger, Salter, Dater, Prefixer,
                        Cigar, Seqner, Saider, Noncer, Labeler,
-                       Texter, SerderKERI, StateEstEvent,
+                       Texter, SerderKERI, StateEstEvent, Kevery,
                        IdrDex, MtrDex, NumDex,
                        incept, rotate, interact, rotate)
 
 from keri.core import state as eventState
 from keri.db import (Baser, BaserDoer, Baser, SerderSuber,
-                     CesrIoSetSuber, CesrSuber, CatCesrIoSetSuber,
+                     CesrIoSetSuber, CesrSuber, Suber, CatCesrIoSetSuber,
                      OnIoDupSuber, IoDupSuber, CatCesrSuber, statedict,
                      openDB, dgKey, snKey, openLMDB, openDB, reopenDB)
 
@@ -1820,6 +1820,51 @@ def test_baser_clone_all_pre_iter():
         assert hab2.pre in pres
 
 
+def test_clone_obj_replay():
+    """
+    Test Baser replay of hydrated cloned objects with resume and workers
+    """
+    with openHby(name="rep", salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
+        habs = [hby.makeHab(name=f"rep{i}", isith='2', icount=3) for i in range(3)]
+        for hab in habs:
+            hab.interact()
+            hab.rotate()
+            hab.interact()
+        objs = list(hby.db.cloneObjAllPreIter())
+        assert len(objs) == len(list(hby.db.cloneAllPreIter()))
+        pres = [e['serder'].pre for e in objs]
+        assert pres == sorted(pres)  # prefix order
+        pres = sorted(set(pres))  # includes signator
+        exts = [e for e in objs if e['serder'].pre == habs[1].pre]
+        assert len(exts) == 4
+        assert len(exts[0]['sigers']) == 3
+        assert [fn.sn for (fn, dater), in (e['frcs'] for e in exts)] == [0, 1, 2, 3]
+        assert [e['serder'].said for e in hby.db.cloneObjPreIter(pre=habs[1].pre, fn=1)] == \
+               [e['serder'].said for e in exts[1:]]
+
+        hby.db.CleanChunk = 1  # checkpoint after every prefix
+        with openDB(name="copy", temp=True) as copy:
+            kvy = Kevery(db=copy)
+            checkpoints = []
+            # resume after first prefix as if interrupted
+            skips = len([e for e in objs if e['serder'].pre == pres[0]])
+            assert hby.db.cloneObjReplay(kvy=kvy, resume=pres[0],
+                                         checkpoint=checkpoints.append) == len(objs) - skips
+            assert checkpoints == pres[1:]
+            assert pres[0] not in copy.kevers
+            for pre in pres[1:]:
+                assert pre in copy.kevers
+
+        with openDB(name="copy", temp=True) as copy:
+            kvy = Kevery(db=copy)
+            assert hby.db.cloneObjReplay(kvy=kvy, workers=2) == len(objs)
+            for hab in habs:
+                assert copy.kevers[hab.pre].sn == 3
+                assert copy.kevers[hab.pre].serder.said == hab.kever.serder.said
+
+    """ End Test """
+
+
 def test_clean_baser():
     """
     Test Baser db clean clone method
@@ -1861,7 +1906,7 @@ def test_clean_baser():
         state = natHab.db.states.get(keys=natHab.pre)  # Serder instance
         assert state.s == '6'
         assert state.f == '6'
-        assert natHab.db.env.stat()['entries'] <= 101 #68
+        assert natHab.db.env.stat()['entries'] <= 112 #68
 
         # test reopenDB with reuse  (because temp)
         with reopenDB(db=natHab.db, reuse=True):
@@ -1871,7 +1916,7 @@ def test_clean_baser():
             assert ldig == natHab.kever.serder.saidb
             serder = natHab.db.evts.get(keys=(natHab.pre, ldig))
             assert serder.said == natHab.kever.serder.said
-            assert natHab.db.env.stat()['entries'] <= 101 #68
+            assert natHab.db.env.stat()['entries'] <= 112 #68
 
             # verify name pre kom in db
             data = natHab.db.habs.get(keys=natHab.pre)
@@ -1944,6 +1989,58 @@ def test_clean_baser():
     """End Test"""
 
 
+def test_clean_baser_resume(monkeypatch):
+    """
+    Test Baser db clean resumes interrupted replay after its checkpoint
+    """
+    with openHby(name="res", salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
+        habs = [hby.makeHab(name=f"res{i}", isith='2', icount=3) for i in range(3)]
+        for hab in habs:
+            hab.interact()
+            hab.rotate()
+        pres = sorted(set(e['serder'].pre for e in hby.db.cloneObjAllPreIter()))
+        assert len(pres) == 4  # includes signator
+        hby.db.CleanChunk = 1  # checkpoint after every prefix
+
+        replayChunk = Baser._replayChunk
+        chunks = []
+
+        def interrupt(self, *pa, **kwa):
+            chunks.append(pa[2])
+            if len(chunks) == 2:  # first chunk already committed
+                raise KeyboardInterrupt("interrupted")
+            return replayChunk(self, *pa, **kwa)
+
+        monkeypatch.setattr(Baser, "_replayChunk", interrupt)
+        with pytest.raises(KeyboardInterrupt):
+            hby.db.clean()
+        monkeypatch.undo()
+
+        cloneObjReplay = Baser.cloneObjReplay
+        resumes = []
+
+        def spy(self, kvy, **kwa):
+            resumes.append(kwa["resume"])
+            return cloneObjReplay(self, kvy, **kwa)
+
+        monkeypatch.setattr(Baser, "cloneObjReplay", spy)
+        hby.db.clean()
+        assert resumes == [pres[0]]  # resumed after checkpointed prefix
+
+        for hab in habs:
+            assert hab.pre in hby.db.kevers
+            assert hby.db.kevers[hab.pre].sn == 2
+            assert hby.db.kevers[hab.pre].serder.said == hab.kever.serder.said
+
+        with reopenDB(db=hby.db, reuse=True):
+            for pre in pres:  # includes first prefix replayed before interrupt
+                assert hby.db.states.get(keys=pre) is not None
+            # path of copy of interrupted clean gone with replaced orig
+            assert Suber(db=hby.db, subkey='clns.').get(keys=("path",)) is None
+
+    """ End Test """
+
+
 def test_fetchkeldel():
     """
     Test fetching full KEL and full DEL from Baser
@@ -2044,6 +2141,104 @@ def test_fetchkeldel():
 
 
 
+def test_seal_index():
+    """
+    Test anchored seal index lookups of sealing events
+    """
+    from keri import __version__
+    from keri.db.basing import BACKFILLS
+    from keri.db.migrations import add_seal_index
+
+    with openHby(name="test", temp=True, salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
+        hab = hby.makeHab(name="test")
+        db = hby.db
+        seal = dict(i=hab.pre, s="0", d=hab.kever.serder.said)  # SealEvent
+        digseal = dict(d=hab.kever.serder.said)  # SealDigest
+        assert db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal) is None
+
+        hab.interact(data=[seal])
+        ixn = hab.kever.serder
+        hab.interact(data=[digseal, seal])
+        ixn2 = hab.kever.serder
+        entries = db.seas.get(keys=(hab.pre, db.sealKey(seal)))
+        assert [(num.num, diger.qb64) for num, diger in entries] == [(1, ixn.said),
+                                                                    (2, ixn2.said)]
+
+        assert db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal).said == ixn.said
+        assert db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal).said == ixn.said
+        assert db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal, sn=2).said == ixn2.said
+        assert db.fetchLastSealingEventBySeal(pre=hab.pre, seal=digseal).said == ixn2.said
+        assert db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=digseal) is None  # wrong type
+        assert db.fetchLastSealingEventBySeal(pre=hab.pre, seal=dict(d=ixn.said)) is None
+        assert db.fetchAllSealingEventByEventSeal(pre=hab.pre, seal=seal, sn=3) is None
+
+        # migration populates index of existing KELs
+        db.seas.trim()
+        assert db.fetchLastSealingEventBySeal(pre=hab.pre, seal=digseal) is None
+        add_seal_index.migrate(db)
+        assert db.fetchLastSealingEventBySeal(pre=hab.pre, seal=digseal).said == ixn2.said
+        assert len(db.seas.get(keys=(hab.pre, db.sealKey(seal)))) == 2
+
+        # backfill of database already at current version with partial index
+        assert db.version == __version__
+        assert all(db.migs.get(keys=(mig,)) is not None for mig in BACKFILLS)
+        db.seas.trim()
+        db.indexSeals(ixn2)  # only indexed since upgrade
+        assert db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal).said == ixn2.said
+        db.backfill()  # already recorded so not run again
+        assert db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal).said == ixn2.said
+        db.migs.rem(keys=("add_seal_index",))
+        assert db.current
+        db.reload()
+        assert db.migs.get(keys=("add_seal_index",)) is not None
+        assert db.fetchLastSealingEventByEventSeal(pre=hab.pre, seal=seal).said == ixn.said
+
+
+def test_tail_index():
+    """
+    Test sn index and KEL tail index of last events
+    """
+    from keri.db.migrations import add_tail_index
+
+    with openHby(name="test", temp=True, salt=Salter(raw=b'0123456789abcdef').qb64) as hby:
+        hab = hby.makeHab(name="test")
+        db = hby.db
+        icp = hab.kever.serder
+        assert db.tail(hab.pre) == (0, 0, icp.said)
+        assert db.lastDig(pre=hab.pre, sn=0) == icp.said
+
+        hab.interact()
+        ixn = hab.kever.serder
+        hab.rotate()
+        rot = hab.kever.serder
+        assert db.tail(hab.pre) == (2, 2, rot.said)
+        assert db.tails.get(keys=hab.pre)[0].code == NumDex.Huge  # fixed width
+        for sn, serder in enumerate((icp, ixn, rot)):
+            assert db.lastDig(pre=hab.pre, sn=sn) == serder.said
+            assert db.lastDig(pre=hab.pre, sn=sn) == db.kels.getLast(keys=hab.pre, on=sn)
+        assert db.lastDig(pre=hab.pre, sn=3) is None
+        assert [serder.said for serder in db.getEvtLastPreIter(pre=hab.pre, sn=1)] == [ixn.said,
+                                                                                       rot.said]
+
+        # relogging a duplicate does not change the indexes
+        hab.kever.logEvent(serder=ixn)
+        assert db.tail(hab.pre) == (2, 2, rot.said)
+        assert db.lastDig(pre=hab.pre, sn=1) == ixn.said
+
+        # migration populates indexes of existing KELs
+        db.lels.trim()
+        db.tails.trim()
+        assert db.tail(hab.pre) is None
+        assert db.lastDig(pre=hab.pre, sn=2) == rot.said  # falls back to .kels
+        assert [serder.said for serder in db.getEvtLastPreIter(pre=hab.pre)] == [icp.said,
+                                                                                 ixn.said,
+                                                                                 rot.said]
+        assert [serder.said for serder in db.getEvtLastPreIter(pre=hab.pre, sn=2)] == [rot.said]
+        add_tail_index.migrate(db)
+        assert db.tail(hab.pre) == (2, 2, rot.said)
+        assert db.lels.get(keys=hab.pre, on=1) == ixn.said
+
+
 def test_usebaser():
     """
     Test using Baser
@@ -2324,6 +2519,45 @@ def test_statedict():
 
     assert not os.path.exists(db.path)
 
+    # bounded in memory LRU
+    dbd = statedict(cap=2)
+    dbd['a'] = 1
+    dbd['b'] = 2
+    assert dbd['a'] == 1  # a now most recently used
+    assert dbd.hits == 1
+    dbd['c'] = 3  # evicts b
+    assert list(dbd.keys()) == ['a', 'c']
+    assert dbd.evictions == 1
+    assert 'b' not in dbd
+    assert dbd.misses == 1
+
+    # bounded read through with pinned local prefixes
+    signers = Salter(raw=b'0123456789abcdef').signers(count=4, temp=True)
+    with openDB(name="cap", keverCap=2) as db:
+        assert db.kevers.cap == 2
+        kvy = Kevery(db=db)
+        pres = []
+        for signer in signers:
+            serder = incept(keys=[signer.verfer.qb64],
+                            ndigs=[Diger(ser=signer.verfer.qb64b).qb64])
+            kvy.processEvent(serder=serder, sigers=[signer.sign(serder.raw, index=0)])
+            pres.append(serder.pre)
+            if len(pres) == 1:
+                db.prefixes.add(serder.pre)  # pin first as local
+
+        assert len(db.kevers) == 2
+        assert db.kevers.evictions == 2
+        assert list(db.kevers.keys()) == [pres[0], pres[3]]  # local pinned
+        misses = db.kevers.misses
+        kever = db.kevers[pres[1]]  # reloaded from states
+        assert kever.prefixer.qb64 == pres[1]
+        assert db.kevers.misses == misses + 1
+        assert list(db.kevers.keys()) == [pres[0], pres[1]]
+        assert db.kevers.evictions == 3
+
+    with openDB(name="nocap") as db:
+        assert db.kevers.cap is None
+
 
 
 
@@ -2754,6 +2988,8 @@ if __name__ == "__main__":
     test_baser()
     test_clean_baser()
     test_fetchkeldel()
+    test_seal_index()
+    test_tail_index()
     test_usebaser()
     test_statedict()
     test_baserdoer()
@@ -2209,8 +2209,68 @@ def test_lmdber():
     """ End Test """
 
 
+def test_lmdber_txn():
+    """
+    Test LMDBer unit of work transaction shared by operations in its context
+    """
+    with openLMDB() as dber:
+        db = dber.env.open_db(key=b'beep.')
+        ddb = dber.env.open_db(key=b'boop.', dupsort=True)
+
+        with dber.txn() as txn:
+            assert dber._txn is txn
+            assert dber.putVal(db, b'a', b'1')
+            assert dber.putVal(db, b'b', b'2')
+            assert dber.putVals(ddb, b'a', [b'x', b'y'])
+            assert dber.getVal(db, b'a') == b'1'  # sees own uncommitted writes
+            assert dber.getVals(ddb, b'a') == [b'x', b'y']
+            assert [bytes(k) for k, v in dber.getTopItemIter(db)] == [b'a', b'b']
+            with dber.env.begin(db=db) as other:  # other txn does not see
+                assert other.get(b'a') is None
+            with dber.txn() as inner:  # nested joins outer
+                assert inner is txn
+                assert dber.remVal(db, b'b')
+            assert dber._txn is txn
+        assert dber._txn is None
+
+        assert dber.getVal(db, b'a') == b'1'  # committed
+        assert dber.getVal(db, b'b') is None
+        assert dber.getVals(ddb, b'a') == [b'x', b'y']
+
+        with pytest.raises(ValueError):
+            with dber.txn():
+                assert dber.setVal(db, b'a', b'3')
+                assert dber.putVal(db, b'c', b'4')
+                raise ValueError("abort")
+        assert dber._txn is None
+        assert dber.getVal(db, b'a') == b'1'  # aborted
+        assert dber.getVal(db, b'c') is None
+
+        with dber.txn(write=False):  # read only snapshot
+            assert dber.getVal(db, b'a') == b'1'
+            assert dber.cntAll(db) == 1
+            with dber.txn(write=False) as inner:  # nested read only joins
+                assert inner is dber._txn
+            with pytest.raises(ValueError):  # nested write in read only
+                with dber.txn():
+                    pass
+            with pytest.raises(ValueError):  # write op in read only
+                dber.putVal(db, b'c', b'4')
+            assert dber.getVal(db, b'a') == b'1'
+        assert dber._txn is None and not dber._write
+
+        with dber.txn():  # read only nested in write joins
+            with dber.txn(write=False) as inner:
+                assert inner is dber._txn
+                assert dber.putVal(db, b'c', b'4')
+        assert dber.getVal(db, b'c') == b'4'
+
+    """ End Test """
+
+
 if __name__ == "__main__":
     test_key_funcs()
     test_suffix()
     test_lmdber()
+    test_lmdber_txn()
     test_opendatabaser()
@@ -25,8 +25,48 @@ def test_broker():
         assert isinstance(bork.tigerdb, CesrIoSetSuber)
         assert isinstance(bork.cigardb, CatCesrIoSetSuber)
         assert isinstance(bork.escrowdb, CesrIoSetSuber)
+        assert isinstance(bork.expirydb, CesrIoSetSuber)
 
 
+def test_broker_prune():
+    with openLMDB() as db:
+        bork = Broker(db=db, subkey="test", timeout=0)
+        typ = "test"
+        aid = "EBWY7LU2xwp0d4IhCvz1etbuv2iwcgBEigKJWnd-0Whs"
+
+        digers = []
+        for i, dts in enumerate(("2021-01-01T00:00:01.000000+00:00",
+                                 "2021-01-01T00:00:00.000000+00:00")):
+            serder = reply(route="/ksn/" + aid, data=dict(i=aid, s=f"{i:x}"),
+                           stamp=dts)
+            diger = Diger(qb64=serder.said)
+            digers.append(diger)
+            bork.escrowStateNotice(typ=typ, pre=diger.qb64, aid=aid,
+                                   serder=serder, diger=diger,
+                                   dater=Dater(dts=dts))
+
+        items = list(bork.expirydb.getTopItemIter(keys=(typ, "")))
+        assert [d.qb64 for _, d in items] == [digers[1].qb64, digers[0].qb64]
+
+        # first is already processed so only its index entry remains
+        bork.escrowdb.rem(keys=(typ, digers[0].qb64, aid), val=digers[0])
+        assert bork.pruneEscrowState(typ) == 1
+        assert bork.escrowdb.cntAll() == 0
+        assert bork.expirydb.cntAll() == 0
+        assert bork.serderdb.get(keys=(digers[0].qb64,)) is not None
+        assert bork.serderdb.get(keys=(digers[1].qb64,)) is None
+
+        # escrowed before the index existed so indexed on prune
+        serder = reply(route="/ksn/" + aid, data=dict(i=aid, s="2"),
+                       stamp="2021-01-01T00:00:02.000000+00:00")
+        diger = Diger(qb64=serder.said)
+        bork.escrowStateNotice(typ=typ, pre=diger.qb64, aid=aid, serder=serder,
+                               diger=diger, dater=Dater(dts=serder.stamp))
+        bork.expirydb.trim()
+        assert bork.pruneEscrowState(typ) == 1
+        assert bork.escrowdb.cntAll() == 0
+        assert bork.serderdb.get(keys=(diger.qb64,)) is None
+
 
 def test_broker_nontrans():
     raw = b'\x05\xaa\x8f-S\x9a\xe9\xfaU\x9c\x02\x9c\x9b\x08Hu'
@@ -13,12 +13,17 @@ import pytest
 try:
     from keri.db.webdbing import (
         WebDBer,
+        _DELTA_KEY,
         _META_KEY,
         _META_STORE,
         _RECORDS_KEY,
+        _SEGMENTS_KEY,
         _VERSION_KEY,
+        _deltaKey,
+        _deserialize_delta,
         _deserialize_meta,
         _deserialize_records,
+        _serialize_delta,
         _serialize_meta,
         _serialize_records,
         onKey,
@@ -28,12 +33,17 @@ try:
 except ImportError:
     from webdbing import (  # standalone import for Pyodide
         WebDBer,
+        _DELTA_KEY,
         _META_KEY,
         _META_STORE,
         _RECORDS_KEY,
+        _SEGMENTS_KEY,
         _VERSION_KEY,
+        _deltaKey,
+        _deserialize_delta,
         _deserialize_meta,
         _deserialize_records,
+        _serialize_delta,
         _serialize_meta,
         _serialize_records,
         onKey,
@@ -67,6 +77,9 @@ class FakeStorageHandle:
     def __setitem__(self, key, value):
         self._local[key] = value
 
+    def __delitem__(self, key):
+        del self._local[key]
+
     async def sync(self):
         self.backend.persisted[self.namespace] = dict(self._local)
 
@@ -82,7 +95,7 @@ class FakeStorageBackend:
 
 
 async def _open_fake_dber(*, name="test-webdber", stores=None,
-                          clear=False, backend=None):
+                          clear=False, backend=None, codec="hex"):
     if backend is None:
         backend = FakeStorageBackend()
     dber = await WebDBer.open(
@@ -90,6 +103,7 @@ async def _open_fake_dber(*, name="test-webdber", stores=None,
         stores=stores or ["bags.", "docs.", "beep.", "pugs."],
         clear=clear,
         storageOpener=backend.open,
+        codec=codec,
     )
     return dber, backend
 
@@ -482,6 +496,153 @@ def test_flush_dirty_counting():
     asyncio.run(_go())
 
 
+def test_flush_delta_segments():
+    """Test flush appends changed keys as delta segments and compacts."""
+    async def _go():
+        backend = FakeStorageBackend()
+        dber, _ = await _open_fake_dber(name="delta", stores=["docs."],
+                                        clear=True, backend=backend)
+        assert dber.maxSegments == 16
+        dber.maxSegments = 3
+        docs = dber.env.open_db("docs.")
+        for i in range(8):
+            assert dber.setVal(docs, b"doc.%d" % i, b"v%d" % i) is True
+        assert await dber.flush() == 1  # most of store changed so full write
+        persisted = backend.persisted["delta:docs."]
+        assert len(_deserialize_records(persisted[_RECORDS_KEY])) == 8
+        assert persisted[_SEGMENTS_KEY] == "0"
+        assert docs.segments == 0
+        assert not docs.items.changed
+
+        assert dber.setVal(docs, b"doc.1", b"w1") is True
+        assert dber.remVal(docs, b"doc.2") is True
+        assert await dber.flush() == 1
+        persisted = backend.persisted["delta:docs."]
+        assert len(_deserialize_records(persisted[_RECORDS_KEY])) == 8
+        assert persisted[_SEGMENTS_KEY] == "1"
+        assert _deserialize_delta(persisted[_deltaKey(0)]) == {
+            b"doc.1": b"w1", b"doc.2": None}
+
+        assert dber.setVal(docs, b"doc.9", b"v9") is True
+        assert await dber.flush() == 1
+        assert backend.persisted["delta:docs."][_SEGMENTS_KEY] == "2"
+
+        reopened, _ = await _open_fake_dber(name="delta", stores=["docs."],
+                                            backend=backend)
+        rdocs = reopened.env.open_db("docs.")
+        assert rdocs.segments == 2
+        assert not rdocs.items.changed
+        assert list(reopened.getTopItemIter(rdocs)) == list(dber.getTopItemIter(docs))
+        assert reopened.getVal(rdocs, b"doc.2") is None
+        assert reopened.getVal(rdocs, b"doc.1") == b"w1"
+
+        assert dber.setVal(docs, b"doc.3", b"w3") is True
+        assert await dber.flush() == 1
+        assert docs.segments == 3
+        assert dber.setVal(docs, b"doc.4", b"w4") is True
+        assert await dber.flush() == 1  # maxSegments reached so compacted
+        assert docs.segments == 0
+        persisted = backend.persisted["delta:docs."]
+        assert persisted[_SEGMENTS_KEY] == "0"
+        assert not [key for key in persisted if key.startswith(_DELTA_KEY)]
+        assert _deserialize_records(persisted[_RECORDS_KEY]) == dict(docs.items)
+
+        assert dber.setVal(docs, b"doc.5", b"w5") is True
+        assert await dber.flush(compact=True) == 1
+        assert docs.segments == 0
+
+        assert dber.remTop(docs) is True  # clear forces full write
+        assert docs.items.cleared
+        assert await dber.flush() == 1
+        assert _deserialize_records(
+            backend.persisted["delta:docs."][_RECORDS_KEY]) == {}
+
+        reopened, _ = await _open_fake_dber(name="delta", stores=["docs."],
+                                            backend=backend)
+        assert reopened.cntAll(reopened.env.open_db("docs.")) == 0
+
+        # clear on open drops persisted delta segments too
+        assert dber.setVal(docs, b"doc.6", b"v6") is True
+        assert dber.setVal(docs, b"doc.7", b"v7") is True
+        assert await dber.flush() == 1
+        assert dber.setVal(docs, b"doc.8", b"v8") is True
+        assert await dber.flush() == 1
+        assert backend.persisted["delta:docs."][_SEGMENTS_KEY] == "1"
+        assert _deltaKey(0) in backend.persisted["delta:docs."]
+        await _open_fake_dber(name="delta", stores=["docs."], clear=True,
+                              backend=backend)
+        persisted = backend.persisted["delta:docs."]
+        assert persisted[_SEGMENTS_KEY] == "0"
+        assert not [key for key in persisted if key.startswith(_DELTA_KEY)]
+
+    asyncio.run(_go())
+
+
+def test_codec_migration():
+    """Test compact codecs round trip and migrate stores from hex."""
+    records = {b"alpha": b"one", b"beta": b"", b"\x00\xff": bytes(range(256))}
+    for codec in ("hex", "b64", "bin"):
+        raw = _serialize_records(records, codec)
+        assert _deserialize_records(raw, codec) == records
+        delta = _serialize_delta(records, [b"alpha", b"gone"], codec)
+        assert _deserialize_delta(delta, codec) == {b"alpha": b"one", b"gone": None}
+    assert isinstance(_serialize_records(records, "bin"), bytes)
+    assert len(_serialize_records(records, "bin")) < len(_serialize_records(records, "b64"))
+    assert len(_serialize_records(records, "b64")) < len(_serialize_records(records))
+
+    async def _go():
+        backend = FakeStorageBackend()
+        dber, _ = await _open_fake_dber(name="codec", stores=["docs."],
+                                        clear=True, backend=backend)
+        docs = dber.env.open_db("docs.", dupsort=True)
+        for key, val in records.items():
+            assert dber.setVal(docs, key, val) is True
+        assert await dber.flush() == 1
+        assert _deserialize_meta(
+            backend.persisted["codec:docs."][_META_KEY]) == {"dupsort": True}
+
+        with pytest.raises(ValueError, match="Unsupported WebDBer codec"):
+            await _open_fake_dber(name="codec", stores=["docs."], backend=backend,
+                                  codec="zip")
+
+        # reopen legacy hex store with bin so flush migrates it
+        binned, _ = await _open_fake_dber(name="codec", stores=["docs."],
+                                          backend=backend, codec="bin")
+        bdocs = binned.env.open_db("docs.")
+        assert bdocs.codec == "hex"
+        assert bdocs.dirty is True
+        assert list(binned.getTopItemIter(bdocs)) == sorted(records.items())
+        assert await binned.flush() == 2  # __meta__ store migrates too
+        assert bdocs.codec == "bin"
+        persisted = backend.persisted["codec:docs."]
+        assert _deserialize_meta(persisted[_META_KEY]) == {
+            "dupsort": True, "codec": "bin", "codecVersion": 1}
+        assert isinstance(persisted[_RECORDS_KEY], bytes)
+
+        assert binned.setVal(bdocs, b"gamma", b"three") is True
+        assert await binned.flush() == 1
+        assert bdocs.segments == 1
+        assert await binned.flush() == 0
+
+        # a bin store loads with its marker even when reopened as hex
+        hexed, _ = await _open_fake_dber(name="codec", stores=["docs."],
+                                         backend=backend)
+        hdocs = hexed.env.open_db("docs.")
+        assert hdocs.codec == "bin"
+        assert hexed.getVal(hdocs, b"gamma") == b"three"
+        assert hexed.getVal(hdocs, b"\x00\xff") == bytes(range(256))
+        assert await hexed.flush() == 2
+        assert _deserialize_meta(
+            backend.persisted["codec:docs."][_META_KEY]) == {"dupsort": True}
+
+        backend.persisted["codec:docs."][_META_KEY] = _serialize_meta(
+            {"dupsort": True, "codec": "bin", "codecVersion": 2})
+        with pytest.raises(ValueError, match="Unsupported persisted codec"):
+            await _open_fake_dber(name="codec", stores=["docs."], backend=backend)
+
+    asyncio.run(_go())
+
+
 
 def test_close():
     """Test WebDBer.close() behavior with and without clear=True."""
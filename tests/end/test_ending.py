@@ -22,7 +22,7 @@ from keri.end import (Signage, Mimes, KeriMimes,
                       signature, designature,
                       desiginput, normalize, setup)
 from keri.end.ending import (siginput as sigInputEnding,
-                             loadEnds)
+                             loadEnds, OOBIEnd)
 
 logger = ogler.getLogger()
 
@@ -495,6 +495,66 @@ def test_get_oobi():
     """Done Test"""
 
 
+def test_oobi_etag():
+    """
+    Test OOBI response cache and entity tags
+    """
+    with openHab(name="etag", base="test", temp=True, salt=b'0123456789abcdef') as (hby, hab):
+        msgs = bytearray()
+        msgs.extend(hab.makeEndRole(eid=hab.pre, role=Roles.controller,
+                                    stamp=helping.nowIso8601()))
+        msgs.extend(hab.makeLocScheme(url='http://127.0.0.1:5555', scheme=Schemes.http,
+                                      stamp=helping.nowIso8601()))
+        hab.psr.parse(ims=msgs)
+
+        app = falcon.App()
+        end = OOBIEnd(hby=hby)
+        app.add_route("/oobi/{aid}/{role}", end)
+        client = testing.TestClient(app=app)
+        path = f"/oobi/{hab.pre}/controller"
+
+        rep = client.simulate_get(path)
+        assert rep.status == falcon.HTTP_OK
+        etag = rep.headers["ETag"]
+        assert etag == f'"{end.etag(hab=hab, kever=hab.kever, role="controller")}"'
+        assert list(end.cache) == [(hab.pre, "controller", None)]
+        body = rep.content
+
+        # unchanged so served from cache with same tag
+        rep = client.simulate_get(path)
+        assert rep.status == falcon.HTTP_OK
+        assert rep.headers["ETag"] == etag
+        assert rep.content == body
+
+        rep = client.simulate_get(path, headers={"If-None-Match": f'"other", W/{etag}'})
+        assert rep.status == falcon.HTTP_NOT_MODIFIED
+        assert rep.headers["ETag"] == etag
+        assert rep.content == b""
+
+        # new loc reply changes tag and response
+        hab.psr.parse(ims=hab.makeLocScheme(url='http://127.0.0.1:6666', scheme=Schemes.http,
+                                            stamp=helping.nowIso8601()))
+        rep = client.simulate_get(path, headers={"If-None-Match": etag})
+        assert rep.status == falcon.HTTP_OK
+        assert rep.headers["ETag"] != etag
+        assert b"6666" in rep.content
+        etag = rep.headers["ETag"]
+
+        # new key event changes tag
+        hab.rotate()
+        rep = client.simulate_get(path, headers={"If-None-Match": etag})
+        assert rep.status == falcon.HTTP_OK
+        assert rep.headers["ETag"] != etag
+        assert len(end.cache) == 1
+
+        rep = client.simulate_get(f"/oobi/{hab.pre}/witness")  # cached separately
+        assert rep.status == falcon.HTTP_OK
+        assert list(end.cache) == [(hab.pre, "controller", None),
+                                   (hab.pre, "witness", None)]
+
+    """Done Test"""
+
+
 def test_siginput(mockHelpingNowUTC):
     print()
     with openHab(name="test", base="test", temp=True, salt=b'0123456789abcdef') as (hby, hab):
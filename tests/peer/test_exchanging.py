@@ -6,15 +6,17 @@ tests.peer.test_exchanging module
 import json
 
 import pysodium
+import pytest
 
 from keri import Vrsn_1_0
-from keri.core import (Salter, Counter, Texter,
+from keri.kering import ValidationError
+from keri.core import (Salter, Counter, Texter, Dater,
                        Diger, SerderKERI, Parser,
                        MtrDex, Codens, MtrDex)
 
 from keri.app import openHab, openHby
 
-from keri.peer import Exchanger, nesting, exchange
+from keri.peer import Exchanger, nesting, exchange, exchanging
 from keri.vdr import incept
 
 
@@ -101,6 +103,57 @@ def test_essrs():
         assert recHby.db.exns.get(keys=(essr.said,)) is None
 
 
+def test_exchange_verified_stamp(monkeypatch):
+    with openHab(name="sid", base="test", salt=b'0123456789abcdef') as (hby, hab), \
+            openHab(name="rec", base="test", salt=b'0123456789abcdef') as (recHby, recHab):
+
+        Parser(version=Vrsn_1_0).parse(ims=hab.makeOwnInception(), kvy=recHby.kvy)
+        ims = hab.exchange(route="/echo", payload=dict(m="hello"), recipient=recHab.pre)
+        serder = SerderKERI(raw=bytes(ims))
+
+        exc = Exchanger(hby=recHby, handlers=[])
+        Parser(version=Vrsn_1_0).parse(ims=bytearray(ims), kvy=recHby.kvy, exc=exc)
+        assert recHby.db.exns.get(keys=(serder.said,)) is not None
+
+        # signature group stamped as verified at ingest against signer est event
+        keys = (serder.said, hab.pre, f"{0:032x}", hab.pre)
+        assert recHby.db.exvs.get(keys=keys) is not None
+
+        verifieds = []
+        verifySigs = exchanging.verifySigs
+        def counted(raw, sigers, verfers):
+            verifieds.append(raw)
+            return verifySigs(raw, sigers, verfers)
+        monkeypatch.setattr(exchanging, "verifySigs", counted)
+
+        # serving stored message trusts stamp so does not verify again
+        msg = exchanging.serializeMessage(recHby, serder.said)
+        assert msg == ims
+        exn, _ = exchanging.cloneMessage(recHby, serder.said)
+        assert exn.said == serder.said
+        assert verifieds == []
+
+        # untrusted mode always verifies
+        assert exchanging.serializeMessage(recHby, serder.said, stamped=False) == msg
+        assert len(verifieds) == 1
+
+        # stamp only trusted while stamped est event is still last at its sn
+        superseded = (serder.said, hab.pre, f"{0:032x}", "E" + "A" * 43)
+        for siger in recHby.db.esigs.get(keys=keys):
+            recHby.db.esigs.add(keys=superseded, val=siger)
+        recHby.db.exvs.pin(keys=superseded, val=Dater())
+        with pytest.raises(ValidationError):
+            exchanging.cloneMessage(recHby, serder.said)
+        recHby.db.esigs.rem(keys=superseded)
+        recHby.db.exvs.rem(keys=superseded)
+
+        # missing stamp falls back to verification
+        recHby.db.exvs.rem(keys=keys)
+        exn, _ = exchanging.cloneMessage(recHby, serder.said)
+        assert exn.said == serder.said
+        assert recHby.db.exvs.get(keys=keys) is None
+
+
 
 def test_hab_exchange(mockHelpingNowUTC):
     with openHby(salt=Salter(raw=b'0123456789abcdef').qb64) as hby: